@@ -0,0 +1,60 @@
+import os, json, time
+from cassette import BodyStore
+
+# ------------------- Page Archive ------------------- #
+class PageArchive:
+    """Every page the IG/TikTok checkers classified, kept so it can be classified again later.
+
+    index.jsonl has one line per check (platform, name, status, final URL,
+    verdict, reason, body hash), the bodies live in a BodyStore under bodies/
+    so the thousands of identical not-found pages cost one file.
+    reclassify.py runs the current classifier over it without the network.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.store = BodyStore(os.path.join(root, "bodies"))
+        self.index_path = os.path.join(root, "index.jsonl")
+        self.file = None
+
+    def open(self):
+        os.makedirs(self.root, exist_ok=True)
+        self.file = open(self.index_path, "a", encoding="utf-8")
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def add(self, platform, name, status, final_url, body, verdict, reason):
+        entry = {
+            "platform": platform,
+            "name": name,
+            "status": status,
+            "url": final_url,
+            "verdict": verdict.name,
+            "reason": reason.name,
+            "body": self.store.put(body.encode("utf-8")),
+            "ts": round(time.time(), 3),
+        }
+        self.file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.file.flush()
+
+    def entries(self, platform=None):
+        """Latest archived check per (platform, name), oldest first"""
+        latest = {}
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line from an interrupted run
+                if platform and entry["platform"] != platform:
+                    continue
+                key = (entry["platform"], entry["name"])
+                latest.pop(key, None)  # Re-insert so dict order follows the newest check
+                latest[key] = entry
+        return list(latest.values())
+
+    def body(self, digest):
+        return self.store.get(digest).decode("utf-8")
@@ -0,0 +1,103 @@
+"""Times the IG/TikTok page classifiers alone (no network) over the fixture corpus.
+
+    python bench/classifier_bench.py
+    python bench/classifier_bench.py tiktok --json -o classify.json
+
+Reports µs per page, memory allocated per page and whether the verdict is right,
+so parsing speedups can be checked for speed and correctness at once.
+"""
+import os, sys, json, time, argparse, statistics, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from corpus import CASES
+
+def load_classifier(platform):
+    if platform == "instagram":
+        from ig_checker import classify_page
+    else:
+        from tiktok_checker import classify_page
+    return classify_page
+
+def time_page(classify, args, min_time):
+    """Median µs per call over batches that each run at least min_time/5 seconds"""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            classify(*args)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time / 5:
+            break
+        loops *= 2
+    runs = [elapsed / loops]
+    for _ in range(4):
+        started = time.perf_counter()
+        for _ in range(loops):
+            classify(*args)
+        runs.append((time.perf_counter() - started) / loops)
+    return statistics.median(runs) * 1e6
+
+def allocations(classify, args):
+    """(peak KB, blocks still allocated) for one call"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    classify(*args)
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return round(peak / 1024, 1), blocks
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the page classifiers over the fixture corpus")
+    parser.add_argument("platforms", nargs="*", help=f"any of {', '.join(CASES)} (default: all)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds spent timing each page")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    parser.add_argument("-o", "--output", help="also write the JSON here")
+    args = parser.parse_args()
+    unknown = set(args.platforms) - set(CASES)
+    if unknown:
+        parser.error(f"unknown platform: {', '.join(sorted(unknown))}")
+
+    report = {"python": sys.version.split()[0], "results": {}}
+    for platform in args.platforms or list(CASES):
+        classify = load_classifier(platform)
+        rows = []
+        for case, username, status, final_url, body, expected in CASES[platform]():
+            call = (username, status, final_url, body)
+            verdict, reason, _ = classify(*call)
+            peak_kb, blocks = allocations(classify, call)
+            rows.append({
+                "case": case,
+                "kb": round(len(body) / 1024),
+                "us_per_page": round(time_page(classify, call, args.min_time), 1),
+                "peak_alloc_kb": peak_kb,
+                "blocks_kept": blocks,
+                "expected": expected.name,
+                "verdict": verdict.name,
+                "reason": reason.name,
+                "ok": verdict == expected,
+            })
+        report["results"][platform] = {
+            "pages": rows,
+            "accuracy": round(sum(row["ok"] for row in rows) / len(rows), 3),
+            "mean_us_per_page": round(statistics.mean(row["us_per_page"] for row in rows), 1),
+        }
+
+    text = json.dumps(report, indent=2)
+    if args.json:
+        print(text)
+    else:
+        for platform, result in report["results"].items():
+            print(f"\n{platform}  (accuracy {result['accuracy']:.0%}, mean {result['mean_us_per_page']:.0f} µs/page)")
+            print(f"  {'case':<15}{'KB':>5}{'µs/page':>10}{'peak KB':>9}  verdict")
+            for row in result["pages"]:
+                mark = "✅" if row["ok"] else f"❌ expected {row['expected']}"
+                print(f"  {row['case']:<15}{row['kb']:>5}{row['us_per_page']:>10.0f}{row['peak_alloc_kb']:>9.0f}  "
+                      f"{row['verdict']} ({row['reason']}) {mark}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+if __name__ == "__main__":
+    main()
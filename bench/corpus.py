@@ -0,0 +1,71 @@
+"""Fixture pages for the classifier benchmark, one per kind of page each platform sends back.
+
+Built from the markup the real pages use (trimmed), padded to real page sizes.
+Each case is (case, username, status, final_url, body, expected verdict).
+"""
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from records import Verdict
+from fake_server import pad
+
+IG_KB = 350  # Profile pages are ~300-400 KB of bundled JSON
+TIKTOK_KB = 280
+
+def instagram_cases(name="sunte"):
+    url = f"https://www.instagram.com/{name}/"
+    shell = '<script>{"config":{"csrf_token":"x7Hk2","viewer":null},"country_code":"US","rollout_hash":"1009734"}</script>'
+    profile = (f'<title>{name.title()} (@{name}) • Instagram photos and videos</title>'
+               f'<meta property="og:title" content="{name.title()} (@{name}) • Instagram photos and videos">'
+               f'<script type="application/json">{{"require":[["ProfilePage",{{"user":{{"username":"{name}",'
+               f'"full_name":"{name.title()}","id":"48213377"}},"edge_followed_by":{{"count":1289}},'
+               f'"edge_follow":{{"count":311}},"edge_owner_to_timeline_media":{{"count":57}},'
+               f'"profile_pic_url":"https://scontent-lhr8-1.cdninstagram.com/v/t51.2885-19/48213377_n.jpg",'
+               f'"biography":"photos n stuff"')
+    return [
+        ("taken public", name, 200, url, pad(profile + '}]]}</script>' + shell, IG_KB), Verdict.TAKEN),
+        ("taken private", name, 200, url,
+         pad(profile.replace('"biography":"photos n stuff"', '"biography":"","is_private":true')
+             + '}]]}</script><h2>This account is private</h2>' + shell, IG_KB), Verdict.TAKEN),
+        ("deleted", name, 200, url,
+         pad('<title>Page not found • Instagram</title><h2>Sorry, this page isn\'t available.</h2>'
+             '<script>{"HttpError":{"statusCode":404}}</script>' + shell, IG_KB // 3), Verdict.AVAILABLE),
+        ("not found", name, 404, url, pad("<title>Instagram</title>" + shell, IG_KB // 3), Verdict.AVAILABLE),
+        ("login wall", name, 200, f"https://www.instagram.com/accounts/login/?next=%2F{name}%2F",
+         pad('<title>Login • Instagram</title><form id="loginForm"></form>' + shell, IG_KB // 2), Verdict.SESSION_EXPIRED),
+        ("placeholder", name, 200, url,
+         pad('<title>Instagram</title><script>{"viewer":{"user":{"username":"someone_else","id":"5551234567"}},'
+             '"biography":""}</script>' + shell, IG_KB // 2), Verdict.AVAILABLE),
+    ]
+
+def tiktok_cases(name="brelo"):
+    url = f"https://www.tiktok.com/@{name}"
+    shell = ('<script id="__UNIVERSAL_DATA_FOR_REHYDRATION__">{"__DEFAULT_SCOPE__":{"webapp.app-context":'
+             '{"appId":1988,"region":"US","language":"en"}}}</script>')
+    user = (f'<title>{name.title()} (@{name}) | TikTok</title>'
+            f'<meta property="og:url" content="https://www.tiktok.com/@{name}">'
+            f'<script>{{"webapp.user-detail":{{"userInfo":{{"user":{{"id":"6912345678901234567","uniqueId":"{name}",'
+            f'"nickname":"{name.title()}","avatarLarger":"https://p16-sign-va.tiktokcdn.com/avt-0068/6912.jpeg",'
+            f'"signature":"just vibes","verified":false,"privateAccount":false}},'
+            f'"stats":{{"followerCount":4821,"followingCount":132,"videoCount":87}}}}}}}}</script>')
+    return [
+        ("taken public", name, 200, url, pad(user + shell, TIKTOK_KB), Verdict.TAKEN),
+        ("taken private", name, 200, url,
+         pad(user.replace('"privateAccount":false', '"privateAccount":true').replace('"signature":"just vibes"', '"signature":""')
+             + "<p>This account is private</p>" + shell, TIKTOK_KB), Verdict.TAKEN),
+        ("deleted", name, 200, url,
+         pad("<title>TikTok - Make Your Day</title><p>Couldn't find this account</p>"
+             '<script>{"webapp.user-detail":{"statusCode":10221,"userInfo":{}}}</script>' + shell, TIKTOK_KB // 2),
+         Verdict.AVAILABLE),
+        ("not found", name, 200, "https://www.tiktok.com/foryou",
+         pad("<title>TikTok - Make Your Day</title>" + shell, TIKTOK_KB // 2), Verdict.AVAILABLE),
+        ("login wall", name, 200, f"https://www.tiktok.com/login?redirect_url=https%3A%2F%2Fwww.tiktok.com%2F%40{name}",
+         pad("<title>Log in | TikTok</title><h2>Log in to TikTok</h2>" + shell, TIKTOK_KB // 2), Verdict.UNCLEAR),
+        ("placeholder", name, 200, url,
+         pad("<title>TikTok - Make Your Day</title>"
+             '<script>{"webapp.user-detail":{"userInfo":{"user":{},"stats":{}}},'
+             '"itemList":[{"id":"7301234567890123456","desc":"suggested"}]}</script>' + shell, TIKTOK_KB // 2),
+         Verdict.AVAILABLE),
+    ]
+
+CASES = {"instagram": instagram_cases, "tiktok": tiktok_cases}
@@ -0,0 +1,175 @@
+"""Local stand-in for the four platforms, so the checkers can be benchmarked offline.
+
+Whether a name is taken is decided by a hash of the name, so every run with
+the same names gets the same answers.
+"""
+import asyncio, random, socket, threading, zlib
+from aiohttp import web
+
+DEFAULTS = {
+    "latency": 0.02,  # Seconds added to every response
+    "jitter": 0.01,  # Plus up to this much random extra
+    "error_rate": 0.0,  # Fraction of requests answered with a 500
+    "rate_limit": 0,  # Requests/sec per platform before 429s (0 = unlimited)
+    "retry_after": 1,  # Retry-After seconds sent with a 429
+    "taken_pct": 70,  # Percent of names that exist
+    "ig_kb": 60,  # Body size of an IG profile page
+    "tiktok_kb": 250,  # Body size of a TikTok profile page (they're big)
+    "tiktok_redirect_pct": 50,  # Percent of missing TikTok names that redirect instead of showing the error page
+}
+
+# Filler that looks like a rendered page, so the classifiers scan realistic markup
+FILLER = ('<div class="x1lliihq x1n2onr6" data-e2e="item"><span dir="auto">'
+          '{"__typename":"Node","edges":[],"count":0,"is_viewer":false}</span></div>\n')
+
+def pad(html, kb):
+    """Page of roughly `kb` KB with `html` in the middle"""
+    filler = FILLER * max(1, kb * 1024 // len(FILLER) // 2)
+    return f"<!DOCTYPE html><html><head>{filler}</head><body>{html}{filler}</body></html>"
+
+def is_taken(name, config):
+    return zlib.crc32(name.lower().encode()) % 100 < config["taken_pct"]
+
+# ------------------- Fake Server ------------------- #
+class FakeServer:
+    """aiohttp app emulating each platform's probe, with latency, errors and rate limits"""
+
+    def __init__(self, **config):
+        self.config = dict(DEFAULTS, **config)
+        self.random = random.Random(1)
+        self.windows = {}  # platform -> [second, requests so far in it]
+        self.requests = 0
+        self.pages = {}  # Rendered not-found pages, they never change
+
+    async def gate(self, platform):
+        """Latency plus the error/rate-limit dice, returns a status to fail with or 0"""
+        self.requests += 1
+        config = self.config
+        await asyncio.sleep(config["latency"] + self.random.uniform(0, config["jitter"]))
+        if config["rate_limit"]:
+            second = int(asyncio.get_running_loop().time())
+            window = self.windows.setdefault(platform, [second, 0])
+            if window[0] != second:
+                window[:] = [second, 0]
+            window[1] += 1
+            if window[1] > config["rate_limit"]:
+                return 429
+        if config["error_rate"] and self.random.random() < config["error_rate"]:
+            return 500
+        return 0
+
+    def too_many(self, body=None):
+        headers = {"Retry-After": str(self.config["retry_after"])}
+        if body is not None:
+            return web.json_response(body, status=429, headers=headers)
+        return web.Response(status=429, text="Please wait a few minutes before you try again.", headers=headers)
+
+    async def instagram(self, request):
+        name = request.match_info["name"]
+        fail = await self.gate("instagram")
+        if fail:
+            return self.too_many() if fail == 429 else web.Response(status=fail)
+        if not is_taken(name, self.config):
+            if "ig404" not in self.pages:
+                self.pages["ig404"] = pad("<h2>Sorry, this page isn't available.</h2>"
+                                          '<script>{"HttpError":{"statusCode":404}}</script>', self.config["ig_kb"] // 2)
+            return web.Response(status=404, text=self.pages["ig404"], content_type="text/html")
+        uid = 10000000 + zlib.crc32(name.encode()) % 90000000
+        html = (f"<title>{name} (@{name}) • Instagram photos and videos</title>"
+                f'<script>{{"user":{{"username":"{name}","full_name":"{name.title()}","id":"{uid}"}},'
+                f'"edge_followed_by":{{"count":{uid % 5000}}},"edge_follow":{{"count":{uid % 700}}},'
+                f'"edge_owner_to_timeline_media":{{"count":{uid % 90}}},'
+                f'"profile_pic_url":"https://scontent.cdninstagram.com/v/{uid}.jpg","biography":"hi"}}</script>')
+        return web.Response(text=pad(html, self.config["ig_kb"]), content_type="text/html")
+
+    async def tiktok(self, request):
+        name = request.match_info["name"]
+        fail = await self.gate("tiktok")
+        if fail:
+            return self.too_many() if fail == 429 else web.Response(status=fail)
+        if not is_taken(name, self.config):
+            if zlib.crc32(name[::-1].encode()) % 100 < self.config["tiktok_redirect_pct"]:
+                raise web.HTTPFound("/tiktok/foryou")
+            if "tt404" not in self.pages:
+                self.pages["tt404"] = pad("<p>Couldn't find this account</p>"
+                                          '<script>{"statusCode":10202,"userInfo":{}}</script>', self.config["tiktok_kb"] // 2)
+            return web.Response(text=self.pages["tt404"], content_type="text/html")
+        uid = 7000000000000000000 + zlib.crc32(name.encode())
+        html = (f"<title>{name.title()} (@{name}) | TikTok</title>"
+                f'<meta property="og:url" content="https://www.tiktok.com/@{name}">'
+                f'<script>{{"userInfo":{{"user":{{"id":"{uid}","uniqueId":"{name}","nickname":"{name}",'
+                f'"avatarLarger":"https://p16-sign.tiktokcdn.com/{uid}.jpeg","signature":"hello",'
+                f'"verified":false,"privateAccount":false}},"stats":{{"followerCount":{uid % 9000},'
+                f'"followingCount":{uid % 400},"videoCount":{uid % 60}}}}}}}</script>')
+        return web.Response(text=pad(html, self.config["tiktok_kb"]), content_type="text/html")
+
+    async def tiktok_foryou(self, request):
+        if "foryou" not in self.pages:
+            self.pages["foryou"] = pad("<title>TikTok - Make Your Day</title>", 30)
+        return web.Response(text=self.pages["foryou"], content_type="text/html")
+
+    async def discord(self, request):
+        data = await request.json()
+        fail = await self.gate("discord")
+        if fail == 429:
+            return self.too_many({"message": "You are being rate limited.", "retry_after": float(self.config["retry_after"]), "global": False})
+        if fail:
+            return web.Response(status=fail)
+        return web.json_response({"taken": is_taken(data["username"], self.config)})
+
+    async def roblox(self, request):
+        data = await request.json()
+        fail = await self.gate("roblox")
+        if fail == 429:
+            return self.too_many({"errors": [{"code": 0, "message": "Too many requests"}]})
+        if fail:
+            return web.Response(status=fail)
+        found = [{"requestedUsername": name, "hasVerifiedBadge": False, "id": 1000 + zlib.crc32(name.encode()) % 10**9,
+                  "name": name, "displayName": name.title()}
+                 for name in data.get("usernames", []) if is_taken(name, self.config)]
+        return web.json_response({"data": found})
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_get("/instagram/{name}/", self.instagram)
+        app.router.add_get("/tiktok/foryou", self.tiktok_foryou)
+        app.router.add_get("/tiktok/@{name}", self.tiktok)
+        app.router.add_post("/discord/username-attempt-unauthed", self.discord)
+        app.router.add_post("/roblox/usernames/users", self.roblox)
+        return app
+
+    def start(self, port=0):
+        """Serve from a background thread, returns the base URL"""
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", port))  # Port 0 picks a free one
+        ready = threading.Event()
+
+        def serve():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            runner = web.AppRunner(self.make_app(), access_log=None)
+            loop.run_until_complete(runner.setup())
+            loop.run_until_complete(web.SockSite(runner, sock).start())
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=serve, daemon=True).start()
+        ready.wait(10)
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+# Where each Checker is pointed at, relative to the base URL
+URLS = {
+    "instagram": ("BASE_URL", "/instagram/{}/"),
+    "tiktok": ("BASE_URL", "/tiktok/@{}"),
+    "discord": ("POMELO_CHECK_URL", "/discord/username-attempt-unauthed"),
+    "roblox": ("USERS_URL", "/roblox/usernames/users"),
+}
+
+if __name__ == "__main__":
+    import sys
+    base = FakeServer().start(int(sys.argv[1]) if len(sys.argv) > 1 else 8800)
+    print(f"Fake platforms on {base} (Ctrl+C to quit)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
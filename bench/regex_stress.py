@@ -0,0 +1,95 @@
+"""Feeds oversized and hostile pages to the IG/TikTok classifiers and fails if any is too slow or too hungry.
+
+    python bench/regex_stress.py            # exit code 1 if a ceiling is broken
+    python bench/regex_stress.py --mb 8
+
+Every page runs in its own process, so one that would pin a core for minutes
+is killed at the time limit and reported instead of hanging the run.
+"""
+import os, sys, time, argparse, tracemalloc, multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fake_server import pad
+
+MS_PER_MB = 400  # Time ceiling per MB of body (worst case today is ~250)
+MEMORY_RATIO = 12  # Peak allocation ceiling as a multiple of the body size
+NAMES = ("sunte", "a.b_c", "x[y)*z+")  # Plain, IG dots (regex wildcards), and broken regex syntax
+
+def repeat(chunk, size):
+    return chunk * (size // len(chunk) + 1)
+
+def hostile_pages(size):
+    """(label, final_url, body) pages built to make the unbounded patterns backtrack"""
+    user = '"username":"sunte",'
+    return [
+        ("real page, padded", "", pad('<title>Sunte (@sunte)</title>"user":{"username":"sunte","id":"48213377"}', size // 1024)),
+        ('"user":{ never closed', "", repeat('"user":{"x":1,', size)),
+        ('"ProfilePage" + "user":{ never closed', "", '"ProfilePage"' + repeat('"user":{"a":"b",', size)),
+        ("username, no id, no }", "", repeat(user, size)),
+        ('"edge_followed_by":{ never closed', "", repeat('"edge_followed_by":{"a":1,', size)),
+        ("profile_pic_url without a closing quote", "", '"profile_pic_url":"https://' + repeat("scontentx", size)),
+        ("avatar URLs without closing quotes", "", repeat('"avatarLarger":"https://p16.tiktokcdn.com/', size)),
+        ("<strong> tag never closed", "", repeat('<strong class="a" data-e2e="followers-count" ', size)),
+        ("<meta> og:url never closed", "", repeat('<meta property="og:url" content="https://www.tiktok.com/@', size)),
+        ('"uniqueId" + name, no id', "", repeat('"uniqueId":"sunte",', size)),
+        ("whitespace runs", "", repeat('"id"' + " " * 4000, size)),
+        ("<title> never closed", "", repeat("<title>", size)),
+    ]
+
+def run_case(platform, name, final_url, body, queue):
+    if platform == "instagram":
+        from ig_checker import classify_page
+    else:
+        from tiktok_checker import classify_page
+    final_url = final_url or f"https://example.com/@{name}"
+    classify_page(name, 200, final_url, body[:1000])  # Warm the regex cache
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        verdict = classify_page(name, 200, final_url, body)[0].name
+    except Exception as e:
+        verdict = f"crashed: {type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    queue.put((elapsed, peak, verdict))
+
+def main():
+    parser = argparse.ArgumentParser(description="Worst-case page timings for the classifiers")
+    parser.add_argument("--mb", type=float, default=4, help="size of each hostile page")
+    args = parser.parse_args()
+    size = int(args.mb * 1024 * 1024)
+    limit = MS_PER_MB * args.mb / 1000
+    failures = 0
+
+    for platform in ("instagram", "tiktok"):
+        print(f"\n{platform}  (ceiling {limit * 1000:.0f} ms and {MEMORY_RATIO}x body per page)")
+        for label, final_url, body in hostile_pages(size):
+            for name in NAMES:
+                queue = multiprocessing.Queue()
+                worker = multiprocessing.Process(target=run_case, args=(platform, name, final_url, body, queue))
+                worker.start()
+                worker.join(max(limit * 4, 5))
+                if worker.is_alive():
+                    worker.terminate()
+                    worker.join()
+                    failures += 1
+                    print(f"  ❌ {label} [{name}]: still running after {max(limit * 4, 5):.0f}s, killed")
+                    continue
+                elapsed, peak, verdict = queue.get()
+                problems = []
+                if elapsed > limit:
+                    problems.append("too slow")
+                if peak > MEMORY_RATIO * len(body):
+                    problems.append("too much memory")
+                if verdict.startswith("crashed"):
+                    problems.append(verdict)
+                failures += bool(problems)
+                mark = "❌ " + ", ".join(problems) if problems else "✅"
+                print(f"  {mark} {label} [{name}]: {elapsed * 1000:.0f} ms, peak {peak / 1024 / 1024:.1f} MB, {verdict}")
+
+    print(f"\n{failures} failures")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Offline benchmark: runs each Checker against bench/fake_server.py and prints JSON.
+
+    python bench/run_bench.py                       # all platforms, 300 names each
+    python bench/run_bench.py tiktok -n 1000 --latency 0.05 -o before.json
+
+Compare two JSON files to prove a change made things faster (or didn't).
+"""
+import os, sys, json, time, random, string, platform, argparse, statistics
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fake_server import FakeServer, DEFAULTS, URLS
+
+try:
+    import resource  # Not on Windows, peak RSS is left out there
+except ImportError:
+    resource = None
+
+UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+def make_names(count, seed=7):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10))) for _ in range(count)]
+
+def make_checker(name, names):
+    if name == "instagram":
+        from ig_checker import Checker
+        return Checker(names, "bench-session", UA)
+    if name == "tiktok":
+        from tiktok_checker import Checker
+        return Checker(names, UA)
+    if name == "discord":
+        from discord_checker import Checker
+        return Checker(names, None, UA, "pomelo")
+    from roblox_checker_gui import Checker
+    return Checker(names)
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)  # bytes on macOS, KB elsewhere
+
+def bench(name, base, names, delay):
+    """Run one checker to the end on this thread, returns its numbers"""
+    checker = make_checker(name, names)
+    attr, path = URLS[name]
+    setattr(checker, attr, base + path)
+    checker.delay = delay
+    latencies = []
+    verdicts = Counter()
+
+    def on_batch(rows, lines, progress):
+        for result in rows:
+            latencies.append(result.latency)
+            verdicts[result.verdict.name] += 1
+
+    checker.batch.connect(on_batch)
+    # The fake server runs on its own thread, thread_time() only counts the checker
+    cpu = time.thread_time()
+    started = time.perf_counter()
+    checker.run()
+    elapsed = time.perf_counter() - started
+    cpu = time.thread_time() - cpu
+
+    checks = len(latencies)
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive") if checks > 1 else (latencies or [0.0]) * 99
+    return {
+        "checks": checks,
+        "seconds": round(elapsed, 3),
+        "checks_per_sec": round(checks / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {"p50": round(cuts[49] * 1000, 2), "p95": round(cuts[94] * 1000, 2), "p99": round(cuts[98] * 1000, 2)},
+        "cpu_ms_per_check": round(cpu * 1000 / checks, 3) if checks else 0.0,
+        "requests": checker.counters["requests"],
+        "bytes": checker.counters["bytes"],
+        "classify_cache_hits": checker.counters["classify_cache_hits"],
+        "classify_cache_misses": checker.counters["classify_cache_misses"],
+        "verdicts": dict(verdicts),
+        "peak_rss_mb": peak_rss_mb(),  # Whole process so far, fake server included
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the checkers against a local fake server")
+    parser.add_argument("platforms", nargs="*", help=f"any of {', '.join(URLS)} (default: all)")
+    parser.add_argument("-n", "--names", type=int, default=300, help="names per platform")
+    parser.add_argument("--delay", type=float, default=0, help="checker delay between names (the apps use 0-3s)")
+    for key, value in DEFAULTS.items():
+        parser.add_argument("--" + key.replace("_", "-"), type=type(value), default=value)
+    parser.add_argument("-o", "--output", help="also write the JSON here")
+    args = parser.parse_args()
+    unknown = set(args.platforms) - set(URLS)
+    if unknown:
+        parser.error(f"unknown platform: {', '.join(sorted(unknown))}")
+
+    config = {key: getattr(args, key) for key in DEFAULTS}
+    server = FakeServer(**config)
+    base = server.start()
+    names = make_names(args.names)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "names": args.names,
+        "delay": args.delay,
+        "server": config,
+        "results": {},
+    }
+    for name in args.platforms or list(URLS):
+        print(f"⏱️ {name}...", file=sys.stderr)
+        report["results"][name] = bench(name, base, names, args.delay)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+import os, json, time, zlib, asyncio, hashlib
+import aiohttp
+from collections import Counter
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+from metrics import current_trace
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# ------------------- Body Store ------------------- #
+class BodyStore:
+    """Response bodies on disk, named by their sha256 so identical pages are stored once.
+
+    zstd-compressed if zstandard is installed (pip install zstandard), zlib otherwise.
+    Either kind is read back whatever is installed now, as long as it can be decoded.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        if ZSTD_AVAILABLE:
+            self.extension = ".zst"
+            self.compress = zstandard.ZstdCompressor(level=6).compress
+        else:
+            self.extension = ".z"
+            self.compress = lambda data: zlib.compress(data, 6)
+
+    def _path(self, digest, extension):
+        return os.path.join(self.root, digest[:2], digest + extension)
+
+    def put(self, data):
+        """Store `data` (bytes) unless it's already there, returns its sha256"""
+        digest = hashlib.sha256(data).hexdigest()
+        if not self.has(digest):
+            path = self._path(digest, self.extension)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp = path + ".tmp"
+            with open(temp, "wb") as f:
+                f.write(self.compress(data))
+            os.replace(temp, path)  # A crash never leaves half a body behind
+        return digest
+
+    def has(self, digest):
+        return any(os.path.exists(self._path(digest, ext)) for ext in (".zst", ".z"))
+
+    def get(self, digest):
+        path = self._path(digest, ".zst")
+        if os.path.exists(path):
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError(f"{path} is zstd-compressed, pip install zstandard to read it")
+            with open(path, "rb") as f:
+                return zstandard.ZstdDecompressor().decompress(f.read())
+        with open(self._path(digest, ".z"), "rb") as f:
+            return zlib.decompress(f.read())
+
+# ------------------- Cassettes ------------------- #
+def request_key(method, url, payload=None):
+    """What identifies a request on replay: method, URL and the JSON body if any"""
+    key = f"{method.upper()} {url}"
+    if payload is not None:
+        key += " " + json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return key
+
+class Cassette:
+    """A directory of recorded request/response pairs.
+
+    interactions.jsonl has one line per response (status, final URL, headers,
+    timing, body hash), the bodies live in a BodyStore under bodies/.
+    Record with a real run, then replay it through the same Checker code:
+    speed=1 keeps the original timing, speed=0 runs as fast as the CPU allows.
+    """
+
+    def __init__(self, path, mode="replay", speed=1.0):
+        self.path = path
+        self.mode = mode  # "record" or "replay"
+        self.speed = speed
+        self.store = BodyStore(os.path.join(path, "bodies"))
+        self.index_path = os.path.join(path, "interactions.jsonl")
+        self.file = None
+        self.recorded = {}  # request key -> [interactions], replayed in order
+        self.replayed = 0
+        self.missing = 0
+
+    def open(self):
+        if self.mode == "record":
+            os.makedirs(self.path, exist_ok=True)
+            self.file = open(self.index_path, "a", encoding="utf-8")
+            return
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line from an interrupted recording
+                self.recorded.setdefault(entry["key"], []).append(entry)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def scale(self, seconds):
+        """How long to really wait for `seconds` of recorded/paced time"""
+        if self.mode == "record":
+            return seconds
+        return seconds / self.speed if self.speed else 0
+
+    def wrap(self, session, counters=None):
+        """Session to hand to check_user(): records through `session`, or replays without it.
+
+        Replayed requests/bytes are added to `counters` like the TraceConfig hooks would.
+        """
+        return RecordingSession(self, session) if self.mode == "record" else ReplaySession(self, counters)
+
+    def save(self, key, response, body, elapsed):
+        entry = {
+            "key": key,
+            "status": response.status,
+            "url": str(response.url),
+            "headers": list(response.headers.items()),
+            "elapsed": round(elapsed, 4),
+            "body": self.store.put(body),
+            "ts": round(time.time(), 3),
+        }
+        self.file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.file.flush()
+
+    def lookup(self, key):
+        """Next recorded response for `key` (the last one repeats), or None"""
+        entries = self.recorded.get(key)
+        if not entries:
+            return None
+        return entries.pop(0) if len(entries) > 1 else entries[0]
+
+class RecordingSession:
+    """Stands in for the ClientSession: every response is read in full and saved"""
+
+    def __init__(self, cassette, session):
+        self.cassette = cassette
+        self.session = session
+
+    def get(self, url, **kwargs):
+        return _Recording(self, "GET", url, kwargs)
+
+    def post(self, url, **kwargs):
+        return _Recording(self, "POST", url, kwargs)
+
+    def patch(self, url, **kwargs):
+        return _Recording(self, "PATCH", url, kwargs)
+
+class _Recording:
+    def __init__(self, owner, method, url, kwargs):
+        self.owner = owner
+        self.key = request_key(method, url, kwargs.get("json"))
+        self.context = owner.session.request(method, url, **kwargs)
+
+    async def __aenter__(self):
+        started = time.perf_counter()
+        response = await self.context.__aenter__()
+        body = await response.read()  # aiohttp keeps it, text()/json() still work after
+        self.owner.cassette.save(self.key, response, body, time.perf_counter() - started)
+        return response
+
+    async def __aexit__(self, *exc):
+        return await self.context.__aexit__(*exc)
+
+class ReplaySession:
+    """Answers from the cassette, no network. Unknown requests fail like a dead connection."""
+
+    def __init__(self, cassette, counters=None):
+        self.cassette = cassette
+        self.counters = Counter() if counters is None else counters
+
+    def get(self, url, **kwargs):
+        return _Replay(self, request_key("GET", url, kwargs.get("json")))
+
+    def post(self, url, **kwargs):
+        return _Replay(self, request_key("POST", url, kwargs.get("json")))
+
+    def patch(self, url, **kwargs):
+        return _Replay(self, request_key("PATCH", url, kwargs.get("json")))
+
+class _Replay:
+    def __init__(self, owner, key):
+        self.owner = owner
+        self.key = key
+
+    async def __aenter__(self):
+        cassette, counters = self.owner.cassette, self.owner.counters
+        counters["requests"] += 1
+        entry = cassette.lookup(self.key)
+        if entry is None:
+            cassette.missing += 1
+            counters["request_errors"] += 1
+            raise aiohttp.ClientConnectionError(f"Not in cassette: {self.key}")
+        wait = cassette.scale(entry["elapsed"])
+        if wait:
+            await asyncio.sleep(wait)
+        body = cassette.store.get(entry["body"])
+        counters["bytes"] += len(body)
+        trace = current_trace.get()
+        if trace:  # The wait stands in for the network, the rest of the check is ours
+            trace.ttfb += wait
+            trace.last = time.perf_counter()
+        cassette.replayed += 1
+        return ReplayResponse(entry, body)
+
+    async def __aexit__(self, *exc):
+        return False
+
+class ReplayResponse:
+    """The parts of aiohttp.ClientResponse the checkers use"""
+
+    def __init__(self, entry, body):
+        self.status = entry["status"]
+        self.url = URL(entry["url"])
+        self.headers = CIMultiDictProxy(CIMultiDict(entry["headers"]))
+        self.body = body
+
+    @property
+    def charset(self):
+        content_type = self.headers.get("Content-Type", "")
+        if "charset=" in content_type:
+            return content_type.split("charset=")[-1].split(";")[0].strip()
+        return "utf-8"
+
+    async def read(self):
+        return self.body
+
+    async def text(self, encoding=None, errors="strict"):
+        return self.body.decode(encoding or self.charset, errors)
+
+    async def json(self, **kwargs):
+        return json.loads(self.body.decode(self.charset))
@@ -0,0 +1,805 @@
+import asyncio, atexit, heapq, itertools, random, threading, time
+from collections import Counter, deque
+from contextlib import nullcontext
+from concurrent.futures import Future
+from PyQt5.QtCore import QThread, pyqtSignal
+from records import Result, Verdict, Reason, FINAL
+from metrics import RunStats, StageStats, CheckTrace, current_trace, current_counters, make_trace_config, start_metrics_server
+
+# ------------------- Candidate Queue ------------------- #
+class CandidateQueue:
+    """Names waiting to be checked, best first.
+
+    With a `score` function names are popped highest score first, otherwise
+    in the order they arrived (variant search is already closest-first).
+    Lists are only stored when handed over and scored on the first pop(),
+    which runs on the checker's thread, so a big list never holds up the
+    GUI. Lazy iterators are pulled `lookahead` names at a time so an endless
+    generator is never drained. push()/extend() are safe to call from the
+    GUI thread while a run is going.
+    """
+
+    def __init__(self, source=(), score=None, lookahead=256):
+        self.score = score
+        self.lookahead = lookahead
+        self.heap = []
+        self.pending = []  # Names handed over but not scored yet
+        self.seq = itertools.count()  # Tie-break keeps arrival order
+        self.lock = threading.Lock()
+        if isinstance(source, (list, tuple)):
+            self.source = None
+            self.extend(source)
+        else:
+            self.source = iter(source)
+
+    def _entry(self, name, priority):
+        if priority is None:
+            priority = self.score(name) if self.score else 0
+        return (-priority, next(self.seq), name)
+
+    def push(self, name, priority=None):
+        with self.lock:
+            heapq.heappush(self.heap, self._entry(name, priority))
+
+    def extend(self, names):
+        with self.lock:
+            self.pending.extend(names)
+
+    def pop(self):
+        """Next name to check, or None once everything is used up"""
+        if self.pending:
+            with self.lock:
+                names, self.pending = self.pending, []
+            entries = [self._entry(name, None) for name in names]  # Outside the lock, extend() doesn't wait on it
+            with self.lock:
+                self.heap.extend(entries)
+                heapq.heapify(self.heap)
+        with self.lock:
+            while self.source is not None and len(self.heap) < self.lookahead:
+                name = next(self.source, None)
+                if name is None:
+                    self.source = None
+                    break
+                heapq.heappush(self.heap, self._entry(name, None))
+            if not self.heap:
+                return None
+            return heapq.heappop(self.heap)[2]
+
+    def __len__(self):
+        return len(self.heap) + len(self.pending)
+
+    def remaining(self):
+        """Names left to check, or None while a lazy source may still have more"""
+        return None if self.source is not None else len(self)
+
+# ------------------- Single Flight ------------------- #
+def _handle(name):
+    return name.strip().lstrip("@").lower()
+
+# How each platform tells two spellings apart: all four ignore case,
+# the @ people paste in front of handles is never part of the name
+CANONICAL = {"instagram": _handle, "tiktok": _handle, "discord": _handle, "roblox": _handle}
+
+def canonical_name(platform, name):
+    return CANONICAL.get(platform, str.strip)(name)
+
+class SingleFlight:
+    """Checks in progress per (platform, canonical name), shared by every checker in the process.
+
+    The first checker to ask for a key does the request, anyone asking while it's
+    in flight gets a Future for the same Result instead. Thread-safe, each
+    checker runs its own loop, so waiters use asyncio.wrap_future().
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+
+    def join(self, key):
+        """(future, leader), leader=True means the caller has to do the check and land() it"""
+        with self.lock:
+            flight = self.flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self.flights[key] = Future()
+            return flight, True
+
+    def land(self, key, result):
+        """Hand `result` to every waiter (None if the check never reported, they then check it themselves)"""
+        with self.lock:
+            flight = self.flights.pop(key, None)
+        if flight is not None and not flight.done():
+            flight.set_result(result)
+
+    def __len__(self):
+        return len(self.flights)
+
+flights = SingleFlight()
+
+# ------------------- Circuit Breaker ------------------- #
+# Only the site's side failing counts (5xx come in as CONNECTION_ERROR), not an ERROR about one name's input
+FAILURES = (Verdict.BLOCKED, Verdict.TIMEOUT, Verdict.CONNECTION_ERROR, Verdict.PROXY_ERROR)
+FATAL = (Verdict.SESSION_EXPIRED, Verdict.AUTH_ERROR)  # Every later check would fail the same way
+
+class CircuitBreaker:
+    """Pauses every checker of one platform when the platform keeps failing.
+
+    closed: checks go through, `threshold` failures in a row from any checker
+    (blocked, timeouts, connection/proxy errors) open it. open: nobody checks for `cooldown`
+    seconds. half-open: one check goes through as a probe while the rest wait,
+    a real verdict closes it, another failure opens it again for twice as long
+    (up to max_cooldown). Thread-safe, shared through breaker_for().
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, threshold=3, cooldown=15, max_cooldown=240):
+        self.lock = threading.Lock()
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.reason = ""
+
+    def allow(self):
+        """(go, probe, seconds left): go=False means wait, probe=True means report back how it went"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True, False, 0.0
+            if self.state == self.OPEN:
+                left = self.opened_at + self.cooldown - time.monotonic()
+                if left > 0:
+                    return False, False, left
+                self.state = self.HALF_OPEN
+                self.probing = False
+            if self.probing:
+                return False, False, 0.0
+            self.probing = True
+            return True, True, 0.0
+
+    def success(self):
+        """A real verdict came back, True if that closed the breaker"""
+        with self.lock:
+            self.failures = 0
+            if self.state == self.CLOSED:
+                return False
+            self.state = self.CLOSED
+            self.cooldown = self.base_cooldown
+            self.probing = False
+            return True
+
+    def failure(self, reason):
+        """A check failed, True if that opened the breaker"""
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN:
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            elif self.state == self.OPEN or self.failures < self.threshold:
+                return False
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.probing = False
+            self.reason = f"{self.failures} failures in a row, last {reason}"
+            return True
+
+    def release(self):
+        """The probe ended without a verdict either way (stopped, rate limited), let another one try"""
+        with self.lock:
+            self.probing = False
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def breaker_for(platform):
+    """The platform's CircuitBreaker, one per process"""
+    with _breakers_lock:
+        if platform not in _breakers:
+            _breakers[platform] = CircuitBreaker()
+        return _breakers[platform]
+
+# ------------------- Retry Policy ------------------- #
+RETRYABLE = (Verdict.TIMEOUT, Verdict.CONNECTION_ERROR, Verdict.PROXY_ERROR, Verdict.RATE_LIMIT)
+RECHECK = (Verdict.UNCLEAR,) + RETRYABLE  # Worth another look later, with the thorough probe
+
+class RetryPolicy:
+    """When a name that failed for a passing reason gets another go.
+
+    Timeouts, connection/proxy errors and rate limits are retried up to
+    `attempts` tries in total. Try n waits a random 0..base*2^n seconds
+    (full jitter, capped at `cap`) so retries don't come back in lockstep,
+    or what the server's Retry-After said. Retries spend a budget that
+    every new name tops up by `ratio` (plus `reserve` to start with), so
+    when a site goes down retries stay a fraction of the traffic instead
+    of tripling it. One per platform (retry_policy_for()), so runs side by
+    side share the budget instead of each bringing their own.
+    """
+
+    def __init__(self, attempts=3, base=1.0, cap=60.0, ratio=0.2, reserve=10):
+        self.attempts = attempts
+        self.base = base
+        self.cap = cap
+        self.ratio = ratio
+        self.reserve = reserve
+        self.tokens = float(reserve)
+        self.lock = threading.Lock()  # Runs of the same platform spend from it on different threads
+
+    def first_try(self):
+        """A new name went out, it earns the budget a bit more"""
+        with self.lock:
+            self.tokens = min(self.tokens + self.ratio, self.reserve + 1.0)
+
+    def backoff(self, attempt, retry_after=None):
+        """Seconds before try number `attempt` + 1 (attempt 1 is the one that just failed)"""
+        if retry_after:
+            return float(retry_after) + random.uniform(0, self.base)
+        return random.uniform(0, min(self.cap, self.base * 2 ** attempt))
+
+    def allow(self, verdict, attempt):
+        """True (and spend from the budget) if this failure should be retried"""
+        if verdict not in RETRYABLE or attempt >= self.attempts:
+            return False
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+_retry_policies = {}
+_retry_policies_lock = threading.Lock()
+
+def retry_policy_for(platform):
+    """The platform's RetryPolicy, one per process like breaker_for()"""
+    with _retry_policies_lock:
+        if platform not in _retry_policies:
+            _retry_policies[platform] = RetryPolicy()
+        return _retry_policies[platform]
+
+# ------------------- Engine Service ------------------- #
+class EngineService:
+    """One event loop for every run, with the sessions kept open in between.
+
+    A checker with `service` set runs on this loop instead of making its own,
+    and gets the ClientSession the last run with the same settings left
+    behind (session_key()), so back-to-back runs start on warm keep-alive
+    connections and a filled DNS cache instead of paying DNS + TCP + TLS again.
+    Runs are handed over on a command queue from any thread, pause()/resume()/
+    stop() on the checker work the same either way. Runs of the same platform
+    that are on at the same time take turns (turn()), one check and its delay
+    each, so side by side they use the site's rate budget instead of adding up.
+    """
+
+    def __init__(self):
+        self.loop = None
+        self.thread = None
+        self.commands = None
+        self.jobs = {}  # Task -> checker running in it
+        self.sessions = {}  # (platform, session_key()) -> ClientSession
+        self.turns = {}  # platform -> asyncio.Lock, only used on the loop
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            if self.thread:
+                return
+            ready = threading.Event()
+            self.thread = threading.Thread(target=self.serve, args=(ready,), name="engine-service", daemon=True)
+            self.thread.start()
+            ready.wait()
+        atexit.register(self.close)
+
+    def serve(self, ready):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.commands = asyncio.Queue()
+        ready.set()
+        self.loop.run_until_complete(self.dispatch())
+        # Give aiohttp a moment to close its SSL transports before the loop goes away
+        self.loop.run_until_complete(asyncio.sleep(0.25))
+        self.loop.close()
+
+    def send(self, command, checker=None):
+        """Queue a command ("run" or "close"), returns a Future for when it's done"""
+        self.start()
+        done = Future()
+        self.loop.call_soon_threadsafe(self.commands.put_nowait, (command, checker, done))
+        return done
+
+    def run(self, checker):
+        """Run `checker` on the service loop and block until it's done"""
+        self.send("run", checker).result()
+
+    def close(self):
+        """Stop whatever is running and close the sessions, for app exit"""
+        if not self.thread or not self.thread.is_alive():
+            return
+        try:
+            self.send("close").result(timeout=10)
+        except Exception:
+            pass
+        self.thread.join(2)
+
+    async def dispatch(self):
+        while True:
+            command, checker, done = await self.commands.get()
+            if command == "close":
+                break
+            task = self.loop.create_task(checker.execute())
+            self.jobs[task] = checker
+            task.add_done_callback(lambda task, done=done: self.finished(task, done))
+        for checker in self.jobs.values():
+            checker.stop()
+        await asyncio.gather(*self.jobs, return_exceptions=True)
+        for session in self.sessions.values():
+            await session.close()
+        self.sessions.clear()
+        done.set_result(None)
+
+    def finished(self, task, done):
+        self.jobs.pop(task, None)
+        if task.cancelled():
+            done.cancel()
+        elif task.exception():
+            done.set_exception(task.exception())
+        else:
+            done.set_result(None)
+
+    async def session_for(self, checker):
+        """The open session for checker's settings, made with its create_session() the first time"""
+        key = (checker.platform, checker.session_key())
+        session = self.sessions.get(key)
+        if session and not session.closed:
+            checker.log("♻️ Reusing the connections from the last run")
+            return session
+        session = self.sessions[key] = checker.create_session()
+        return session
+
+    def turn(self, platform):
+        """Lock a checker holds for one check plus its delay"""
+        if platform not in self.turns:
+            self.turns[platform] = asyncio.Lock()
+        return self.turns[platform]
+
+_service = None
+
+def engine_service():
+    """The app-wide EngineService, its thread starts with the first run"""
+    global _service
+    if _service is None:
+        _service = EngineService()
+    return _service
+
+# ------------------- Shared Checker Base ------------------- #
+class BaseChecker(QThread):
+    """Plumbing shared by every platform checker.
+
+    `usernames` can be a list, any lazy iterator (generators, variant search)
+    or a CandidateQueue, names are pulled one at a time. More names can be
+    queued mid-run with add_candidates(). With max_hits set the run stops as soon as
+    that many AVAILABLE results have been reported. Subclasses provide
+    create_session() and check_user(), plus the concurrency/delay pacing.
+    """
+    # Everything that happened since the last flush: Result records, log lines,
+    # and the latest progress count (-1 if unchanged). Sent at most every FLUSH_INTERVAL.
+    batch = pyqtSignal(object, object, int)
+    FLUSH_INTERVAL = 0.075
+
+    platform = ""
+    journal = None  # Optional journal.Journal, set before start()
+    notifier = None  # Optional notifier.WebhookNotifier for AVAILABLE hits
+    trace_every = 1  # Stage-trace 1 in N checks (0 = off), the hooks cost a few µs per request
+    metrics_port = 0  # Serve Prometheus metrics on this port while running (0 = off)
+    cassette = None  # Optional cassette.Cassette: record every response, or replay them instead of the network
+    archive = None  # Optional archive.PageArchive: keep each classified page for reclassify.py
+    rechecks = 1  # Times an UNCLEAR/failed name is checked again at the end (thorough probe), 0 = off
+    recheck_share = 0.1  # Up to this share of checks go to rechecks while the queue still has names
+    service = None  # Optional EngineService to run on, keeps the connections warm for the next run
+    concurrency = 1  # Max requests in flight
+    delay = 2.0  # Seconds between names to avoid rate limits
+
+    def __init__(self, usernames, debug=False, max_hits=0):
+        super().__init__()
+        self.queue = usernames if isinstance(usernames, CandidateQueue) else CandidateQueue(usernames)
+        self.debug = debug
+        self.max_hits = max_hits  # 0 = check everything
+        self.hits = 0
+        self.count = 0  # Names done, skipped repeats included, so a list run ends at its total
+        self.running = True
+        self.paused = False
+        self.completed = False  # Ran out of names or hit max_hits, as opposed to STOP/crash
+        self.breaker = breaker_for(self.platform)  # Shared with every other checker of this platform
+        self.retry_policy = retry_policy_for(self.platform)  # Shared too, one retry budget per site
+        self.retries = []  # (due, seq, name, attempt, recheck) heap of names waiting for another go
+        self.retry_seq = itertools.count()
+        self.deferred = deque()  # (name, recheck) names to look at again once the queue is quiet
+        self.recheck_credit = 0.0
+        self.current = None  # (name, attempt, recheck) being checked
+        self.thorough = False  # True while checking a deferred name, check_user() can use a slower, surer probe
+        self.hold = 0  # Seconds to wait before the next check, set by back_off()
+        self.loop = None
+        self.task = None
+        self.check_started = time.perf_counter()
+        self.pending_rows = []
+        self.pending_lines = []
+        self.pending_progress = -1
+        self.pending_lock = threading.Lock()  # log() may be called from executor threads
+        self.sinks = []  # sinks.Sink instances, every result is written to each
+        self.stats = RunStats()
+        self.stage_stats = StageStats()
+        self.counters = Counter()  # Plain totals for the metrics endpoint, only touched on the loop
+        self.in_flight = 0
+        self.limiter = ""  # What's holding the run back right now (cooldown), "" if nothing
+        self.seen = set()  # Canonical names already checked this run, repeats are skipped
+        self.last_result = None  # Latest report(), handed to anyone waiting on the same name
+        self.trace_config = make_trace_config()  # Pass to the ClientSession in create_session()
+
+    def run(self):
+        if self.service:
+            self.service.run(self)
+            return
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            runner = loop.create_task(self.execute())
+            try:
+                loop.run_until_complete(runner)
+            except KeyboardInterrupt:
+                # Ctrl-C lands outside execute(), stop the run and let its finally close the sinks/journal
+                if not runner.done():
+                    self.stop()
+                    loop.run_until_complete(runner)
+                raise
+            # Give aiohttp a moment to close its SSL transports before the loop goes away
+            loop.run_until_complete(asyncio.sleep(0.25))
+        finally:
+            loop.close()
+
+    async def execute(self):
+        """The whole run, on whichever loop is running it"""
+        self.loop = asyncio.get_running_loop()
+        if self.journal:
+            self.journal.open()
+        for sink in list(self.sinks):
+            try:
+                sink.open()
+                self.log(f"💾 Saving results to {sink.path}")
+            except Exception as e:
+                self.log(f"⚠️ Can't write {sink.path}: {e}")
+                self.sinks.remove(sink)
+        if self.notifier:
+            self.notifier.start(self.loop, self.log)
+        if self.cassette:
+            try:
+                self.cassette.open()
+                self.log(f"📼 {'Recording to' if self.cassette.mode == 'record' else 'Replaying'} {self.cassette.path}")
+            except OSError as e:
+                self.log(f"⚠️ Can't open cassette {self.cassette.path}: {e}")
+                self.cassette = None
+        if self.archive:
+            try:
+                self.archive.open()
+                self.log(f"🗄️ Archiving pages to {self.archive.root}")
+            except OSError as e:
+                self.log(f"⚠️ Can't archive to {self.archive.root}: {e}")
+                self.archive = None
+        metrics_server = None
+        if self.metrics_port:
+            try:
+                metrics_server = await start_metrics_server(self.metrics_port, [self])
+                self.log(f"📈 Metrics on http://127.0.0.1:{self.metrics_port}/metrics")
+            except OSError as e:
+                self.log(f"⚠️ Can't serve metrics on port {self.metrics_port}: {e}")
+        flusher = self.loop.create_task(self.flush_loop())
+        try:
+            self.task = self.loop.create_task(self.main())
+            await self.task
+        except asyncio.CancelledError:
+            self.log("⏹️ Stopped")
+        finally:
+            if self.notifier:
+                await self.notifier.close()
+            summary = self.stage_stats.summary()
+            if summary:
+                self.log(f"⏱️ Stages: {summary}")
+            hits, misses = self.counters["classify_cache_hits"], self.counters["classify_cache_misses"]
+            if hits:
+                self.log(f"🧠 Classifier cache: {hits / (hits + misses):.0%} of {hits + misses} pages were known templates")
+            if metrics_server:
+                metrics_server.close()
+            if self.cassette:
+                self.cassette.close()
+                if self.cassette.missing:
+                    self.log(f"⚠️ {self.cassette.missing} requests weren't in the cassette")
+            if self.archive:
+                self.archive.close()
+            flusher.cancel()
+            self.flush()
+            if self.journal:
+                self.journal.close(finished=self.completed)
+            for sink in self.sinks:
+                sink.close()
+
+    async def flush_loop(self):
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self):
+        """Hand everything buffered to the GUI in one queued signal"""
+        with self.pending_lock:
+            if not (self.pending_rows or self.pending_lines or self.pending_progress >= 0):
+                return
+            rows, self.pending_rows = self.pending_rows, []
+            lines, self.pending_lines = self.pending_lines, []
+            progress, self.pending_progress = self.pending_progress, -1
+        self.batch.emit(rows, lines, progress)
+        if self.journal:
+            self.journal.sync()
+
+    def log(self, text):
+        with self.pending_lock:
+            self.pending_lines.append(text)
+
+    def progress(self, value):
+        self.pending_progress = value
+
+    def create_session(self):
+        """Return the aiohttp ClientSession used for the whole run"""
+        raise NotImplementedError
+
+    def session_key(self):
+        """Settings create_session() depends on, runs with the same key share a session on the EngineService"""
+        return ()
+
+    async def check_user(self, username, sem, session, lock, idx):
+        raise NotImplementedError
+
+    async def main(self):
+        current_counters.set(self.counters)  # The session's hooks count into this run
+        if self.service:
+            await self.check_names(await self.service.session_for(self))
+            return
+        async with self.create_session() as session:
+            await self.check_names(session)
+
+    async def check_names(self, session):
+        sem = asyncio.Semaphore(self.concurrency)
+        lock = asyncio.Lock()
+        turn = self.service.turn(self.platform) if self.service else nullcontext()
+        if self.cassette:
+            session = self.cassette.wrap(session, self.counters)
+        for i in itertools.count():
+            if self.paused:
+                self.limiter = "⏸️ Paused"
+                while self.paused and self.running:
+                    await asyncio.sleep(0.2)
+                self.limiter = ""
+            if not self.running:
+                break
+            username, attempt, recheck = await self.next_name()
+            if username is None:
+                self.completed = self.running
+                break
+            key = (self.platform, canonical_name(self.platform, username))
+            leader = False
+            if attempt == 1 and not recheck:
+                if key in self.seen:
+                    self.counters["deduplicated"] += 1
+                    self.count += 1  # Done as far as the list's total is concerned
+                    self.progress(self.count)
+                    continue
+                self.seen.add(key)
+                self.retry_policy.first_try()
+                self.recheck_credit = min(self.recheck_credit + self.recheck_share, 1.0)
+                self.check_started = time.perf_counter()
+                self.current = (username, attempt, recheck)
+                flight, leader = flights.join(key)
+                if not leader:
+                    current_trace.set(None)
+                    # shield: stopping this run mustn't cancel the flight for everyone else
+                    result = await asyncio.shield(asyncio.wrap_future(flight))
+                    if result is not None:  # Someone else just checked it, same answer
+                        self.counters["deduplicated"] += 1
+                        self.report(username, result.verdict, result.reason, result.detail, result.status, joined=True)
+                        continue
+                    flight, leader = flights.join(key)  # Their check never finished, do it here
+            self.last_result = None
+            probe = False
+            try:
+                if self.hold:
+                    hold, self.hold = self.hold, 0
+                    self.counters["limiter_wait_seconds"] += hold
+                    self.limiter = f"⏳ Backing off, {hold:.0f}s"
+                    await self.wait(hold)
+                    self.limiter = ""
+                probe = await self.pass_breaker()
+                async with turn:  # Only contended when other runs of this platform are on
+                    sampled = self.trace_every and i % self.trace_every == 0
+                    current_trace.set(CheckTrace() if sampled else None)
+                    self.check_started = time.perf_counter()
+                    self.current = (username, attempt, recheck)
+                    self.thorough = bool(recheck)
+                    self.in_flight += 1
+                    try:
+                        await self.check_user(username, sem, session, lock, i)
+                    finally:
+                        self.in_flight -= 1
+                        if leader:
+                            flights.land(key, self.last_result)
+                            leader = False
+                        if probe and self.breaker.state == CircuitBreaker.HALF_OPEN:
+                            self.breaker.release()
+                        probe = False
+                    if self.running:
+                        self.counters["limiter_wait_seconds"] += self.delay
+                        await self.wait(self.delay)
+            finally:
+                if leader:  # Stopped before the request went out, anyone waiting checks it themselves
+                    flights.land(key, None)
+                if probe and self.breaker.state == CircuitBreaker.HALF_OPEN:
+                    self.breaker.release()  # Stopped while waiting for the turn, let another run probe
+
+    async def next_name(self):
+        """(name, attempt, recheck) to check next, (None, 0, 0) when there's nothing left.
+
+        Retries that are due come first, then queued names. Deferred rechecks get
+        a recheck_share of the turns while the queue has names, and all of them
+        once it's empty, retries still waiting are waited for last.
+        """
+        while self.running:
+            if self.retries and self.retries[0][0] <= time.monotonic():
+                _, _, name, attempt, recheck = heapq.heappop(self.retries)
+                return name, attempt, recheck
+            if self.deferred and self.recheck_credit >= 1:
+                self.recheck_credit -= 1
+                return self.deferred_name()
+            name = self.queue.pop()
+            if name is not None:
+                return name, 1, 0
+            if self.deferred:
+                return self.deferred_name()
+            if not self.retries:
+                break
+            await self.wait(min(self.retries[0][0] - time.monotonic(), 1.0))
+        return None, 0, 0
+
+    def deferred_name(self):
+        name, recheck = self.deferred.popleft()
+        return name, 1, recheck
+
+    def recheck_later(self, verdict):
+        """Defer the name being checked for a thorough recheck, True if it was"""
+        name, attempt, recheck = self.current or (None, 0, 0)
+        if name is None or not self.running or recheck >= self.rechecks:
+            return False
+        self.deferred.append((name, recheck + 1))
+        self.counters["rechecks"] += 1
+        self.log(f"🔁 {name}: {verdict.label}, checking again later")
+        return True
+
+    def retry_later(self, verdict, reason, detail):
+        """Put the name being checked back in line if the policy allows it, True if it did"""
+        name, attempt, recheck = self.current or (None, 0, 0)
+        if name is None or not self.running or not self.retry_policy.allow(verdict, attempt):
+            if verdict in RETRYABLE and attempt and attempt < self.retry_policy.attempts:
+                self.counters["retries_denied"] += 1
+            return False
+        seconds = self.retry_policy.backoff(attempt, detail if reason == Reason.RETRY_AFTER else None)
+        if self.cassette:
+            seconds = self.cassette.scale(seconds)
+        heapq.heappush(self.retries, (time.monotonic() + seconds, next(self.retry_seq), name, attempt + 1, recheck))
+        self.counters["retries"] += 1
+        if self.debug:
+            self.log(f"[DEBUG] {verdict.label} on {name}, try {attempt + 1} in {seconds:.1f}s")
+        return True
+
+    def add_candidates(self, names):
+        """Queue more names during a run, they are ranked like the rest"""
+        self.queue.extend(names)
+        if self.journal:
+            self.journal.added(names)
+
+    def stop(self):
+        """Safe to call from the GUI thread: aborts the in-flight request and skips the rest"""
+        self.running = False
+        try:
+            if self.task and not self.task.done():
+                self.loop.call_soon_threadsafe(self.task.cancel)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    def pause(self):
+        """Hold the run once the check in flight is done, safe from any thread"""
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def report(self, username, verdict, reason=Reason.NONE, detail=None, status=0, joined=False):
+        """Record one result, AVAILABLE results count towards max_hits.
+
+        Passing failures (timeouts, rate limits...) are put back in line
+        instead, per the RetryPolicy, and only the last try is recorded.
+        joined: the result came from another run's check of the same name,
+        which already told the breaker and used up its retries.
+        """
+        latency = time.perf_counter() - self.check_started
+        trace = current_trace.get()
+        stages = trace.finish() if trace else None
+        if stages:
+            self.stage_stats.observe(stages)
+            self.counters["classify_seconds"] += stages[-1]
+        if verdict in FAILURES and not joined and self.breaker.failure(verdict.label):
+            self.counters["breaker_trips"] += 1
+            self.log(f"\n🛑 CIRCUIT OPEN: {self.breaker.reason}!")
+            self.log(f"⏸️  Pausing every {self.platform} check for {self.breaker.cooldown}s, then trying one name...")
+        if verdict in RETRYABLE and not joined and self.retry_later(verdict, reason, detail):
+            return
+        if verdict in RECHECK and not joined and self.recheck_later(verdict):
+            return
+        self.current = None
+        result = Result(self.platform, username, verdict, reason, detail, latency, status, stages=stages)
+        self.stats.observe(result)
+        self.last_result = result
+        self.count += 1
+        self.progress(self.count)
+        if verdict in FATAL:
+            if self.running:
+                self.log(f"\n⛔ {verdict.label}: stopping, every other name would fail the same way\n")
+            self.running = False
+        elif verdict in FINAL and not joined:
+            if self.breaker.success():
+                self.log("✅ Probe went through, resuming\n")
+        with self.pending_lock:
+            self.pending_rows.append(result)
+        if self.journal:
+            self.journal.record(result)
+        for sink in self.sinks:
+            sink.write(result)
+
+        if verdict == Verdict.AVAILABLE:
+            if self.notifier:
+                self.notifier.notify(result)
+            self.hits += 1
+            if self.max_hits and self.hits >= self.max_hits and self.running:
+                self.log(f"\n🎯 Found {self.hits} available - stopping\n")
+                self.running = False
+                self.completed = True
+
+    def keep_page(self, username, status, final_url, body, verdict, reason):
+        """Archive the page a verdict came from, if archiving is on"""
+        if self.archive:
+            self.archive.add(self.platform, username, status, final_url, body, verdict, reason)
+
+    async def pass_breaker(self):
+        """Wait while the platform's breaker is open, True if this check is the half-open probe"""
+        shown = -1
+        while self.running:
+            go, probe, left = self.breaker.allow()
+            if go:
+                self.limiter = ""
+                if probe:
+                    self.log(f"🔍 Probing {self.platform} with one name...")
+                return probe
+            if left and int(left) != shown and int(left) % 5 == 0:
+                shown = int(left)
+                self.log(f"⏳ Resuming in {shown + 1} seconds...")
+            self.limiter = f"🛑 Circuit open ({self.breaker.reason}), " + (f"{left:.0f}s left" if left else "probing")
+            step = min(left, 1.0) or 0.25
+            self.counters["cooldown_seconds"] += step
+            await self.wait(step)
+        self.limiter = ""
+        return False
+
+    def back_off(self, seconds):
+        """Hold the next check for `seconds` after a rate limit, the wait happens outside the semaphore"""
+        self.hold = max(self.hold, seconds)
+
+    async def wait(self, seconds):
+        """Sleep for pacing, sped up (or skipped) when replaying a cassette"""
+        if self.cassette:
+            seconds = self.cassette.scale(seconds)
+        if seconds:
+            await asyncio.sleep(seconds)
@@ -0,0 +1,72 @@
+import re
+from collections import Counter, OrderedDict
+
+# ------------------- Classifier Cache ------------------- #
+class ClassifierCache:
+    """Remembers classify_page() answers for pages that are the same template.
+
+    Not-found, deleted and login pages are byte-identical apart from the
+    username. Each page gets a cheap sample key (status, final URL, body
+    length, a few windows of the body with the name taken out, in any case
+    like the classifiers match it). Pages with a new sample key go straight
+    to the classifier, so one-off profile pages only pay for the sampling.
+    When a sample key comes back the whole body is hashed (name taken out)
+    and only an exact match reuses the stored
+    answer, so two pages that merely look alike are never confused.
+    The oldest of `size` keys is dropped first. Hits/misses go into `counters`.
+    """
+    SAMPLES = 8  # Windows spread over the body, plus its start
+    WINDOW = 64
+
+    def __init__(self, classify, size=4096, counters=None):
+        self.classify = classify
+        self.size = size
+        self.counters = Counter() if counters is None else counters
+        self.entries = OrderedDict()  # sample key -> [full fingerprint or None, answer]
+
+    @staticmethod
+    def strip_name(username, text):
+        """`text` as bytes with the name swapped for \\0 in any case, like the classifiers match it"""
+        if not username.isascii():
+            text = re.sub(re.escape(username), "\0", text, flags=re.IGNORECASE)
+            return text.encode("utf-8", "surrogatepass")
+        data = text.encode("utf-8", "surrogatepass")
+        # bytes.lower() only folds ASCII, a fraction of str.lower()/re.I on big non-ASCII pages
+        low, needle = data.lower(), username.lower().encode()
+        parts, start = [], 0
+        at = low.find(needle) if needle else -1
+        while at >= 0:
+            parts.append(data[start:at])
+            start = at + len(needle)
+            at = low.find(needle, start)
+        parts.append(data[start:])
+        return b"\0".join(parts)
+
+    def sample_key(self, username, status, final_url, body):
+        size, window = len(body), self.WINDOW
+        ends = [window] + [size - size * i // self.SAMPLES for i in range(self.SAMPLES)]
+        windows = self.strip_name(username, "\1".join(body[max(0, end - window):end] for end in ends))
+        return (status, self.strip_name(username, final_url), size, hash(windows))
+
+    def fingerprint(self, username, body):
+        page = self.strip_name(username, body)
+        return (len(page), hash(page))
+
+    def __call__(self, username, status, final_url, body, log=None):
+        if log:  # Debug runs want the [DEBUG] lines of the full analysis
+            return self.classify(username, status, final_url, body, log)
+        key = self.sample_key(username, status, final_url, body)
+        entry = self.entries.get(key)
+        fingerprint = None
+        if entry is not None:
+            self.entries.move_to_end(key)
+            fingerprint = self.fingerprint(username, body)
+            if entry[0] == fingerprint:
+                self.counters["classify_cache_hits"] += 1
+                return entry[1]
+        self.counters["classify_cache_misses"] += 1
+        answer = self.classify(username, status, final_url, body)
+        self.entries[key] = [fingerprint, answer]
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+        return answer
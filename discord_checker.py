@@ -2,37 +2,33 @@ import sys, aiohttp, asyncio, random, string, re, json
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
+from name_generator import get_model, iter_variants, score_name, VALIDATORS
+from checker_engine import BaseChecker, CandidateQueue, engine_service
+from results_view import ResultsView
+from job_queue import JobQueue
+from records import Verdict, Reason
+from journal import Journal
+from sinks import SINKS, make_sink
+from notifier import WebhookNotifier, send_test
 
 # ------------------- Checker Thread ------------------- #
-class Checker(QThread):
-    update = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count = 0
-
+class Checker(BaseChecker):
+    platform = "discord"
     # Discord API endpoints
     POMELO_CHECK_URL = "https://discord.com/api/v9/unique-username/username-attempt-unauthed"
     LEGACY_CHECK_URL = "https://discord.com/api/v9/users/@me"
 
-    def __init__(self, usernames, token, user_agent, check_mode="pomelo", proxies=None, debug=False):
-        super().__init__()
-        self.usernames = usernames
+    def __init__(self, usernames, token, user_agent, check_mode="pomelo", proxies=None, debug=False, max_hits=0):
+        super().__init__(usernames, debug, max_hits)
         self.token = token
         self.user_agent = user_agent
         self.check_mode = check_mode  # "pomelo" or "legacy"
         self.proxies = proxies if proxies else []
         self.proxy_index = 0
-        self.running = True
-        self.debug = debug
-        self.consecutive_errors = 0
-        self.max_errors_before_pause = 3
-
-    def run(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self.main())
-        finally:
-            loop.close()
+        # Adjust concurrency based on proxy availability
+        self.concurrency = min(len(self.proxies) or 1, 5)  # Cap at 5 concurrent
+        # Shorter delay if using proxies, longer if not
+        self.delay = 1.0 if self.proxies else 3.0
 
     def get_next_proxy(self):
         """Get the next proxy in rotation"""
@@ -42,37 +38,34 @@ class Checker(QThread):
         self.proxy_index = (self.proxy_index + 1) % len(self.proxies)
         return proxy
 
-    def stop(self):
-        self.running = False
-
     async def check_pomelo_username(self, username, session, proxy=None):
         """Check if a Pomelo (new) username is available"""
         try:
             payload = {"username": username}
             
             if self.debug and proxy:
-                self.update.emit(f"[DEBUG] Using proxy: {proxy}")
+                self.log(f"[DEBUG] Using proxy: {proxy}")
             
             async with session.post(self.POMELO_CHECK_URL, json=payload, proxy=proxy, timeout=15) as resp:
                 status = resp.status
                 
                 if self.debug:
-                    self.update.emit(f"\n{'='*60}")
-                    self.update.emit(f"[DEBUG] Checking: {username}")
-                    self.update.emit(f"[DEBUG] Status Code: {status}")
+                    self.log(f"\n{'='*60}")
+                    self.log(f"[DEBUG] Checking: {username}")
+                    self.log(f"[DEBUG] Status Code: {status}")
                 
                 if status == 200:
                     data = await resp.json()
                     
                     if self.debug:
-                        self.update.emit(f"[DEBUG] Response: {json.dumps(data, indent=2)}")
+                        self.log(f"[DEBUG] Response: {json.dumps(data, indent=2)}")
                     
                     taken = data.get("taken", True)
                     
                     if taken:
-                        self.update.emit(f"❌ [TAKEN] {username}")
+                        self.report(username, Verdict.TAKEN, status=status)
                     else:
-                        self.update.emit(f"✅ [AVAILABLE] {username}")
+                        self.report(username, Verdict.AVAILABLE, status=status)
                     
                     return not taken
                 
@@ -83,20 +76,26 @@ class Checker(QThread):
                     except:
                         retry_seconds = 60
                     
-                    self.update.emit(f"[RATE LIMIT] {username}: Waiting {retry_seconds}s...")
-                    await self.cooldown(retry_seconds, "Rate limit hit")
+                    self.report(username, Verdict.RATE_LIMIT, Reason.RETRY_AFTER, retry_seconds, status=status)
+                    self.back_off(retry_seconds)
                     return None
                 
                 elif status == 401:
-                    self.update.emit(f"[AUTH ERROR] {username}: Invalid token")
+                    self.report(username, Verdict.AUTH_ERROR, Reason.INVALID_TOKEN, status=status)
+                    return None
+                
+                elif status >= 500:
+                    self.report(username, Verdict.CONNECTION_ERROR, Reason.SERVER_ERROR, status=status)
                     return None
                 
                 else:
-                    self.update.emit(f"[ERROR] {username}: Status {status}")
+                    self.report(username, Verdict.ERROR, Reason.HTTP_STATUS, status=status)
                     return None
                     
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            raise  # check_user() reports these as TIMEOUT/PROXY_ERROR/CONNECTION_ERROR, which get retried
         except Exception as e:
-            self.update.emit(f"[ERROR] {username}: {str(e)[:80]}")
+            self.report(username, Verdict.ERROR, Reason.EXCEPTION, str(e)[:80])
             return None
 
     async def check_legacy_username(self, username, discriminator, session, proxy=None):
@@ -110,18 +109,18 @@ class Checker(QThread):
             }
             
             if self.debug and proxy:
-                self.update.emit(f"[DEBUG] Using proxy: {proxy}")
+                self.log(f"[DEBUG] Using proxy: {proxy}")
             
             async with session.patch(self.LEGACY_CHECK_URL, json=payload, proxy=proxy, timeout=15) as resp:
                 status = resp.status
                 
                 if self.debug:
-                    self.update.emit(f"\n{'='*60}")
-                    self.update.emit(f"[DEBUG] Checking: {username}#{discriminator}")
-                    self.update.emit(f"[DEBUG] Status Code: {status}")
+                    self.log(f"\n{'='*60}")
+                    self.log(f"[DEBUG] Checking: {username}#{discriminator}")
+                    self.log(f"[DEBUG] Status Code: {status}")
                 
                 if status == 200:
-                    self.update.emit(f"[AVAILABLE] {username}#{discriminator}")
+                    self.report(f"{username}#{discriminator}", Verdict.AVAILABLE, status=status)
                     return True
                 
                 elif status == 400:
@@ -129,23 +128,29 @@ class Checker(QThread):
                     errors = data.get("errors", {})
                     
                     if "username" in errors:
-                        self.update.emit(f"[TAKEN/INVALID] {username}#{discriminator}")
+                        self.report(f"{username}#{discriminator}", Verdict.TAKEN_INVALID, status=status)
                     else:
-                        self.update.emit(f"[ERROR] {username}#{discriminator}: {errors}")
+                        self.report(f"{username}#{discriminator}", Verdict.ERROR, Reason.API_ERRORS, str(errors), status=status)
                     return False
                 
                 elif status == 429:
-                    self.update.emit(f"[RATE LIMIT] {username}#{discriminator}")
-                    retry_after = int(resp.headers.get('Retry-After', 5))
-                    await asyncio.sleep(retry_after)
+                    retry_after = int(float(resp.headers.get('Retry-After', 5)))
+                    self.report(f"{username}#{discriminator}", Verdict.RATE_LIMIT, Reason.RETRY_AFTER, retry_after, status=status)
+                    self.back_off(retry_after)
+                    return None
+                
+                elif status >= 500:
+                    self.report(f"{username}#{discriminator}", Verdict.CONNECTION_ERROR, Reason.SERVER_ERROR, status=status)
                     return None
                 
                 else:
-                    self.update.emit(f"[ERROR] {username}#{discriminator}: Status {status}")
+                    self.report(f"{username}#{discriminator}", Verdict.ERROR, Reason.HTTP_STATUS, status=status)
                     return None
                     
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            raise  # check_user() reports these as TIMEOUT/PROXY_ERROR/CONNECTION_ERROR, which get retried
         except Exception as e:
-            self.update.emit(f"[ERROR] {username}: {str(e)[:80]}")
+            self.report(username, Verdict.ERROR, Reason.EXCEPTION, str(e)[:80])
             return None
 
     async def check_user(self, username, sem, session, lock, idx):
@@ -158,71 +163,33 @@ class Checker(QThread):
             
             try:
                 if self.check_mode == "pomelo":
-                    result = await self.check_pomelo_username(username, session, proxy)
+                    await self.check_pomelo_username(username, session, proxy)
                 else:
                     # For legacy, split username#discriminator
                     if "#" in username:
                         uname, disc = username.split("#", 1)
-                        result = await self.check_legacy_username(uname, disc, session, proxy)
+                        await self.check_legacy_username(uname, disc, session, proxy)
                     else:
-                        self.update.emit(f"[ERROR] {username}: Legacy mode requires format username#1234")
-                        result = None
-                
-                if result is None:
-                    self.consecutive_errors += 1
-                    await self.check_for_cooldown()
-                else:
-                    self.consecutive_errors = 0
+                        self.report(username, Verdict.ERROR, Reason.LEGACY_FORMAT)
                     
             except aiohttp.ClientProxyConnectionError:
-                self.update.emit(f"[PROXY ERROR] {username}: Could not connect via proxy")
-                self.consecutive_errors += 1
+                self.report(username, Verdict.PROXY_ERROR, Reason.PROXY_FAILED)
+            except aiohttp.ClientConnectionError:
+                self.report(username, Verdict.CONNECTION_ERROR, Reason.UNREACHABLE, "Discord")
             except asyncio.TimeoutError:
-                self.consecutive_errors += 1
-                self.update.emit(f"[TIMEOUT] {username}")
-                await self.check_for_cooldown()
+                self.report(username, Verdict.TIMEOUT)
             except Exception as e:
-                self.consecutive_errors += 1
                 error_msg = str(e)[:80]
-                self.update.emit(f"[ERROR] {username}: {error_msg}")
-                await self.check_for_cooldown()
-            finally:
-                async with lock:
-                    self.count += 1
-                self.pupdate.emit(self.count)
-
-    async def check_for_cooldown(self):
-        """Check if we need to pause due to consecutive errors"""
-        if self.consecutive_errors >= self.max_errors_before_pause:
-            await self.cooldown(15, f"{self.consecutive_errors} errors in a row")
-            self.consecutive_errors = 0
-
-    async def cooldown(self, duration, reason):
-        """Pause checking for a specified duration"""
-        self.update.emit(f"\n COOLDOWN: {reason}!")
-        self.update.emit(f"Pausing for {duration} seconds...")
-        
-        for remaining in range(duration, 0, -1):
-            if not self.running:
-                break
-            self.update.emit(f"Resuming in {remaining} seconds...")
-            await asyncio.sleep(1)
-        
-        self.update.emit(f"Cooldown complete! Continuing...\n")
+                self.report(username, Verdict.ERROR, Reason.EXCEPTION, error_msg)
 
     async def main(self):
-        # Adjust concurrency based on proxy availability
-        concurrent_limit = len(self.proxies) if self.proxies else 1
-        concurrent_limit = min(concurrent_limit, 5)  # Cap at 5 concurrent
-        
-        sem = asyncio.Semaphore(concurrent_limit)
-        lock = asyncio.Lock()
-        
         if self.proxies:
-            self.update.emit(f"Using {len(self.proxies)} proxies with {concurrent_limit} concurrent requests\n")
+            self.log(f"Using {len(self.proxies)} proxies with {self.concurrency} concurrent requests\n")
         else:
-            self.update.emit(f"No proxies loaded - using direct connection (may hit rate limits)\n")
+            self.log(f"No proxies loaded - using direct connection (may hit rate limits)\n")
+        await super().main()
 
+    def create_session(self):
         headers = {
             "User-Agent": self.user_agent,
             "Accept": "*/*",
@@ -235,17 +202,12 @@ class Checker(QThread):
             "X-Super-Properties": "eyJvcyI6IldpbmRvd3MiLCJicm93c2VyIjoiQ2hyb21lIiwiZGV2aWNlIjoiIiwic3lzdGVtX2xvY2FsZSI6ImVuLVVTIiwiYnJvd3Nlcl91c2VyX2FnZW50IjoiTW96aWxsYS81LjAgKFdpbmRvd3MgTlQgMTAuMDsgV2luNjQ7IHg2NCkgQXBwbGVXZWJLaXQvNTM3LjM2IChLSFRNTCwgbGlrZSBHZWNrbykgQ2hyb21lLzEyMC4wLjAuMCBTYWZhcmkvNTM3LjM2IiwiYnJvd3Nlcl92ZXJzaW9uIjoiMTIwLjAuMC4wIiwib3NfdmVyc2lvbiI6IjEwIiwicmVmZXJyZXIiOiIiLCJyZWZlcnJpbmdfZG9tYWluIjoiIiwicmVmZXJyZXJfY3VycmVudCI6IiIsInJlZmVycmluZ19kb21haW5fY3VycmVudCI6IiIsInJlbGVhc2VfY2hhbm5lbCI6InN0YWJsZSIsImNsaWVudF9idWlsZF9udW1iZXIiOjI1MDcxMCwiY2xpZW50X2V2ZW50X3NvdXJjZSI6bnVsbH0="
         }
 
-        connector = aiohttp.TCPConnector(limit=concurrent_limit, ssl=True)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ssl=True)
         timeout = aiohttp.ClientTimeout(total=30)
-        
-        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
-            for i, username in enumerate(self.usernames):
-                if not self.running:
-                    break
-                await self.check_user(username, sem, session, lock, i)
-                # Shorter delay if using proxies, longer if not
-                delay = 1.0 if self.proxies else 3.0
-                await asyncio.sleep(delay)
+        return aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout, trace_configs=[self.trace_config])
+
+    def session_key(self):
+        return (self.token, self.check_mode, self.user_agent, self.concurrency)
 
 # ------------------- GUI App ------------------- #
 class App(QMainWindow):
@@ -253,7 +215,8 @@ class App(QMainWindow):
         super().__init__()
         self.setWindowTitle("Discord Username Checker")
         self.setGeometry(150, 150, 1100, 800)
-        self.thread = None
+        self.thread = None  # Checker the progress bar follows, the newest running one
+        self.jobs_idle = True
         self.initUI()
 
     def initUI(self):
@@ -391,7 +354,8 @@ class App(QMainWindow):
             "Letters + Numbers (a1b2)",
             "Numbers + Letters (12ab)",
             "Letters_Letters (abc_def)",
-            "CamelCase (AbcDef)"
+            "CamelCase (AbcDef)",
+            "Pronounceable (brelo)"
         ])
         self.pattern_combo.setMaximumWidth(200)
         row2.addWidget(self.pattern_combo)
@@ -408,9 +372,48 @@ class App(QMainWindow):
         row2.addStretch()
         gen_layout.addLayout(row2)
         
+        # Third row - closest available variants of a taken name
+        row3 = QHBoxLayout()
+        row3.addWidget(QLabel("Variants of:"))
+        self.variant_input = QLineEdit()
+        self.variant_input.setPlaceholderText("e.g., shadow")
+        self.variant_input.setMaximumWidth(150)
+        row3.addWidget(self.variant_input)
+        
+        row3.addWidget(QLabel("Find:"))
+        self.variant_count_input = QLineEdit("3")
+        self.variant_count_input.setMaximumWidth(60)
+        row3.addWidget(self.variant_count_input)
+        
+        self.variant_button = QPushButton("🔎 Find Closest Available")
+        self.variant_button.setToolTip("Check variants of the name, closest first, until this many are available")
+        self.variant_button.clicked.connect(self.variants_clicked)
+        self.variant_button.setStyleSheet("background-color: #2196F3; color: white; padding: 8px; font-weight: bold;")
+        row3.addWidget(self.variant_button)
+        
+        row3.addStretch()
+        gen_layout.addLayout(row3)
+        
         gen_group.setLayout(gen_layout)
         main_layout.addWidget(gen_group)
 
+        # Webhook Section
+        webhook_group = QGroupBox("🔔 Discord Webhook (Optional)")
+        webhook_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        webhook_layout = QHBoxLayout()
+        
+        self.webhook_input = QLineEdit()
+        self.webhook_input.setPlaceholderText("https://discord.com/api/webhooks/... (get pinged when available names are found)")
+        webhook_layout.addWidget(self.webhook_input)
+        
+        test_webhook_btn = QPushButton("🧪 Test")
+        test_webhook_btn.setMaximumWidth(80)
+        test_webhook_btn.clicked.connect(self.test_webhook)
+        webhook_layout.addWidget(test_webhook_btn)
+        
+        webhook_group.setLayout(webhook_layout)
+        main_layout.addWidget(webhook_group)
+
         # Input/Output Section
         io_group = QGroupBox("Step 5: Check Usernames")
         io_group.setStyleSheet("QGroupBox { font-weight: bold; }")
@@ -430,39 +433,77 @@ class App(QMainWindow):
         output_box = QVBoxLayout()
         output_label = QLabel("📊 Results:")
         output_label.setStyleSheet("font-weight: bold;")
-        output_box.addWidget(output_label)
-        
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
-        self.output_text.setStyleSheet("background-color: #2b2b2b; color: #ffffff; font-family: Consolas, Monaco, monospace; padding: 10px;")
-        output_box.addWidget(self.output_text)
+        output_header = QHBoxLayout()
+        output_header.addWidget(output_label)
+        output_header.addStretch()
+        output_header.addWidget(QLabel("💾 Save to file:"))
+        self.export_combo = QComboBox()
+        self.export_combo.addItems(["Off"] + list(SINKS))
+        self.export_combo.setToolTip("Write every result to results/ as it comes in")
+        output_header.addWidget(self.export_combo)
+        output_box.addLayout(output_header)
+        
+        self.results = ResultsView()
+        self.results.log_view.setStyleSheet("background-color: #2b2b2b; color: #ffffff; font-family: Consolas, Monaco, monospace; padding: 10px;")
+        output_box.addWidget(self.results)
         
         io_layout.addLayout(input_box)
-        io_layout.addLayout(output_box)
+        io_layout.addLayout(output_box, 2)
         io_group.setLayout(io_layout)
         main_layout.addWidget(io_group)
 
         # Control Buttons
         btn_layout = QHBoxLayout()
         
+        btn_layout.addWidget(QLabel("Stop after:"))
+        self.stop_after_input = QLineEdit("0")
+        self.stop_after_input.setMaximumWidth(50)
+        self.stop_after_input.setToolTip("Stop the run once this many AVAILABLE names are found (0 = check everything)")
+        btn_layout.addWidget(self.stop_after_input)
+        btn_layout.addWidget(QLabel("available"))
+        
+        self.best_first_checkbox = QCheckBox("⭐ Best names first")
+        self.best_first_checkbox.setChecked(True)
+        self.best_first_checkbox.setToolTip("Check short, pronounceable, real-word names without digits before the rest")
+        btn_layout.addWidget(self.best_first_checkbox)
+        
         self.start_button = QPushButton("▶️ START CHECKING")
         self.start_button.clicked.connect(self.start_clicked)
         self.start_button.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 15px; font-size: 14px;")
         btn_layout.addWidget(self.start_button)
         
+        self.resume_button = QPushButton("♻️ Resume")
+        self.resume_button.clicked.connect(self.resume_clicked)
+        self.resume_button.setToolTip("Continue the last run that was stopped or crashed, skipping names already checked")
+        self.resume_button.setStyleSheet("padding: 15px;")
+        btn_layout.addWidget(self.resume_button)
+        
         self.stop_button = QPushButton("⏹️ STOP")
         self.stop_button.clicked.connect(self.stop_clicked)
         self.stop_button.setEnabled(False)
         self.stop_button.setStyleSheet("background-color: #f44336; color: white; font-weight: bold; padding: 15px; font-size: 14px;")
         btn_layout.addWidget(self.stop_button)
         
+        self.queue_button = QPushButton("➕ Queue More")
+        self.queue_button.clicked.connect(self.queue_more_clicked)
+        self.queue_button.setEnabled(False)
+        self.queue_button.setToolTip("Add the names in the input box to the running check")
+        self.queue_button.setStyleSheet("padding: 15px;")
+        btn_layout.addWidget(self.queue_button)
+        
         self.clear_button = QPushButton("🗑️ Clear Results")
-        self.clear_button.clicked.connect(lambda: self.output_text.clear())
+        self.clear_button.clicked.connect(self.results.clear)
         self.clear_button.setStyleSheet("padding: 15px;")
         btn_layout.addWidget(self.clear_button)
         
         main_layout.addLayout(btn_layout)
 
+        # Job Queue - START adds to it, runs start as soon as there's a free slot
+        self.jobs = JobQueue()
+        self.jobs.job_started.connect(self.job_started)
+        self.jobs.idle.connect(self.checking_finished)
+        main_layout.addWidget(self.jobs)
+
         # Progress Bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setStyleSheet("QProgressBar { text-align: center; height: 25px; }")
@@ -525,6 +566,10 @@ class App(QMainWindow):
 
         generated = []
         
+        if pattern == "Pronounceable (brelo)":
+            # Sample the whole batch from the Markov model up front
+            pronounceable = iter(get_model().sample(count, length, prefix))
+        
         for _ in range(count):
             username = ""
             
@@ -559,6 +604,9 @@ class App(QMainWindow):
                     remaining -= part_len
                 username = "".join(parts)
             
+            elif pattern == "Pronounceable (brelo)":
+                username = next(pronounceable)
+            
             # Add prefix and suffix
             username = prefix + username + suffix
             
@@ -578,68 +626,178 @@ class App(QMainWindow):
         self.status_label.setText(f"✅ Generated {len(generated)} usernames")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
 
-    def start_clicked(self):
-        check_mode = "pomelo" if self.pomelo_radio.isChecked() else "legacy"
+    def test_webhook(self):
+        webhook_url = self.webhook_input.text().strip()
         
-        token = self.token_input.text().strip()
-        if check_mode == "legacy" and not token:
-            QMessageBox.warning(self, "Missing Token", "Legacy mode requires a Discord token!")
+        if not webhook_url:
+            QMessageBox.warning(self, "No Webhook", "Please enter a webhook URL first!")
             return
         
+        try:
+            status = asyncio.run(send_test(webhook_url, "discord"))
+            
+            if status == 204:
+                QMessageBox.information(self, "Success", "✅ Webhook test successful!\nCheck your Discord channel.")
+            else:
+                QMessageBox.warning(self, "Failed", f"❌ Webhook test failed!\nStatus code: {status}")
+                
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"❌ Failed to send test message:\n{str(e)}")
+
+    def start_clicked(self):
         usernames = self.get_usernames()
         if not usernames:
             QMessageBox.warning(self, "No Usernames", "Please enter or generate usernames to check!")
             return
         
+        max_hits = self.get_stop_after()
+        score = score_name if self.best_first_checkbox.isChecked() else None
+        queue = CandidateQueue(usernames, score)
+        journal = Journal.create("discord", names=usernames, max_hits=max_hits)
+        self.start_checking(queue, len(usernames), max_hits, journal)
+
+    def variants_clicked(self):
+        if not self.pomelo_radio.isChecked():
+            QMessageBox.warning(self, "Pomelo Only", "Variant search only works for Pomelo usernames!")
+            return
+        
+        seed = self.variant_input.text().strip().lower()
+        if not seed:
+            QMessageBox.warning(self, "No Name", "Enter the taken name to search variants of!")
+            return
+        
+        try:
+            wanted = max(1, int(self.variant_count_input.text()))
+        except:
+            wanted = 3
+        
+        # Variants are generated lazily, closest first, until enough are available
+        journal = Journal.create("discord", seed=seed, wanted=wanted)
+        if self.start_checking(iter_variants(seed, VALIDATORS["discord"]), 0, max_hits=wanted, journal=journal):
+            self.status_label.setText(f"🔎 Searching variants of '{seed}' until {wanted} are available...")
+
+    def resume_clicked(self):
+        journal, state = Journal.resume("discord")
+        if not journal:
+            QMessageBox.information(self, "Nothing to Resume", "No unfinished run found!")
+            return
+        
+        if state.mode == "variants" and not self.pomelo_radio.isChecked():
+            QMessageBox.warning(self, "Pomelo Only", "Variant search only works for Pomelo usernames!")
+            return
+        
+        if state.mode == "variants":
+            # Same variant order as before, minus what's already checked
+            variants = (v for v in iter_variants(state.seed, VALIDATORS["discord"]) if v not in state.done)
+            wanted = state.wanted - state.hits
+            if wanted <= 0:
+                QMessageBox.information(self, "Nothing to Resume", "That search already found enough names!")
+                return
+            if self.start_checking(variants, 0, wanted, journal):
+                self.status_label.setText(f"♻️ Resuming variants of '{state.seed}' ({state.hits} found, {len(state.done)} done)...")
+            return
+        
+        remaining = state.remaining()
+        max_hits = max(0, state.max_hits - state.hits) if state.max_hits else 0
+        score = score_name if self.best_first_checkbox.isChecked() else None
+        if self.start_checking(CandidateQueue(remaining, score), len(remaining), max_hits, journal):
+            self.status_label.setText(f"♻️ Resuming: {len(state.done)} already done, {len(remaining)} to go...")
+
+    def start_checking(self, usernames, total, max_hits=0, journal=None):
+        check_mode = "pomelo" if self.pomelo_radio.isChecked() else "legacy"
+        
+        token = self.token_input.text().strip()
+        if check_mode == "legacy" and not token:
+            QMessageBox.warning(self, "Missing Token", "Legacy mode requires a Discord token!")
+            return False
+        
         # Get proxies
         proxies = self.get_proxies()
         
         ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         debug = self.debug_checkbox.isChecked()
         
-        self.progress_bar.setMaximum(len(usernames))
-        self.progress_bar.setValue(0)
-        self.output_text.clear()
-        self.start_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
         
         if proxies:
-            self.status_label.setText(f"🔄 Checking {len(usernames)} usernames with {len(proxies)} proxies...")
+            self.status_label.setText(f"🔄 Checking {total or 'variant'} usernames with {len(proxies)} proxies...")
         else:
-            self.status_label.setText(f"🔄 Checking {len(usernames)} usernames (no proxies - may be slower)...")
+            self.status_label.setText(f"🔄 Checking {total or 'variant'} usernames (no proxies - may be slower)...")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
 
-        self.thread = Checker(usernames, token, ua, check_mode, proxies, debug)
-        self.thread.update.connect(self.update_text)
-        self.thread.pupdate.connect(self.update_progress)
-        self.thread.finished.connect(self.checking_finished)
-        self.thread.start()
+        checker = Checker(usernames, token, ua, check_mode, proxies, debug, max_hits)
+        checker.journal = journal
+        checker.service = engine_service()  # Same loop and connections as the other runs
+        webhook_url = self.webhook_input.text().strip()
+        if webhook_url:
+            checker.notifier = WebhookNotifier(webhook_url, debug)
+        sink = make_sink(self.export_combo.currentText(), "discord")
+        if sink:
+            checker.sinks.append(sink)
+        self.jobs.add(checker, total)
+        return True
 
     def stop_clicked(self):
-        if self.thread:
-            self.thread.stop()
-            self.thread.quit()
-            self.thread.wait(2000)
+        self.jobs.stop_all()
         self.checking_finished()
 
+    def job_started(self, job):
+        """A queued run is starting, the progress bar and live stats follow the newest one"""
+        if self.jobs_idle:
+            self.results.clear()
+            self.jobs_idle = False
+        self.thread = job.checker
+        self.thread.batch.connect(self.update_batch)
+        self.progress_bar.setMaximum(job.total)
+        self.progress_bar.setValue(0)
+        self.results.metrics.watch(self.thread)
+        self.stop_button.setEnabled(True)
+        self.queue_button.setEnabled(True)
+        self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
+
     def checking_finished(self):
-        self.start_button.setEnabled(True)
+        self.jobs_idle = True
+        self.resume_button.setEnabled(True)
         self.stop_button.setEnabled(False)
+        self.queue_button.setEnabled(False)
         self.status_label.setText("✅ Checking complete!")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
 
     def update_text(self, text):
-        self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
+        self.results.log(text)
+
+    def update_batch(self, rows, lines, progress):
+        self.results.add_rows(rows)
+        self.results.log_lines(lines)
+        if progress >= 0 and self.sender() is self.thread:
+            self.update_progress(progress)
 
     def update_progress(self, value):
         self.progress_bar.setValue(value)
         total = self.progress_bar.maximum()
+        if total == 0:
+            # Open-ended run (variant search) - no known total
+            self.status_label.setText(f"🔄 Checked: {value}")
+            return
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"🔄 Progress: {value}/{total} ({percent}%)")
 
+    def queue_more_clicked(self):
+        names = self.get_usernames()
+        if not names or not self.thread or not self.thread.isRunning():
+            return
+        
+        self.thread.add_candidates(names)
+        if self.progress_bar.maximum() > 0:
+            self.progress_bar.setMaximum(self.progress_bar.maximum() + len(names))
+        self.input_text.clear()
+        self.update_text(f"➕ Queued {len(names)} more usernames")
+
+    def get_stop_after(self):
+        try:
+            return max(0, int(self.stop_after_input.text()))
+        except:
+            return 0
+
     def get_usernames(self):
         txt = self.input_text.toPlainText().strip()
         usernames = []
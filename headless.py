@@ -0,0 +1,115 @@
+"""Run a checker from the terminal, no window needed.
+
+    python headless.py tiktok names.txt --stop-after 5 --save CSV
+    python headless.py instagram - --sessionid ... < names.txt
+    python headless.py tiktok names.txt --record runs/monday
+    python headless.py tiktok names.txt --replay runs/monday --speed 0
+    python headless.py instagram names.txt --sessionid ... --archive pages/
+"""
+import sys, time, argparse
+from collections import Counter
+from name_generator import score_name
+from checker_engine import CandidateQueue
+from results_view import ResultsModel
+from sinks import SINKS, make_sink
+from notifier import WebhookNotifier
+from cassette import Cassette
+from archive import PageArchive
+
+UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+PLATFORMS = ("instagram", "tiktok", "discord", "roblox")
+
+def read_lines(path):
+    f = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    with f:
+        return [line.strip() for line in f if line.strip()]
+
+def make_checker(args, names):
+    """The platform's Checker, built the same way its GUI does"""
+    if args.platform == "instagram":
+        from ig_checker import Checker
+        if not args.sessionid:
+            sys.exit("Instagram needs --sessionid")
+        return Checker(names, args.sessionid, UA, args.debug, args.stop_after)
+    if args.platform == "tiktok":
+        from tiktok_checker import Checker
+        return Checker(names, UA, args.debug, args.stop_after)
+    if args.platform == "discord":
+        from discord_checker import Checker
+        mode = "legacy" if args.legacy else "pomelo"
+        if mode == "legacy" and not args.token:
+            sys.exit("Legacy mode needs --token")
+        proxies = read_lines(args.proxies) if args.proxies else []
+        return Checker(names, args.token, UA, mode, proxies, args.debug, args.stop_after)
+    from roblox_checker_gui import Checker
+    return Checker(names, args.debug, False, None, args.stop_after)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check usernames without the GUI")
+    parser.add_argument("platform", choices=PLATFORMS)
+    parser.add_argument("names", help="file with one name per line, - for stdin")
+    parser.add_argument("--sessionid", help="Instagram sessionid cookie")
+    parser.add_argument("--token", help="Discord token (legacy mode)")
+    parser.add_argument("--legacy", action="store_true", help="Discord legacy usernames instead of pomelo")
+    parser.add_argument("--proxies", help="Discord proxy file, one per line")
+    parser.add_argument("--stop-after", type=int, default=0, metavar="N", help="stop after N available (0 = check all)")
+    parser.add_argument("--best-first", action="store_true", help="check the best names first")
+    parser.add_argument("--save", choices=sorted(SINKS), help="write results to the results/ folder")
+    parser.add_argument("--webhook", help="Discord webhook for available names")
+    parser.add_argument("--rechecks", type=int, default=1, metavar="N", help="check UNCLEAR/failed names again N times at the end (0 = off)")
+    parser.add_argument("--trace-every", type=int, default=1, metavar="N", help="stage-trace 1 in N checks (0 = off)")
+    parser.add_argument("--metrics-port", type=int, default=0, metavar="PORT", help="serve Prometheus metrics on this port")
+    parser.add_argument("--record", metavar="DIR", help="save every response to a cassette in DIR")
+    parser.add_argument("--replay", metavar="DIR", help="answer from the cassette in DIR instead of the network")
+    parser.add_argument("--speed", type=float, default=1.0, metavar="X", help="replay X times faster (0 = no waiting)")
+    parser.add_argument("--archive", metavar="DIR", help="keep Instagram/TikTok pages in DIR for reclassify.py")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+    if args.record and args.replay:
+        parser.error("--record and --replay don't mix")
+
+    names = read_lines(args.names)
+    queue = CandidateQueue(names, score=score_name if args.best_first else None)
+    checker = make_checker(args, queue)
+    checker.trace_every = args.trace_every
+    checker.rechecks = args.rechecks
+    checker.metrics_port = args.metrics_port
+    if args.record:
+        checker.cassette = Cassette(args.record, "record")
+    elif args.replay:
+        checker.cassette = Cassette(args.replay, "replay", args.speed)
+    if args.archive:
+        checker.archive = PageArchive(args.archive)
+    if args.save:
+        checker.sinks.append(make_sink(args.save, args.platform))
+    if args.webhook:
+        checker.notifier = WebhookNotifier(args.webhook, args.debug)
+
+    verdicts = Counter()
+
+    def on_batch(rows, lines, progress):
+        for line in lines:
+            print(line)
+        for result in rows:
+            verdicts[result.verdict.label] += 1
+            print(result.text(ResultsModel.ICONS.get(result.verdict, "⚠️")))
+
+    checker.batch.connect(on_batch)
+    started = time.perf_counter()
+    try:
+        checker.run()  # Straight on this thread, no Qt event loop needed
+    except KeyboardInterrupt:
+        pass  # run() already stopped the checker and closed everything
+    elapsed = time.perf_counter() - started
+
+    total = sum(verdicts.values())
+    print(f"\n{'='*60}")
+    print(f"Checked {total} names in {elapsed:.1f}s ({total / elapsed if elapsed else 0:.2f}/s)")
+    for label, n in verdicts.most_common():
+        print(f"  {label:<18}{n}")
+    snap = checker.stats.snapshot()  # The per-stage breakdown was logged by the checker
+    if snap["checked"]:
+        print(f"Latency p50/p95/p99: {snap['p50'] * 1000:.0f} / {snap['p95'] * 1000:.0f} / {snap['p99'] * 1000:.0f} ms")
+
+if __name__ == "__main__":
+    main()
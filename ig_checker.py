@@ -1,37 +1,227 @@
 import sys, aiohttp, asyncio, random, string, re, json
+from urllib.parse import urlsplit
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
+from name_generator import get_model, iter_variants, score_name, VALIDATORS
+from checker_engine import BaseChecker, CandidateQueue, engine_service
+from results_view import ResultsView
+from job_queue import JobQueue
+from records import Verdict, Reason
+from classify_cache import ClassifierCache
+from journal import Journal
+from sinks import SINKS, make_sink
+from notifier import WebhookNotifier, send_test
+
+# ------------------- Page Classifier ------------------- #
+def classify_page(username, status, final_url, body, log=None):
+    """(verdict, reason, detail) for a fetched profile page. No network, no state,
+    so it can be benchmarked and re-run on saved pages. `log` gets the [DEBUG] lines.
+
+    Scans past an anchor are capped ({0,500} instead of *) so an oversized or
+    hostile page costs time in proportion to its size, bench/regex_stress.py checks it.
+    """
+    body_lower = body.lower()
+    name = re.escape(username)  # IG names have dots, which are regex wildcards
+
+    # ===== CLEAR SIGNALS =====
+
+    # 1. Explicit 404 status = AVAILABLE
+    if status == 404:
+        return Verdict.AVAILABLE, Reason.HTTP_404, None
+
+    # 2. Rate limited, or the site itself is having trouble (both get retried)
+    if status == 429:
+        return Verdict.RATE_LIMIT, Reason.SLOW_DOWN, None
+    if status >= 500:
+        return Verdict.CONNECTION_ERROR, Reason.SERVER_ERROR, None
+
+    # 3. Blocked or forbidden
+    if status in [400, 403]:
+        return Verdict.BLOCKED, Reason.BLOCKED_SESSION, None
+
+    # 4. Redirected to the login page = session expired (the path, the profile URL has the name in it)
+    if urlsplit(final_url).path.lower().startswith('/accounts/login'):
+        return Verdict.SESSION_EXPIRED, Reason.RELOGIN, None
+
+    # ===== ANALYZE BODY CONTENT =====
+
+    # Check for explicit "page not found" signals
+    not_found_signals = [
+        '"HttpError":{"statusCode":404',  # JSON error object
+        'page_not_found',  # Page type
+        '"PageNotFound"',  # React component
+        'Sorry, this page isn\'t available',  # Error message
+        '"status_code":404'  # Alternative error format
+    ]
+
+    found_not_found = False
+    for signal in not_found_signals:
+        if signal.lower() in body_lower:
+            if log:
+                log(f"[DEBUG] Found NOT FOUND signal: {signal}")
+            found_not_found = True
+            break
+
+    if found_not_found:
+        return Verdict.AVAILABLE, Reason.NOT_FOUND_SIGNAL, None
+
+    # Check for profile existence signals
+    # These indicate a REAL, ACTIVE profile (not just placeholder data)
+    profile_signals = {
+        'has_real_user_id': False,
+        'has_follower_count': False,
+        'has_following_count': False,
+        'has_post_count': False,
+        'has_profile_pic': False,
+        'has_biography_content': False,
+        'has_username_match': False
+    }
+
+    # User ID check - but verify it's actually in a user object, not just random
+    # Real profiles have user data in specific structures
+    # (There was a "ProfilePage"... fallback here, but it ends in this same pattern so it could never match)
+    user_id_match = re.search(r'"user"[:\s]*{[^}]{0,500}"id"[:\s]*"(\d{5,})"', body)
+
+    if user_id_match:
+        user_id = user_id_match.group(1)
+        # Check if this user ID appears with the username (strong signal)
+        if re.search(rf'"username"[:\s]*"{name}"[^}}]{{0,500}}"id"[:\s]*"{user_id}"', body, re.IGNORECASE):
+            profile_signals['has_real_user_id'] = True
+            if log:
+                log(f"[DEBUG] ✓ Found REAL user ID linked to username: {user_id}")
+        elif log:
+            log(f"[DEBUG] ✗ Found user ID {user_id} but NOT linked to this username (likely placeholder)")
+
+    # Username appears in the user data (strong signal it's real)
+    if re.search(rf'"username"[:\s]*"{name}"', body, re.IGNORECASE):
+        profile_signals['has_username_match'] = True
+        if log:
+            log(f"[DEBUG] ✓ Username '{username}' found in user data")
+
+    # Follower count structure
+    if re.search(r'"edge_followed_by"[:\s]*{[^}]{0,500}"count"[:\s]*\d+', body):
+        profile_signals['has_follower_count'] = True
+        if log:
+            match = re.search(r'"edge_followed_by"[:\s]*{[^}]{0,500}"count"[:\s]*(\d+)', body)
+            if match:
+                log(f"[DEBUG] ✓ Found follower count: {match.group(1)}")
+
+    # Following count structure
+    if re.search(r'"edge_follow"[:\s]*{[^}]{0,500}"count"[:\s]*\d+', body):
+        profile_signals['has_following_count'] = True
+        if log:
+            log(f"[DEBUG] ✓ Found following count")
+
+    # Post count
+    if re.search(r'"edge_owner_to_timeline_media"[:\s]*{[^}]{0,500}"count"[:\s]*\d+', body):
+        profile_signals['has_post_count'] = True
+        if log:
+            log(f"[DEBUG] ✓ Found post count")
+
+    # Profile picture with actual URL (not default)
+    if re.search(r'"profile_pic_url"[:\s]*"https://[^"]{1,500}scontent[^"]{0,1000}"', body):
+        profile_signals['has_profile_pic'] = True
+        if log:
+            log(f"[DEBUG] ✓ Found profile pic URL")
+
+    # Biography with actual content (not empty string)
+    bio_match = re.search(r'"biography"[:\s]*"([^"]{1,1000})"', body)
+    if bio_match and bio_match.group(1).strip():
+        profile_signals['has_biography_content'] = True
+        if log:
+            bio_preview = bio_match.group(1)[:50]
+            log(f"[DEBUG] ✓ Found biography with content: {bio_preview}...")
+    elif log:
+        log(f"[DEBUG] ✗ Biography field empty or not found")
+
+    # Count how many profile signals we found
+    signal_count = sum(profile_signals.values())
+
+    if log:
+        log(f"[DEBUG] Profile signals found: {signal_count}/7")
+        log(f"[DEBUG] Signals: {profile_signals}")
+
+    # Decision logic - STRICTER:
+    # Must have username match + real user ID to be considered taken
+    # OR have multiple strong signals (follower counts, posts, pic)
+
+    if profile_signals['has_username_match'] and profile_signals['has_real_user_id']:
+        return Verdict.TAKEN, Reason.USER_ID_CONFIRMED, None
+
+    if signal_count >= 4:
+        return Verdict.TAKEN, Reason.STRONG_SIGNALS, signal_count
+
+    # Has follower/following/post counts = likely real
+    engagement_signals = (
+        profile_signals['has_follower_count'] + 
+        profile_signals['has_following_count'] + 
+        profile_signals['has_post_count']
+    )
+    if engagement_signals >= 2 and profile_signals['has_profile_pic']:
+        return Verdict.TAKEN, Reason.ENGAGEMENT, None
+
+    # Additional check: Look for the username in the page title or meta
+    username_in_meta = False
+    title_match = re.search(r'<title>([^<]+)</title>', body, re.IGNORECASE)
+    if title_match:
+        title = title_match.group(1)
+        # Check if it's a real profile title (has @username or posts/followers)
+        if username.lower() in title.lower() and ('posts' in title.lower() or 'followers' in title.lower() or f'@{username}' in title.lower()):
+            username_in_meta = True
+            if log:
+                log(f"[DEBUG] ✓ Username found in profile title: {title}")
+        elif log:
+            log(f"[DEBUG] ✗ Title doesn't indicate real profile: {title}")
+
+    if username_in_meta and signal_count >= 2:
+        return Verdict.TAKEN, Reason.TITLE_SIGNALS, signal_count
+
+    # If we get here with very few signals, it's likely available
+    if signal_count <= 1:
+        return Verdict.AVAILABLE, Reason.NO_PROFILE_DATA, None
+
+    # Low signal count = probably available (just has placeholder data)
+    if signal_count == 2 and not profile_signals['has_username_match']:
+        return Verdict.AVAILABLE, Reason.PLACEHOLDER_ONLY, None
+
+    # Edge case: Some signals but unclear
+    return Verdict.UNCLEAR, Reason.MANUAL_CHECK, signal_count
+
+def classify_api(status, data):
+    """(verdict, reason, detail) from the web_profile_info API, used for rechecks.
+    Slower to get than the page but it says outright whether the user exists.
+    """
+    if status == 429:
+        return Verdict.RATE_LIMIT, Reason.SLOW_DOWN, None
+    if status >= 500:
+        return Verdict.CONNECTION_ERROR, Reason.SERVER_ERROR, None
+    if status == 404:
+        return Verdict.AVAILABLE, Reason.HTTP_404, None
+    if status in (401, 403):
+        return Verdict.BLOCKED, Reason.BLOCKED_SESSION, None
+    if status != 200 or not isinstance(data, dict):
+        return Verdict.UNCLEAR, Reason.HTTP_STATUS, None
+    user = (data.get("data") or {}).get("user")
+    if isinstance(user, dict) and user.get("id"):
+        return Verdict.TAKEN, Reason.USER_FOUND, (user["id"], user.get("full_name") or user.get("username", ""))
+    return Verdict.AVAILABLE, Reason.NO_PROFILE_DATA, None
 
 # ------------------- Checker Thread ------------------- #
-class Checker(QThread):
-    update = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count = 0
-
+class Checker(BaseChecker):
+    platform = "instagram"
     BASE_URL = "https://www.instagram.com/{}/"
+    API_URL = "https://www.instagram.com/api/v1/users/web_profile_info/?username={}"
+    APP_ID = "936619743392459"  # The web app's id, the API answers 400 without it
+    concurrency = 2  # Max 2 concurrent requests
+    delay = 2  # Increased delay to avoid rate limits
 
-    def __init__(self, usernames, sessionid, user_agent, debug=False):
-        super().__init__()
-        self.usernames = usernames
+    def __init__(self, usernames, sessionid, user_agent, debug=False, max_hits=0):
+        super().__init__(usernames, debug, max_hits)
         self.sessionid = sessionid
         self.user_agent = user_agent
-        self.running = True
-        self.debug = debug
-        self.consecutive_errors = 0  # Track errors in a row
         self.rate_limit_count = 0  # Track rate limits
-        self.max_errors_before_pause = 3  # Pause after 3 errors in a row
-
-    def run(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self.main())
-        finally:
-            loop.close()
-
-    def stop(self):
-        self.running = False
+        self.classify = ClassifierCache(classify_page, counters=self.counters)  # Template pages skip the analysis
 
     async def check_user(self, username, sem, session, lock, idx):
         if not self.running:
@@ -39,6 +229,10 @@ class Checker(QThread):
 
         async with sem:
             try:
+                if self.thorough:
+                    await self.check_api(username, session)
+                    return
+
                 url = self.BASE_URL.format(username)
                 
                 async with session.get(url, allow_redirects=True, timeout=20) as resp:
@@ -47,238 +241,51 @@ class Checker(QThread):
                     # Read the response
                     try:
                         body = await resp.text(errors='ignore')
-                        body_lower = body.lower()
                     except Exception as e:
-                        self.update.emit(f"⚠️ [ERROR] {username}: Could not read response")
+                        self.report(username, Verdict.ERROR, Reason.UNREADABLE, status=status)
                         return
                     
                     # Debug mode - show raw indicators
                     if self.debug:
-                        self.update.emit(f"\n{'='*60}")
-                        self.update.emit(f"[DEBUG] Checking: {username}")
-                        self.update.emit(f"[DEBUG] Status Code: {status}")
-                        self.update.emit(f"[DEBUG] Final URL: {resp.url}")
-                        self.update.emit(f"[DEBUG] Body Length: {len(body)} chars")
-                    
-                    # ===== CLEAR SIGNALS =====
-                    
-                    # 1. Explicit 404 status = AVAILABLE
-                    if status == 404:
-                        self.update.emit(f"✅ [AVAILABLE] {username} (404 status)")
-                        return
-                    
-                    # 2. Rate limited
-                    if status == 429:
-                        self.update.emit(f"⚠️ [RATE LIMIT] {username}: Slow down!")
-                        await asyncio.sleep(5)
-                        return
-                    
-                    # 3. Blocked or forbidden
-                    if status in [400, 403]:
-                        self.consecutive_errors += 1
-                        self.update.emit(f"⚠️ [BLOCKED] {username}: Status {status} - Check session/IP")
-                        await self.check_for_cooldown()
-                        return
-                    
-                    # 4. Redirected to login = session expired
-                    if 'login' in str(resp.url).lower():
-                        self.update.emit(f"❌ [SESSION EXPIRED] {username}: Re-enter sessionid")
-                        return
-                    
-                    # ===== ANALYZE BODY CONTENT =====
-                    
-                    # Check for explicit "page not found" signals
-                    not_found_signals = [
-                        '"HttpError":{"statusCode":404',  # JSON error object
-                        'page_not_found',  # Page type
-                        '"PageNotFound"',  # React component
-                        'Sorry, this page isn\'t available',  # Error message
-                        '"status_code":404'  # Alternative error format
-                    ]
-                    
-                    found_not_found = False
-                    for signal in not_found_signals:
-                        if signal.lower() in body_lower:
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] Found NOT FOUND signal: {signal}")
-                            found_not_found = True
-                            break
-                    
-                    if found_not_found:
-                        self.update.emit(f"✅ [AVAILABLE] {username} (not found signal)")
-                        return
-                    
-                    # Check for profile existence signals
-                    # These indicate a REAL, ACTIVE profile (not just placeholder data)
-                    profile_signals = {
-                        'has_real_user_id': False,
-                        'has_follower_count': False,
-                        'has_following_count': False,
-                        'has_post_count': False,
-                        'has_profile_pic': False,
-                        'has_biography_content': False,
-                        'has_username_match': False
-                    }
-                    
-                    # User ID check - but verify it's actually in a user object, not just random
-                    # Real profiles have user data in specific structures
-                    user_id_match = re.search(r'"user"[:\s]*{[^}]*"id"[:\s]*"(\d{5,})"', body)
-                    if not user_id_match:
-                        user_id_match = re.search(r'"ProfilePage"[^}]*"user"[:\s]*{[^}]*"id"[:\s]*"(\d{5,})"', body, re.DOTALL)
-                    
-                    if user_id_match:
-                        user_id = user_id_match.group(1)
-                        # Check if this user ID appears with the username (strong signal)
-                        if re.search(rf'"username"[:\s]*"{username}"[^}}]*"id"[:\s]*"{user_id}"', body, re.IGNORECASE):
-                            profile_signals['has_real_user_id'] = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Found REAL user ID linked to username: {user_id}")
-                        elif self.debug:
-                            self.update.emit(f"[DEBUG] ✗ Found user ID {user_id} but NOT linked to this username (likely placeholder)")
-                    
-                    # Username appears in the user data (strong signal it's real)
-                    if re.search(rf'"username"[:\s]*"{username}"', body, re.IGNORECASE):
-                        profile_signals['has_username_match'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Username '{username}' found in user data")
-                    
-                    # Follower count structure
-                    if re.search(r'"edge_followed_by"[:\s]*{[^}]*"count"[:\s]*\d+', body):
-                        profile_signals['has_follower_count'] = True
-                        if self.debug:
-                            match = re.search(r'"edge_followed_by"[:\s]*{[^}]*"count"[:\s]*(\d+)', body)
-                            if match:
-                                self.update.emit(f"[DEBUG] ✓ Found follower count: {match.group(1)}")
-                    
-                    # Following count structure
-                    if re.search(r'"edge_follow"[:\s]*{[^}]*"count"[:\s]*\d+', body):
-                        profile_signals['has_following_count'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Found following count")
-                    
-                    # Post count
-                    if re.search(r'"edge_owner_to_timeline_media"[:\s]*{[^}]*"count"[:\s]*\d+', body):
-                        profile_signals['has_post_count'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Found post count")
-                    
-                    # Profile picture with actual URL (not default)
-                    if re.search(r'"profile_pic_url"[:\s]*"https://[^"]+scontent[^"]*"', body):
-                        profile_signals['has_profile_pic'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Found profile pic URL")
-                    
-                    # Biography with actual content (not empty string)
-                    bio_match = re.search(r'"biography"[:\s]*"([^"]+)"', body)
-                    if bio_match and bio_match.group(1).strip():
-                        profile_signals['has_biography_content'] = True
-                        if self.debug:
-                            bio_preview = bio_match.group(1)[:50]
-                            self.update.emit(f"[DEBUG] ✓ Found biography with content: {bio_preview}...")
-                    elif self.debug:
-                        self.update.emit(f"[DEBUG] ✗ Biography field empty or not found")
-                    
-                    # Count how many profile signals we found
-                    signal_count = sum(profile_signals.values())
-                    
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] Profile signals found: {signal_count}/7")
-                        self.update.emit(f"[DEBUG] Signals: {profile_signals}")
-                    
-                    # Decision logic - STRICTER:
-                    # Must have username match + real user ID to be considered taken
-                    # OR have multiple strong signals (follower counts, posts, pic)
-                    
-                    if profile_signals['has_username_match'] and profile_signals['has_real_user_id']:
-                        self.update.emit(f"❌ [TAKEN] {username} (username + user_id confirmed)")
-                        return
-                    
-                    if signal_count >= 4:
-                        self.update.emit(f"❌ [TAKEN] {username} ({signal_count} strong signals)")
-                        return
-                    
-                    # Has follower/following/post counts = likely real
-                    engagement_signals = (
-                        profile_signals['has_follower_count'] + 
-                        profile_signals['has_following_count'] + 
-                        profile_signals['has_post_count']
-                    )
-                    if engagement_signals >= 2 and profile_signals['has_profile_pic']:
-                        self.update.emit(f"❌ [TAKEN] {username} (engagement data present)")
-                        return
-                    
-                    # Additional check: Look for the username in the page title or meta
-                    username_in_meta = False
-                    title_match = re.search(r'<title>([^<]+)</title>', body, re.IGNORECASE)
-                    if title_match:
-                        title = title_match.group(1)
-                        # Check if it's a real profile title (has @username or posts/followers)
-                        if username.lower() in title.lower() and ('posts' in title.lower() or 'followers' in title.lower() or f'@{username}' in title.lower()):
-                            username_in_meta = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Username found in profile title: {title}")
-                        elif self.debug:
-                            self.update.emit(f"[DEBUG] ✗ Title doesn't indicate real profile: {title}")
-                    
-                    if username_in_meta and signal_count >= 2:
-                        self.update.emit(f"❌ [TAKEN] {username} (profile title + {signal_count} signals)")
-                        return
-                    
-                    # If we get here with very few signals, it's likely available
-                    if signal_count <= 1:
-                        self.consecutive_errors = 0  # Reset on success
-                        self.update.emit(f"✅ [AVAILABLE] {username} (no real profile data)")
-                        return
-                    
-                    # Low signal count = probably available (just has placeholder data)
-                    if signal_count == 2 and not profile_signals['has_username_match']:
-                        self.consecutive_errors = 0  # Reset on success
-                        self.update.emit(f"✅ [AVAILABLE] {username} (only placeholder data)")
-                        return
-                    
-                    # Edge case: Some signals but unclear
-                    self.consecutive_errors = 0  # Reset on success
-                    self.update.emit(f"❓ [UNCLEAR] {username} ({signal_count} signals - manual check recommended)")
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] URL for manual check: {url}")
-                    
+                        self.log(f"\n{'='*60}")
+                        self.log(f"[DEBUG] Checking: {username}")
+                        self.log(f"[DEBUG] Status Code: {status}")
+                        self.log(f"[DEBUG] Final URL: {resp.url}")
+                        self.log(f"[DEBUG] Body Length: {len(body)} chars")
+                    
+                    verdict, reason, detail = self.classify(username, status, str(resp.url), body, self.log if self.debug else None)
+                    self.report(username, verdict, reason, detail, status=status)
+                    self.keep_page(username, status, str(resp.url), body, verdict, reason)
+                    if verdict == Verdict.RATE_LIMIT:
+                        self.back_off(5)
+                    if verdict == Verdict.UNCLEAR and self.debug:
+                        self.log(f"[DEBUG] URL for manual check: {url}")
+                    
+            except aiohttp.ClientConnectionError:
+                self.report(username, Verdict.CONNECTION_ERROR, Reason.UNREACHABLE, "Instagram")  # Retried by the engine
             except asyncio.TimeoutError:
-                self.consecutive_errors += 1
-                self.update.emit(f"⏱️ [TIMEOUT] {username}")
-                await self.check_for_cooldown()
+                self.report(username, Verdict.TIMEOUT)
             except Exception as e:
-                self.consecutive_errors += 1
                 error_msg = str(e)[:80]
-                self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
-                await self.check_for_cooldown()
-            finally:
-                async with lock:
-                    self.count += 1
-                self.pupdate.emit(self.count)
-
-    async def check_for_cooldown(self):
-        """Check if we need to pause due to consecutive errors"""
-        if self.consecutive_errors >= self.max_errors_before_pause:
-            await self.cooldown(15, f"{self.consecutive_errors} errors in a row")
-            self.consecutive_errors = 0  # Reset counter after cooldown
-
-    async def cooldown(self, duration, reason):
-        """Pause checking for a specified duration"""
-        self.update.emit(f"\n🛑 COOLDOWN: {reason}!")
-        self.update.emit(f"⏸️  Pausing for {duration} seconds to avoid being blocked...")
-        
-        for remaining in range(duration, 0, -1):
-            if not self.running:  # Allow user to stop during cooldown
-                break
-            self.update.emit(f"⏳ Resuming in {remaining} seconds...")
-            await asyncio.sleep(1)
-        
-        self.update.emit(f"✅ Cooldown complete! Continuing...\n")
-
-    async def main(self):
-        sem = asyncio.Semaphore(2)  # Max 2 concurrent requests
-        lock = asyncio.Lock()
+                self.report(username, Verdict.ERROR, Reason.EXCEPTION, error_msg)
 
+    async def check_api(self, username, session):
+        """Recheck through the profile API instead of reading the page"""
+        headers = {"X-IG-App-ID": self.APP_ID, "Accept": "application/json"}
+        async with session.get(self.API_URL.format(username), headers=headers, allow_redirects=False, timeout=20) as resp:
+            status = resp.status
+            try:
+                data = await resp.json(content_type=None) if status == 200 else None
+            except ValueError:
+                data = None  # HTML instead of JSON, a login or challenge page
+        if self.debug:
+            self.log(f"[DEBUG] Profile API for {username}: {status}")
+        verdict, reason, detail = classify_api(status, data)
+        self.report(username, verdict, reason, detail, status=status)
+        if verdict == Verdict.RATE_LIMIT:
+            self.back_off(5)
+
+    def create_session(self):
         headers = {
             "User-Agent": self.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -292,15 +299,12 @@ class Checker(QThread):
             "Sec-Fetch-Site": "none"
         }
 
-        connector = aiohttp.TCPConnector(limit=2, ssl=True)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ssl=True)
         timeout = aiohttp.ClientTimeout(total=30)
-        
-        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
-            for i, username in enumerate(self.usernames):
-                if not self.running:
-                    break
-                await self.check_user(username, sem, session, lock, i)
-                await asyncio.sleep(2)  # Increased delay to avoid rate limits
+        return aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout, trace_configs=[self.trace_config])
+
+    def session_key(self):
+        return (self.sessionid, self.user_agent, self.concurrency)
 
 # ------------------- GUI App ------------------- #
 class App(QMainWindow):
@@ -308,7 +312,8 @@ class App(QMainWindow):
         super().__init__()
         self.setWindowTitle("Instagram Username Checker - Improved")
         self.setGeometry(150, 150, 1100, 800)
-        self.thread = None
+        self.thread = None  # Checker the progress bar follows, the newest running one
+        self.jobs_idle = True
         self.initUI()
 
     def initUI(self):
@@ -393,7 +398,8 @@ class App(QMainWindow):
             "Numbers + Letters (12ab)",
             "Letters_Letters (abc_def)",
             "Prefix_Letters (og_abc)",
-            "Letters_Suffix (abc_og)"
+            "Letters_Suffix (abc_og)",
+            "Pronounceable (brelo)"
         ])
         self.pattern_combo.setMaximumWidth(200)
         row2.addWidget(self.pattern_combo)
@@ -410,9 +416,48 @@ class App(QMainWindow):
         row2.addStretch()
         gen_layout.addLayout(row2)
         
+        # Third row - closest available variants of a taken name
+        row3 = QHBoxLayout()
+        row3.addWidget(QLabel("Variants of:"))
+        self.variant_input = QLineEdit()
+        self.variant_input.setPlaceholderText("e.g., shadow")
+        self.variant_input.setMaximumWidth(150)
+        row3.addWidget(self.variant_input)
+        
+        row3.addWidget(QLabel("Find:"))
+        self.variant_count_input = QLineEdit("3")
+        self.variant_count_input.setMaximumWidth(60)
+        row3.addWidget(self.variant_count_input)
+        
+        self.variant_button = QPushButton("🔎 Find Closest Available")
+        self.variant_button.setToolTip("Check variants of the name, closest first, until this many are available")
+        self.variant_button.clicked.connect(self.variants_clicked)
+        self.variant_button.setStyleSheet("background-color: #2196F3; color: white; padding: 8px; font-weight: bold;")
+        row3.addWidget(self.variant_button)
+        
+        row3.addStretch()
+        gen_layout.addLayout(row3)
+        
         gen_group.setLayout(gen_layout)
         main_layout.addWidget(gen_group)
 
+        # Webhook Section
+        webhook_group = QGroupBox("🔔 Discord Webhook (Optional)")
+        webhook_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        webhook_layout = QHBoxLayout()
+        
+        self.webhook_input = QLineEdit()
+        self.webhook_input.setPlaceholderText("https://discord.com/api/webhooks/... (get pinged when available names are found)")
+        webhook_layout.addWidget(self.webhook_input)
+        
+        test_webhook_btn = QPushButton("🧪 Test")
+        test_webhook_btn.setMaximumWidth(80)
+        test_webhook_btn.clicked.connect(self.test_webhook)
+        webhook_layout.addWidget(test_webhook_btn)
+        
+        webhook_group.setLayout(webhook_layout)
+        main_layout.addWidget(webhook_group)
+
         # Input/Output Section
         io_group = QGroupBox("Step 3: Check Usernames")
         io_group.setStyleSheet("QGroupBox { font-weight: bold; }")
@@ -432,39 +477,77 @@ class App(QMainWindow):
         output_box = QVBoxLayout()
         output_label = QLabel("📊 Results:")
         output_label.setStyleSheet("font-weight: bold;")
-        output_box.addWidget(output_label)
-        
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
-        self.output_text.setStyleSheet("background-color: #2b2b2b; color: #ffffff; font-family: Consolas, Monaco, monospace; padding: 10px;")
-        output_box.addWidget(self.output_text)
+        output_header = QHBoxLayout()
+        output_header.addWidget(output_label)
+        output_header.addStretch()
+        output_header.addWidget(QLabel("💾 Save to file:"))
+        self.export_combo = QComboBox()
+        self.export_combo.addItems(["Off"] + list(SINKS))
+        self.export_combo.setToolTip("Write every result to results/ as it comes in")
+        output_header.addWidget(self.export_combo)
+        output_box.addLayout(output_header)
+        
+        self.results = ResultsView()
+        self.results.log_view.setStyleSheet("background-color: #2b2b2b; color: #ffffff; font-family: Consolas, Monaco, monospace; padding: 10px;")
+        output_box.addWidget(self.results)
         
         io_layout.addLayout(input_box)
-        io_layout.addLayout(output_box)
+        io_layout.addLayout(output_box, 2)
         io_group.setLayout(io_layout)
         main_layout.addWidget(io_group)
 
         # Control Buttons
         btn_layout = QHBoxLayout()
         
+        btn_layout.addWidget(QLabel("Stop after:"))
+        self.stop_after_input = QLineEdit("0")
+        self.stop_after_input.setMaximumWidth(50)
+        self.stop_after_input.setToolTip("Stop the run once this many AVAILABLE names are found (0 = check everything)")
+        btn_layout.addWidget(self.stop_after_input)
+        btn_layout.addWidget(QLabel("available"))
+        
+        self.best_first_checkbox = QCheckBox("⭐ Best names first")
+        self.best_first_checkbox.setChecked(True)
+        self.best_first_checkbox.setToolTip("Check short, pronounceable, real-word names without digits before the rest")
+        btn_layout.addWidget(self.best_first_checkbox)
+        
         self.start_button = QPushButton("▶️ START CHECKING")
         self.start_button.clicked.connect(self.start_clicked)
         self.start_button.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 15px; font-size: 14px;")
         btn_layout.addWidget(self.start_button)
         
+        self.resume_button = QPushButton("♻️ Resume")
+        self.resume_button.clicked.connect(self.resume_clicked)
+        self.resume_button.setToolTip("Continue the last run that was stopped or crashed, skipping names already checked")
+        self.resume_button.setStyleSheet("padding: 15px;")
+        btn_layout.addWidget(self.resume_button)
+        
         self.stop_button = QPushButton("⏹️ STOP")
         self.stop_button.clicked.connect(self.stop_clicked)
         self.stop_button.setEnabled(False)
         self.stop_button.setStyleSheet("background-color: #f44336; color: white; font-weight: bold; padding: 15px; font-size: 14px;")
         btn_layout.addWidget(self.stop_button)
         
+        self.queue_button = QPushButton("➕ Queue More")
+        self.queue_button.clicked.connect(self.queue_more_clicked)
+        self.queue_button.setEnabled(False)
+        self.queue_button.setToolTip("Add the names in the input box to the running check")
+        self.queue_button.setStyleSheet("padding: 15px;")
+        btn_layout.addWidget(self.queue_button)
+        
         self.clear_button = QPushButton("🗑️ Clear Results")
-        self.clear_button.clicked.connect(lambda: self.output_text.clear())
+        self.clear_button.clicked.connect(self.results.clear)
         self.clear_button.setStyleSheet("padding: 15px;")
         btn_layout.addWidget(self.clear_button)
         
         main_layout.addLayout(btn_layout)
 
+        # Job Queue - START adds to it, runs start as soon as there's a free slot
+        self.jobs = JobQueue()
+        self.jobs.job_started.connect(self.job_started)
+        self.jobs.idle.connect(self.checking_finished)
+        main_layout.addWidget(self.jobs)
+
         # Progress Bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setStyleSheet("QProgressBar { text-align: center; height: 25px; }")
@@ -498,6 +581,10 @@ class App(QMainWindow):
 
         generated = []
         
+        if pattern == "Pronounceable (brelo)":
+            # Sample the whole batch from the Markov model up front
+            pronounceable = iter(get_model().sample(count, length, prefix))
+        
         for _ in range(count):
             username = ""
             
@@ -543,8 +630,12 @@ class App(QMainWindow):
                     # Fallback if no suffix
                     username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
             
+            elif pattern == "Pronounceable (brelo)":
+                # Markov-sampled letters that read like a real word
+                username = next(pronounceable)
+            
             # Add prefix and suffix if provided (for non-pattern modes)
-            if pattern in ["Letters only (abc)", "Letters + Numbers (a1b2)", "Numbers + Letters (12ab)"]:
+            if pattern in ["Letters only (abc)", "Letters + Numbers (a1b2)", "Numbers + Letters (12ab)", "Pronounceable (brelo)"]:
                 username = prefix + username + suffix
             
             # Instagram rule: Cannot end with underscore or dot
@@ -563,59 +654,162 @@ class App(QMainWindow):
         self.status_label.setText(f"✅ Generated {len(generated)} usernames")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
 
-    def start_clicked(self):
-        sessionid = self.sessionid_input.text().strip()
-        if not sessionid:
-            QMessageBox.warning(self, "Missing sessionid", "Please enter your Instagram sessionid first!")
+    def test_webhook(self):
+        webhook_url = self.webhook_input.text().strip()
+        
+        if not webhook_url:
+            QMessageBox.warning(self, "No Webhook", "Please enter a webhook URL first!")
             return
         
+        try:
+            status = asyncio.run(send_test(webhook_url, "instagram"))
+            
+            if status == 204:
+                QMessageBox.information(self, "Success", "✅ Webhook test successful!\nCheck your Discord channel.")
+            else:
+                QMessageBox.warning(self, "Failed", f"❌ Webhook test failed!\nStatus code: {status}")
+                
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"❌ Failed to send test message:\n{str(e)}")
+
+    def start_clicked(self):
         usernames = self.get_usernames()
         if not usernames:
             QMessageBox.warning(self, "No Usernames", "Please enter or generate usernames to check!")
             return
         
+        max_hits = self.get_stop_after()
+        score = score_name if self.best_first_checkbox.isChecked() else None
+        queue = CandidateQueue(usernames, score)
+        journal = Journal.create("instagram", names=usernames, max_hits=max_hits)
+        if self.start_checking(queue, len(usernames), max_hits, journal):
+            self.status_label.setText(f"🔄 Checking {len(usernames)} usernames...")
+
+    def variants_clicked(self):
+        seed = self.variant_input.text().strip().lower().lstrip('@')
+        if not seed:
+            QMessageBox.warning(self, "No Name", "Enter the taken name to search variants of!")
+            return
+        
+        try:
+            wanted = max(1, int(self.variant_count_input.text()))
+        except:
+            wanted = 3
+        
+        # Variants are generated lazily, closest first, until enough are available
+        variants = iter_variants(seed, VALIDATORS["instagram"])
+        journal = Journal.create("instagram", seed=seed, wanted=wanted)
+        if self.start_checking(variants, 0, max_hits=wanted, journal=journal):
+            self.status_label.setText(f"🔎 Searching variants of '{seed}' until {wanted} are available...")
+
+    def resume_clicked(self):
+        journal, state = Journal.resume("instagram")
+        if not journal:
+            QMessageBox.information(self, "Nothing to Resume", "No unfinished run found!")
+            return
+        
+        if state.mode == "variants":
+            # Same variant order as before, minus what's already checked
+            variants = (v for v in iter_variants(state.seed, VALIDATORS["instagram"]) if v not in state.done)
+            wanted = state.wanted - state.hits
+            if wanted <= 0:
+                QMessageBox.information(self, "Nothing to Resume", "That search already found enough names!")
+                return
+            if self.start_checking(variants, 0, wanted, journal):
+                self.status_label.setText(f"♻️ Resuming variants of '{state.seed}' ({state.hits} found, {len(state.done)} done)...")
+            return
+        
+        remaining = state.remaining()
+        max_hits = max(0, state.max_hits - state.hits) if state.max_hits else 0
+        score = score_name if self.best_first_checkbox.isChecked() else None
+        if self.start_checking(CandidateQueue(remaining, score), len(remaining), max_hits, journal):
+            self.status_label.setText(f"♻️ Resuming: {len(state.done)} already done, {len(remaining)} to go...")
+
+    def start_checking(self, usernames, total, max_hits=0, journal=None):
+        sessionid = self.sessionid_input.text().strip()
+        if not sessionid:
+            QMessageBox.warning(self, "Missing sessionid", "Please enter your Instagram sessionid first!")
+            return False
+        
         ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         debug = self.debug_checkbox.isChecked()
         
-        self.progress_bar.setMaximum(len(usernames))
-        self.progress_bar.setValue(0)
-        self.output_text.clear()
-        self.start_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
-        self.status_label.setText(f"🔄 Checking {len(usernames)} usernames...")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
 
-        self.thread = Checker(usernames, sessionid, ua, debug)
-        self.thread.update.connect(self.update_text)
-        self.thread.pupdate.connect(self.update_progress)
-        self.thread.finished.connect(self.checking_finished)
-        self.thread.start()
+        checker = Checker(usernames, sessionid, ua, debug, max_hits)
+        checker.journal = journal
+        checker.service = engine_service()  # Same loop and connections as the other runs
+        webhook_url = self.webhook_input.text().strip()
+        if webhook_url:
+            checker.notifier = WebhookNotifier(webhook_url, debug)
+        sink = make_sink(self.export_combo.currentText(), "instagram")
+        if sink:
+            checker.sinks.append(sink)
+        self.jobs.add(checker, total)
+        return True
 
     def stop_clicked(self):
-        if self.thread:
-            self.thread.stop()
-            self.thread.quit()
-            self.thread.wait(2000)
+        self.jobs.stop_all()
         self.checking_finished()
 
+    def job_started(self, job):
+        """A queued run is starting, the progress bar and live stats follow the newest one"""
+        if self.jobs_idle:
+            self.results.clear()
+            self.jobs_idle = False
+        self.thread = job.checker
+        self.thread.batch.connect(self.update_batch)
+        self.progress_bar.setMaximum(job.total)
+        self.progress_bar.setValue(0)
+        self.results.metrics.watch(self.thread)
+        self.stop_button.setEnabled(True)
+        self.queue_button.setEnabled(True)
+        self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
+
     def checking_finished(self):
-        self.start_button.setEnabled(True)
+        self.jobs_idle = True
+        self.resume_button.setEnabled(True)
         self.stop_button.setEnabled(False)
+        self.queue_button.setEnabled(False)
         self.status_label.setText("✅ Checking complete!")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
 
     def update_text(self, text):
-        self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
+        self.results.log(text)
+
+    def update_batch(self, rows, lines, progress):
+        self.results.add_rows(rows)
+        self.results.log_lines(lines)
+        if progress >= 0 and self.sender() is self.thread:
+            self.update_progress(progress)
 
     def update_progress(self, value):
         self.progress_bar.setValue(value)
         total = self.progress_bar.maximum()
+        if total == 0:
+            # Open-ended run (variant search) - no known total
+            self.status_label.setText(f"🔄 Checked: {value}")
+            return
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"🔄 Progress: {value}/{total} ({percent}%)")
 
+    def queue_more_clicked(self):
+        names = self.get_usernames()
+        if not names or not self.thread or not self.thread.isRunning():
+            return
+        
+        self.thread.add_candidates(names)
+        if self.progress_bar.maximum() > 0:
+            self.progress_bar.setMaximum(self.progress_bar.maximum() + len(names))
+        self.input_text.clear()
+        self.update_text(f"➕ Queued {len(names)} more usernames")
+
+    def get_stop_after(self):
+        try:
+            return max(0, int(self.stop_after_input.text()))
+        except:
+            return 0
+
     def get_usernames(self):
         txt = self.input_text.toPlainText().strip()
         usernames = []
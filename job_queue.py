@@ -0,0 +1,180 @@
+import itertools
+from PyQt5.QtWidgets import *
+from PyQt5.QtCore import *
+
+# ------------------- Jobs ------------------- #
+def describe(journal, total):
+    """Short label for a run, from what its journal says it is"""
+    header = journal.header if journal else None
+    if header and header.get("mode") == "variants":
+        return f"Variants of '{header['seed']}' until {header['wanted']} found"
+    if journal and header is None:
+        return f"Resumed run, {total} names left" if total else "Resumed variant search"
+    return f"{total} names" if total else "Variant search"
+
+class Job:
+    """One queued run: its Checker plus what the queue panel shows about it"""
+
+    def __init__(self, checker, label, total, seq):
+        self.checker = checker
+        self.label = label
+        self.total = total  # 0 = open-ended (variant search)
+        self.seq = seq
+        self.priority = 0  # Higher starts first
+        self.state = "queued"  # queued, running, paused, done, stopped
+
+    def progress(self):
+        count = self.checker.count
+        if self.state == "queued":
+            return "-"
+        if not self.total:
+            return f"{count} checked"
+        return f"{count}/{self.total} ({count * 100 // self.total}%)"
+
+# ------------------- Job Queue ------------------- #
+class JobQueue(QGroupBox):
+    """Runs waiting their turn, the next one starts as soon as a slot is free.
+
+    Highest priority first, then in the order they were added. With more than
+    one run at a time they run side by side on the EngineService and take
+    turns on the site, so the rate stays what one run would use and the site
+    is never left idle between runs.
+    """
+    REFRESH_MS = 1000
+    COLUMNS = ("Run", "Priority", "Progress", "State")
+    STATES = {"queued": "⏳ Queued", "running": "🔄 Running", "paused": "⏸️ Paused",
+              "done": "✅ Done", "stopped": "⏹️ Stopped"}
+
+    job_started = pyqtSignal(object)  # Job, emitted right before its checker starts
+    job_finished = pyqtSignal(object)  # Job
+    idle = pyqtSignal()  # Nothing running or queued anymore
+
+    def __init__(self, parent=None):
+        super().__init__("📋 Job Queue", parent)
+        self.jobs = []
+        self.seq = itertools.count()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 4, 6, 4)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setMaximumHeight(130)
+        layout.addWidget(self.table)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Run at once:"))
+        self.parallel = QSpinBox()
+        self.parallel.setRange(1, 4)
+        self.parallel.setToolTip("More than 1 runs them side by side, taking turns on the site")
+        self.parallel.valueChanged.connect(self.schedule)
+        controls.addWidget(self.parallel)
+        for text, slot, tip in (("⬆️", lambda: self.bump(1), "Start this one sooner"),
+                                ("⬇️", lambda: self.bump(-1), "Start this one later"),
+                                ("⏯️ Pause", self.pause_clicked, "Pause or resume the selected run"),
+                                ("✖️ Cancel", self.cancel_clicked, "Stop the selected run or take it off the queue"),
+                                ("🧹 Clear Done", self.clear_done, "Remove finished runs from the list")):
+            button = QPushButton(text)
+            button.setToolTip(tip)
+            button.clicked.connect(slot)
+            controls.addWidget(button)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def add(self, checker, total=0, label=None):
+        """Queue a Checker that hasn't been started yet, it starts when its turn comes"""
+        job = Job(checker, label or describe(checker.journal, total), total, next(self.seq))
+        self.jobs.append(job)
+        checker.finished.connect(lambda: self.finished(job))
+        self.schedule()
+        return job
+
+    def running(self):
+        return [job for job in self.jobs if job.state in ("running", "paused")]
+
+    def schedule(self):
+        running = self.running()
+        free = self.parallel.value() - len(running)  # A paused run keeps its slot, resuming never goes over
+        waiting = sorted((job for job in self.jobs if job.state == "queued"), key=lambda job: (-job.priority, job.seq))
+        for job in waiting[:max(0, free)]:
+            job.state = "running"
+            running.append(job)
+            self.job_started.emit(job)
+            job.checker.start()
+        if running:
+            self.timer.start(self.REFRESH_MS)
+        self.refresh()
+
+    def finished(self, job):
+        if job.state != "stopped":
+            job.state = "done" if job.checker.completed else "stopped"
+        self.job_finished.emit(job)
+        self.schedule()
+        if not self.running() and not any(job.state == "queued" for job in self.jobs):
+            self.timer.stop()
+            self.idle.emit()
+
+    def stop_all(self):
+        """Take everything off the queue and stop what's running"""
+        for job in self.jobs:
+            if job.state == "queued":
+                job.state = "stopped"
+            elif job.state in ("running", "paused"):
+                job.state = "stopped"
+                job.checker.stop()
+        self.refresh()
+
+    def selected(self):
+        rows = self.table.selectionModel().selectedRows()
+        return self.jobs[rows[0].row()] if rows else None
+
+    def bump(self, step):
+        job = self.selected()
+        if job and job.state == "queued":
+            job.priority += step
+            self.refresh()
+
+    def pause_clicked(self):
+        job = self.selected()
+        if not job:
+            return
+        if job.state == "running":
+            job.state = "paused"
+            job.checker.pause()
+        elif job.state == "paused":
+            job.state = "running"
+            job.checker.resume()
+        self.refresh()
+
+    def cancel_clicked(self):
+        job = self.selected()
+        if not job:
+            return
+        if job.state == "queued":
+            job.state = "stopped"
+        elif job.state in ("running", "paused"):
+            job.state = "stopped"
+            job.checker.stop()
+        self.refresh()
+
+    def clear_done(self):
+        self.jobs = [job for job in self.jobs if job.state in ("queued", "running", "paused")
+                     or job.checker.isRunning()]
+        self.refresh()
+
+    def refresh(self):
+        selected = self.selected()
+        self.table.setRowCount(len(self.jobs))
+        for row, job in enumerate(self.jobs):
+            cells = (job.label, str(job.priority), job.progress(), self.STATES[job.state])
+            for column, text in enumerate(cells):
+                self.table.setItem(row, column, QTableWidgetItem(text))
+        if selected in self.jobs:
+            self.table.selectRow(self.jobs.index(selected))
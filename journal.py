@@ -0,0 +1,172 @@
+import os, glob, json, time, threading
+from records import Verdict, FINAL
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# ------------------- Run Journal ------------------- #
+class Journal:
+    """Append-only JSONL log of a run, so a crash or STOP doesn't lose progress.
+
+    The first line describes the run (the name list, or the variant seed),
+    then every result gets a line. Writes are buffered and fsync'd at most
+    every SYNC_INTERVAL seconds, a crash loses at most that much. A torn last
+    line is ignored on load. Every run gets its own file, only created once
+    the checker thread starts. A finished run's journal is deleted (nothing
+    left to resume), the newest KEEP unfinished ones per platform are kept.
+    """
+    SYNC_INTERVAL = 1.0
+    KEEP = 10
+    active = set()  # Paths open right now, resume() leaves those alone
+
+    def __init__(self, path, header=None):
+        self.path = path
+        self.header = header  # None = append to an existing journal (resume)
+        self.file = None
+        self.lock = threading.Lock()  # added() comes from the GUI thread
+        self.last_sync = 0.0
+
+    @staticmethod
+    def path_for(platform):
+        """Path for a new run's journal, open() picks another one if it's taken by then"""
+        return os.path.join(HERE, f"{platform}_run_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+
+    @staticmethod
+    def journals(platform):
+        """Every journal of the platform, the pre-per-run <platform>_run.jsonl included"""
+        return glob.glob(os.path.join(HERE, f"{platform}_run.jsonl")) + glob.glob(os.path.join(HERE, f"{platform}_run_*.jsonl"))
+
+    @classmethod
+    def create(cls, platform, names=None, seed=None, wanted=0, max_hits=0):
+        """New journal for a list run (names) or a variant search (seed)"""
+        if seed is not None:
+            header = {"t": "run", "mode": "variants", "seed": seed, "wanted": wanted}
+        else:
+            header = {"t": "run", "mode": "list", "names": list(names), "max_hits": max_hits}
+        header["platform"] = platform
+        header["started"] = time.time()
+        return cls(cls.path_for(platform), header)
+
+    @classmethod
+    def resume(cls, platform):
+        """(journal, state) for the newest unfinished run that isn't running, or (None, None)"""
+        states = [JournalState.load(path) for path in cls.journals(platform) if path not in cls.active]
+        states = [state for state in states if state and not state.finished]
+        if not states:
+            return None, None
+        state = max(states, key=lambda state: state.started)
+        return cls(state.path), state
+
+    @classmethod
+    def prune(cls, platform):
+        """Drop the oldest unfinished journals past KEEP"""
+        paths = sorted((path for path in cls.journals(platform) if path not in cls.active), key=os.path.getmtime)
+        for path in paths[:-cls.KEEP]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def open(self):
+        if self.header is None:
+            self.file = open(self.path, "a", encoding="utf-8")
+        else:
+            self.prune(self.header["platform"])
+            base, n = self.path[:-len(".jsonl")], 1
+            while True:
+                try:
+                    self.file = open(self.path, "x", encoding="utf-8")  # Never over another run's journal
+                    break
+                except FileExistsError:
+                    n += 1
+                    self.path = f"{base}_{n}.jsonl"
+            self._write(self.header)
+            self.sync(force=True)
+        Journal.active.add(self.path)
+
+    def _write(self, entry):
+        with self.lock:
+            if self.file:
+                self.file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def record(self, result):
+        entry = {"t": "res", "n": result.name, "v": result.verdict.name, "r": result.reason.name,
+                 "s": result.status, "l": round(result.latency, 3), "ts": round(result.timestamp, 3)}
+        if result.detail is not None:
+            entry["d"] = result.detail
+        self._write(entry)
+
+    def added(self, names):
+        """Names queued mid-run, so a resume checks them too"""
+        self._write({"t": "add", "names": list(names)})
+
+    def sync(self, force=False):
+        now = time.monotonic()
+        if not self.file or (not force and now - self.last_sync < self.SYNC_INTERVAL):
+            return
+        self.last_sync = now
+        with self.lock:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def close(self, finished=False):
+        if not self.file:
+            return
+        if finished:
+            self._write({"t": "end", "ts": round(time.time(), 3)})
+        self.sync(force=True)
+        with self.lock:
+            self.file.close()
+            self.file = None
+        Journal.active.discard(self.path)
+        if finished:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+# ------------------- Journal State ------------------- #
+class JournalState:
+    """What a journal says about its run: the input, what's done, and the hits so far"""
+
+    def __init__(self, path, header):
+        self.path = path
+        self.mode = header.get("mode", "list")
+        self.names = header.get("names", [])
+        self.seed = header.get("seed")
+        self.wanted = header.get("wanted", 0)
+        self.max_hits = header.get("max_hits", 0)
+        self.started = header.get("started", 0)
+        self.done = set()  # Names with a final verdict, errors/timeouts get retried
+        self.hits = 0
+        self.finished = False
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return None
+        state = None
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn write from a crash
+                kind = entry.get("t")
+                if kind == "run":
+                    state = cls(path, entry)
+                elif state is None:
+                    continue
+                elif kind == "res":
+                    verdict = Verdict[entry["v"]]
+                    if verdict in FINAL and entry["n"] not in state.done:
+                        state.done.add(entry["n"])
+                        state.hits += verdict == Verdict.AVAILABLE
+                elif kind == "add":
+                    state.names.extend(entry["names"])
+                elif kind == "end":
+                    state.finished = True
+        return state
+
+    def remaining(self):
+        """Names from the list that still need checking, in their original order"""
+        return [name for name in self.names if name not in self.done]
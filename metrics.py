@@ -0,0 +1,289 @@
+import time, bisect, asyncio, threading, contextvars
+from collections import Counter, deque
+import aiohttp
+
+STAGES = ("dns", "connect", "ttfb", "body", "classify")
+
+# ------------------- Histogram ------------------- #
+class Histogram:
+    """Fixed log-spaced buckets from 0.1 ms to ~60 s, observe() is a bisect and an add"""
+    BOUNDS = [0.0001 * 1.5 ** i for i in range(34)]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th value (0 if empty)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.BOUNDS[min(i, len(self.BOUNDS) - 1)]
+        return self.BOUNDS[-1]
+
+    def mean(self):
+        return self.sum / self.count if self.count else 0.0
+
+class StageStats:
+    """One histogram per stage, fed by the traced checks"""
+
+    def __init__(self):
+        self.stages = {stage: Histogram() for stage in STAGES}
+
+    def observe(self, stages):
+        for stage, value in zip(STAGES, stages):
+            self.stages[stage].observe(value)
+
+    def summary(self):
+        """e.g. "dns 1/3 ms · connect 30/45 ms · ..." (p50/p95)"""
+        parts = []
+        for stage in STAGES:
+            h = self.stages[stage]
+            if h.count:
+                parts.append(f"{stage} {h.quantile(0.5) * 1000:.0f}/{h.quantile(0.95) * 1000:.0f} ms")
+        return " · ".join(parts) + " (p50/p95)" if parts else ""
+
+# ------------------- Live Counters ------------------- #
+class RunStats:
+    """Running totals for one run. The checker thread calls observe() per result,
+    the GUI reads snapshot() on a timer, so nothing is pushed per result.
+    """
+    WINDOW = 30  # Seconds of history behind checks/sec and the ETA
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.checked = 0
+        self.latency = Histogram()
+        self.verdicts = Counter()
+        self.statuses = Counter()
+        self.recent = deque()  # [second, checks] for the last WINDOW seconds
+
+    def observe(self, result):
+        second = int(time.monotonic())
+        with self.lock:
+            self.checked += 1
+            self.latency.observe(result.latency)
+            self.verdicts[result.verdict] += 1
+            self.statuses[result.status] += 1
+            if self.recent and self.recent[-1][0] == second:
+                self.recent[-1][1] += 1
+            else:
+                self.recent.append([second, 1])
+                while self.recent[0][0] <= second - self.WINDOW:
+                    self.recent.popleft()
+
+    def snapshot(self):
+        """Copy of the counters, safe to use from another thread"""
+        now = time.monotonic()
+        with self.lock:
+            recent = sum(n for second, n in self.recent if second > now - self.WINDOW)
+            snap = {
+                "checked": self.checked,
+                "p50": self.latency.quantile(0.5),
+                "p95": self.latency.quantile(0.95),
+                "p99": self.latency.quantile(0.99),
+                "verdicts": Counter(self.verdicts),
+                "statuses": Counter(self.statuses),
+            }
+        span = min(self.WINDOW, now - self.started)
+        snap["rate"] = recent / span if span > 0 else 0.0
+        return snap
+
+# ------------------- Request Tracing ------------------- #
+current_trace = contextvars.ContextVar("current_trace", default=None)
+current_counters = contextvars.ContextVar("current_counters", default=Counter())  # The running checker's totals
+
+class CheckTrace:
+    """Stage times (seconds) for one check, filled in by the TraceConfig hooks"""
+    __slots__ = ("dns", "connect", "ttfb", "body", "last")
+
+    def __init__(self):
+        self.dns = self.connect = self.ttfb = self.body = 0.0
+        self.last = 0.0  # perf_counter of the last network event
+
+    def finish(self):
+        """(dns, connect, ttfb, body, classify), classify being the time since the body arrived"""
+        classify = time.perf_counter() - self.last if self.last else 0.0
+        return (self.dns, self.connect, self.ttfb, self.body, classify)
+
+def make_trace_config(counters=None):
+    """aiohttp TraceConfig that adds stage times to the running check's CheckTrace.
+
+    Checks that aren't sampled have no CheckTrace, the hooks then return right away.
+    connect includes TLS, ttfb runs from sending the request to the headers
+    (redirects included) minus any DNS/connect time spent on the way.
+    Requests and downloaded bytes are counted into `counters` for every check,
+    or into the running checker's (current_counters) if not given, so the
+    session can outlive the checker that made it.
+    """
+    clock = time.perf_counter
+    totals = (lambda: counters) if counters is not None else current_counters.get
+
+    async def request_start(session, ctx, params):
+        ctx.trace = trace = current_trace.get()
+        if trace:
+            ctx.start = clock()
+            ctx.net = trace.dns + trace.connect
+
+    async def dns_start(session, ctx, params):
+        if ctx.trace:
+            ctx.dns_start = clock()
+
+    async def dns_end(session, ctx, params):
+        if ctx.trace:
+            ctx.trace.dns += clock() - ctx.dns_start
+
+    async def connect_start(session, ctx, params):
+        if ctx.trace:
+            ctx.conn_start = clock()
+            ctx.conn_dns = ctx.trace.dns
+
+    async def connect_end(session, ctx, params):
+        trace = ctx.trace
+        if trace:
+            # DNS happens inside connection setup, don't count it twice
+            trace.connect += clock() - ctx.conn_start - (trace.dns - ctx.conn_dns)
+
+    async def request_end(session, ctx, params):
+        totals()["requests"] += 1
+        trace = ctx.trace
+        if trace:
+            now = clock()
+            trace.ttfb += now - ctx.start - (trace.dns + trace.connect - ctx.net)
+            trace.last = now
+
+    async def request_exception(session, ctx, params):
+        counters = totals()
+        counters["requests"] += 1
+        counters["request_errors"] += 1
+
+    async def chunk_received(session, ctx, params):
+        totals()["bytes"] += len(params.chunk)
+        trace = ctx.trace
+        if trace:
+            now = clock()
+            trace.body += now - trace.last
+            trace.last = now
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(request_start)
+    config.on_dns_resolvehost_start.append(dns_start)
+    config.on_dns_resolvehost_end.append(dns_end)
+    config.on_connection_create_start.append(connect_start)
+    config.on_connection_create_end.append(connect_end)
+    config.on_request_end.append(request_end)
+    config.on_request_exception.append(request_exception)
+    config.on_response_chunk_received.append(chunk_received)
+    return config
+
+def format_stages(stages):
+    return " · ".join(f"{stage} {value * 1000:.0f} ms" for stage, value in zip(STAGES, stages))
+
+# ------------------- Prometheus Export ------------------- #
+COUNTERS = (
+    ("requests", "checker_requests_total", "HTTP requests sent (redirects count once)"),
+    ("request_errors", "checker_request_errors_total", "HTTP requests that failed without a response"),
+    ("retries", "checker_retries_total", "Checks put back in line after a timeout, connection error or rate limit"),
+    ("rechecks", "checker_rechecks_total", "UNCLEAR or failed names deferred for a thorough recheck"),
+    ("retries_denied", "checker_retries_denied_total", "Retryable failures recorded as final because the retry budget ran out"),
+    ("cooldown_seconds", "checker_cooldown_seconds_total", "Seconds spent in cooldowns"),
+    ("limiter_wait_seconds", "checker_limiter_wait_seconds_total", "Seconds spent waiting between names or backing off"),
+    ("bytes", "checker_downloaded_bytes_total", "Response body bytes downloaded"),
+    ("classify_seconds", "checker_classify_seconds_total", "Seconds spent classifying responses (traced checks only)"),
+    ("classify_cache_hits", "checker_classify_cache_hits_total", "Pages answered from the classifier cache"),
+    ("classify_cache_misses", "checker_classify_cache_misses_total", "Pages that needed the full classifier"),
+    ("deduplicated", "checker_deduplicated_total", "Checks saved because the name was already checked or in flight"),
+    ("breaker_trips", "checker_breaker_trips_total", "Times the platform's circuit breaker opened"),
+)
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+def _histogram(lines, name, hist, **labels):
+    cumulative = 0
+    for bound, n in zip(hist.BOUNDS, hist.counts):
+        cumulative += n
+        lines.append(f"{name}_bucket{_labels(**labels, le=f'{bound:.6g}')} {cumulative}")
+    lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {hist.count}")
+    lines.append(f"{name}_sum{_labels(**labels)} {hist.sum:.6f}")
+    lines.append(f"{name}_count{_labels(**labels)} {hist.count}")
+
+def prometheus_text(checkers):
+    """Prometheus text format (0.0.4) for the given checkers, labelled by platform"""
+    lines = []
+    for key, name, help_text in COUNTERS:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for checker in checkers:
+            lines.append(f"{name}{_labels(platform=checker.platform)} {checker.counters[key]:g}")
+
+    lines += ["# HELP checker_in_flight Checks currently waiting on the network", "# TYPE checker_in_flight gauge"]
+    for checker in checkers:
+        lines.append(f"checker_in_flight{_labels(platform=checker.platform)} {checker.in_flight}")
+
+    lines += ["# HELP checker_breaker_state Circuit breaker: 0 closed, 1 half-open, 2 open", "# TYPE checker_breaker_state gauge"]
+    for checker in checkers:
+        state = ("closed", "half-open", "open").index(checker.breaker.state)
+        lines.append(f"checker_breaker_state{_labels(platform=checker.platform)} {state}")
+
+    lines += ["# HELP checker_results_total Results by verdict", "# TYPE checker_results_total counter"]
+    for checker in checkers:
+        with checker.stats.lock:
+            verdicts = sorted(checker.stats.verdicts.items())
+        for verdict, n in verdicts:
+            lines.append(f"checker_results_total{_labels(platform=checker.platform, verdict=verdict.name)} {n}")
+
+    lines += ["# HELP checker_http_responses_total Results by HTTP status (0 = no response)",
+              "# TYPE checker_http_responses_total counter"]
+    for checker in checkers:
+        with checker.stats.lock:
+            statuses = sorted(checker.stats.statuses.items())
+        for status, n in statuses:
+            lines.append(f"checker_http_responses_total{_labels(platform=checker.platform, status=status)} {n}")
+
+    lines += ["# HELP checker_check_duration_seconds Time from starting a check to its verdict",
+              "# TYPE checker_check_duration_seconds histogram"]
+    for checker in checkers:
+        with checker.stats.lock:
+            _histogram(lines, "checker_check_duration_seconds", checker.stats.latency, platform=checker.platform)
+
+    lines += ["# HELP checker_stage_duration_seconds Time per request stage (traced checks only)",
+              "# TYPE checker_stage_duration_seconds histogram"]
+    for checker in checkers:
+        for stage in STAGES:
+            _histogram(lines, "checker_stage_duration_seconds", checker.stage_stats.stages[stage],
+                       platform=checker.platform, stage=stage)
+    return "\n".join(lines) + "\n"
+
+async def start_metrics_server(port, checkers, host="127.0.0.1"):
+    """Serve prometheus_text() on http://host:port/metrics from the running loop"""
+
+    async def handle(reader, writer):
+        try:
+            request = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass  # Skip the headers
+            path = request.split()[1] if len(request.split()) > 1 else b"/"
+            if path.split(b"?")[0] in (b"/", b"/metrics"):
+                status, body = "200 OK", prometheus_text(checkers).encode()
+            else:
+                status, body = "404 Not Found", b"not found\n"
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                         f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
@@ -0,0 +1,330 @@
+import os, sys, re, math, random, string, bisect, heapq, itertools
+from array import array
+
+# ------------------- Markov Name Model ------------------- #
+HERE = os.path.dirname(os.path.abspath(__file__))
+WORDLIST_PATH = os.path.join(HERE, "wordlist.txt")
+MODEL_PATH = os.path.join(HERE, "markov_model.bin")
+
+ALPHABET = string.ascii_lowercase
+SYMBOLS = len(ALPHABET) + 1  # Symbol 0 marks the start/end of a word
+ORDER = 2  # Characters of context per transition
+CONTEXTS = SYMBOLS ** ORDER
+BUCKETS = 256  # One random byte picks the next letter
+MAGIC = b"MKV1"
+
+# Symbol index -> ascii letter, used with bytes.translate()
+_TO_ASCII = bytes((0x60 + i) if 1 <= i <= 26 else 0x3f for i in range(256))
+
+
+class MarkovModel:
+    """Character n-gram model trained on a wordlist.
+
+    Transition counts are stored as a flat uint16 array (context * SYMBOLS + next).
+    On load they are expanded into two 256-bucket lookup tables, so sampling a
+    letter is a single byte lookup instead of a weighted random choice.
+    """
+
+    def __init__(self, counts):
+        self.counts = counts
+        self.next_table, self.last_table = self._build_tables(counts)
+        self._log_table = None  # Built on first log_prob() call
+
+    @classmethod
+    def train(cls, words):
+        counts = array('H', bytes(2 * CONTEXTS * SYMBOLS))
+        for word in words:
+            word = word.strip().lower()
+            if not word or not all(c in ALPHABET for c in word):
+                continue
+            symbols = [0] * ORDER + [ALPHABET.index(c) + 1 for c in word] + [0]
+            for i in range(ORDER, len(symbols)):
+                ctx = symbols[i - 2] * SYMBOLS + symbols[i - 1]
+                slot = ctx * SYMBOLS + symbols[i]
+                if counts[slot] < 0xFFFF:
+                    counts[slot] += 1
+        return cls(counts)
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        with open(path, "rb") as f:
+            if f.read(4) != MAGIC:
+                raise ValueError(f"{path} is not a Markov model file")
+            counts = array('H')
+            counts.frombytes(f.read())
+        if sys.byteorder != "little":
+            counts.byteswap()
+        if len(counts) != CONTEXTS * SYMBOLS:
+            raise ValueError(f"{path} has {len(counts)} transitions, expected {CONTEXTS * SYMBOLS}")
+        return cls(counts)
+
+    def save(self, path=MODEL_PATH):
+        counts = array('H', self.counts)
+        if sys.byteorder != "little":
+            counts.byteswap()
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(counts.tobytes())
+
+    @staticmethod
+    def _fill(weights):
+        """Spread 256 buckets over the symbols proportionally to their weights"""
+        cumulative = []
+        total = 0
+        for w in weights:
+            total += w
+            cumulative.append(total)
+        return bytes(bisect.bisect_right(cumulative, (i + 0.5) * total / BUCKETS) for i in range(BUCKETS))
+
+    def _build_tables(self, counts):
+        # Backoff rows: letter counts given only the previous character
+        bigram = [[0] * SYMBOLS for _ in range(SYMBOLS)]
+        for ctx in range(CONTEXTS):
+            row = bigram[ctx % SYMBOLS]
+            base = ctx * SYMBOLS
+            for c in range(SYMBOLS):
+                row[c] += counts[base + c]
+
+        # Chance that a word ends right after the context (b, c)
+        end_prob = [0.0] * CONTEXTS
+        for ctx in range(CONTEXTS):
+            total = sum(counts[ctx * SYMBOLS:(ctx + 1) * SYMBOLS])
+            if total:
+                end_prob[ctx] = counts[ctx * SYMBOLS] / total
+
+        uniform = [0] + [1] * len(ALPHABET)
+        next_rows = []
+        last_rows = []
+        for ctx in range(CONTEXTS):
+            b = ctx % SYMBOLS
+            letters = [0] + list(counts[ctx * SYMBOLS + 1:(ctx + 1) * SYMBOLS])
+            if not any(letters):
+                letters = [0] + bigram[b][1:]
+            if not any(letters):
+                letters = uniform
+            next_rows.append(self._fill(letters))
+
+            # Last letter: also weight by how often words end after it
+            ending = [w * end_prob[b * SYMBOLS + c] for c, w in enumerate(letters)]
+            last_rows.append(self._fill(ending) if any(ending) else next_rows[-1])
+
+        return b"".join(next_rows), b"".join(last_rows)
+
+    @staticmethod
+    def _context(prefix):
+        """Continue from the last letters of the prefix so joined names still flow"""
+        a = b = 0
+        for c in prefix.lower():
+            a, b = b, (ALPHABET.index(c) + 1 if c in ALPHABET else 0)
+        return a, b
+
+    def sample(self, count, length, prefix="", rng=random):
+        """Generate `count` pronounceable strings of exactly `length` letters"""
+        if count <= 0:
+            return []
+        if length <= 0:
+            return [""] * count
+
+        a, b = self._context(prefix)
+        nxt, last = self.next_table, self.last_table
+        total = count * length
+        # One RNG call for the whole batch, each byte drives one letter
+        noise = rng.getrandbits(8 * total).to_bytes(total, "little")
+        out = bytearray(total)
+        k = 0
+        for _ in range(count):
+            x, y = a, b
+            for _ in range(length - 1):
+                c = nxt[((x * SYMBOLS + y) << 8) | noise[k]]
+                out[k] = c
+                k += 1
+                x, y = y, c
+            out[k] = last[((x * SYMBOLS + y) << 8) | noise[k]]
+            k += 1
+
+        text = out.translate(_TO_ASCII).decode("ascii")
+        return [text[i:i + length] for i in range(0, total, length)]
+
+    def log_prob(self, word):
+        """Average natural-log probability per transition, higher reads more like a word"""
+        if self._log_table is None:
+            table = array('f', bytes(4 * CONTEXTS * SYMBOLS))
+            for ctx in range(CONTEXTS):
+                row = self.counts[ctx * SYMBOLS:(ctx + 1) * SYMBOLS]
+                total = sum(row) + SYMBOLS  # Add-one smoothing
+                for c in range(SYMBOLS):
+                    table[ctx * SYMBOLS + c] = math.log((row[c] + 1) / total)
+            self._log_table = table
+
+        table = self._log_table
+        a = b = 0
+        logp = 0.0
+        steps = 0
+        for ch in word.lower() + " ":
+            c = ALPHABET.index(ch) + 1 if ch in ALPHABET else 0
+            if c or b:
+                logp += table[(a * SYMBOLS + b) * SYMBOLS + c]
+                steps += 1
+            a, b = b, c
+        return logp / steps if steps else -10.0
+
+
+_model = None
+
+def get_model():
+    """Load the bundled model once, training it from the wordlist if the file is missing"""
+    global _model
+    if _model is None:
+        if os.path.exists(MODEL_PATH):
+            _model = MarkovModel.load(MODEL_PATH)
+        else:
+            with open(WORDLIST_PATH, "r", encoding="utf-8") as f:
+                _model = MarkovModel.train(f)
+    return _model
+
+_words = None
+
+def get_words():
+    """The bundled wordlist as a set, for dictionary-word checks"""
+    global _words
+    if _words is None:
+        with open(WORDLIST_PATH, "r", encoding="utf-8") as f:
+            _words = {w.strip().lower() for w in f if w.strip()}
+    return _words
+
+# ------------------- Name Value ------------------- #
+def score_name(name):
+    """Rough value of a name, higher gets checked first.
+
+    Rewards shortness, pronounceability, real words and no digits,
+    penalises separators.
+    """
+    words = get_words()
+    lower = name.lower()
+    letters = re.sub(r'[^a-z]', '', lower)
+
+    # Pronounceability: map the model's log-prob (about -5.5 junk .. -2.5 word) to 0..1
+    pron = (get_model().log_prob(lower) + 5.5) / 3
+    score = 3 * min(max(pron, 0.0), 1.0)
+
+    score += max(0, 15 - len(name)) / 3
+
+    if letters in words:
+        score += 2
+    elif any(lower[i:j] in words for i in range(len(lower)) for j in range(i + 4, len(lower) + 1)):
+        score += 0.75
+
+    if not any(c.isdigit() for c in name):
+        score += 1
+    score -= 0.5 * (lower.count('_') + lower.count('.'))
+    return score
+
+# ------------------- Platform Rules ------------------- #
+# Same rules the apps apply to pasted/generated names
+VALIDATORS = {
+    "instagram": lambda u: bool(re.fullmatch(r'[a-z0-9._]{1,30}', u)) and u[-1] not in '._',
+    "tiktok": lambda u: bool(re.fullmatch(r'[a-z0-9._]{2,24}', u)),
+    "discord": lambda u: bool(re.fullmatch(r'[a-z0-9_.]{2,32}', u)) and '..' not in u and '__' not in u and u[0] not in '._' and u[-1] not in '._',
+    "roblox": lambda u: bool(re.fullmatch(r'[A-Za-z0-9_]{3,20}', u)) and u.count('_') <= 1 and u[0] != '_' and u[-1] != '_',
+}
+
+# ------------------- Variant Search ------------------- #
+LEET = {"a": "4", "e": "3", "i": "1", "o": "0", "s": "5", "t": "7", "g": "9", "b": "8"}
+SHORT_AFFIXES = ["x", "_"]
+WORD_PREFIXES = ["the", "its", "real", "im", "og", "mr", "iam", "not"]
+WORD_SUFFIXES = ["hq", "tv", "yt", "og", "xd", "official", "irl", "live"]
+
+
+def _mutations(name):
+    """Yield (cost, variant) one edit away from name, cheapest edits first"""
+    n = len(name)
+
+    # Cost 1: the kind of variants people actually pick
+    for sep in "_.":
+        for i in range(1, n):
+            yield 1, name[:i] + sep + name[i:]
+    for i in range(n):
+        if name[i].isalpha():
+            yield 1, name[:i + 1] + name[i] + name[i + 1:]
+    for i in range(n):
+        sub = LEET.get(name[i].lower())
+        if sub:
+            yield 1, name[:i] + sub + name[i + 1:]
+    for d in string.digits:
+        yield 1, name + d
+    for affix in SHORT_AFFIXES:
+        yield 1, affix + name
+        yield 1, name + affix
+
+    # Cost 2: word affixes, full leetspeak, dropping/swapping a letter
+    for affix in WORD_PREFIXES:
+        yield 2, affix + name
+    for affix in WORD_SUFFIXES:
+        yield 2, name + affix
+    leet = "".join(LEET.get(c.lower(), c) for c in name)
+    if leet != name:
+        yield 2, leet
+    for i in range(n):
+        yield 2, name[:i] + name[i + 1:]
+    for i in range(n - 1):
+        yield 2, name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+    # Cost 3: two digits, replacing or inserting any letter
+    for d in range(100):
+        yield 3, f"{name}{d:02d}"
+    for i in range(n):
+        for c in ALPHABET:
+            if c != name[i].lower():
+                yield 3, name[:i] + c + name[i + 1:]
+    for i in range(n + 1):
+        for c in ALPHABET:
+            yield 3, name[:i] + c + name[i:]
+
+
+def iter_variants(seed, valid=None, max_depth=2):
+    """Lazily yield variants of seed in increasing total edit cost.
+
+    Best-first search where every heap entry also carries the iterator of its
+    remaining siblings, so only one pending child per expanded name is kept in
+    memory instead of the whole neighborhood. Up to max_depth edits are stacked.
+    """
+    seen = {seed}
+    heap = []
+    tiebreak = itertools.count()
+
+    def expand(cost, name, depth):
+        if depth >= max_depth:
+            return
+        # Stacking edits costs a little extra so single edits of the same cost win
+        base = cost + (1 if depth else 0)
+        children = _mutations(name)
+        first = next(children, None)
+        if first:
+            heapq.heappush(heap, (base + first[0], next(tiebreak), first[1], base, depth + 1, children))
+
+    expand(0, seed, 0)
+    while heap:
+        cost, _, name, parent_cost, depth, siblings = heapq.heappop(heap)
+        sibling = next(siblings, None)
+        if sibling:
+            heapq.heappush(heap, (parent_cost + sibling[0], next(tiebreak), sibling[1], parent_cost, depth, siblings))
+        if name in seen:
+            continue
+        seen.add(name)
+        if valid is None or valid(name):
+            yield name
+        expand(cost, name, depth)
+
+# ------------------- Run ------------------- #
+if __name__ == "__main__":
+    # python name_generator.py build        -> retrain markov_model.bin from wordlist.txt
+    # python name_generator.py [length] [n] -> print sample names
+    if len(sys.argv) > 1 and sys.argv[1] == "build":
+        with open(WORDLIST_PATH, "r", encoding="utf-8") as f:
+            model = MarkovModel.train(f)
+        model.save(MODEL_PATH)
+        print(f"Saved {MODEL_PATH}")
+    else:
+        length = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+        n = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+        print("\n".join(get_model().sample(n, length)))
@@ -0,0 +1,140 @@
+import asyncio, aiohttp, time
+from collections import deque
+
+# Where an available name can be grabbed, per platform
+LINKS = {
+    "instagram": "https://www.instagram.com/{}/",
+    "tiktok": "https://www.tiktok.com/@{}",
+    "roblox": "https://www.roblox.com/search/users?keyword={}",
+}
+NAMES = {"instagram": "📸 Instagram", "tiktok": "🎵 TikTok", "discord": "💬 Discord", "roblox": "🎮 Roblox"}
+
+def make_embed(result):
+    name = NAMES.get(result.platform, result.platform)
+    embed = {
+        "title": f"{name} Username Available!",
+        "description": f"**Username:** `{result.name}`",
+        "color": 3447003,
+        "footer": {"text": f"{name[2:]} Username Checker"},
+    }
+    link = LINKS.get(result.platform)
+    if link:
+        embed["fields"] = [{"name": "🔗 Direct Link", "value": link.format(result.name), "inline": False}]
+    return embed
+
+# ------------------- Webhook Notifier ------------------- #
+class WebhookNotifier:
+    """Posts AVAILABLE hits to a Discord webhook without ever slowing the check.
+
+    notify() only drops the result in a bounded queue, a background task on
+    the checker's loop packs up to MAX_EMBEDS hits into each message and
+    follows Discord's rate-limit headers. If the webhook can't keep up the
+    queue fills and the oldest hits are dropped (and counted).
+    """
+    MAX_EMBEDS = 10  # Discord's limit per message
+    QUEUE_SIZE = 500
+    LINGER = 0.5  # Seconds to wait for more hits before sending a part-full message
+    DRAIN_TIMEOUT = 10  # Seconds allowed to send what's left when the run ends
+
+    def __init__(self, url, debug=False):
+        self.url = url
+        self.debug = debug
+        self.queue = deque(maxlen=self.QUEUE_SIZE)
+        self.wakeup = None
+        self.task = None
+        self.busy = False  # A message is being sent
+        self.log = print
+        self.sent = 0
+        self.dropped = 0
+
+    def start(self, loop, log):
+        """Start the sender on the checker's loop (before it runs)"""
+        self.log = log
+        self.wakeup = asyncio.Event()
+        self.task = loop.create_task(self.sender())
+
+    def notify(self, result):
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1  # deque(maxlen) pushes the oldest out
+        self.queue.append(result)
+        self.wakeup.set()
+
+    async def sender(self):
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+            while True:
+                await self.wakeup.wait()
+                self.busy = True
+                if len(self.queue) < self.MAX_EMBEDS:
+                    await asyncio.sleep(self.LINGER)  # Let a few more hits pile up
+                self.wakeup.clear()
+                while self.queue:
+                    batch = [self.queue.popleft() for _ in range(min(self.MAX_EMBEDS, len(self.queue)))]
+                    await self.send(session, batch)
+                self.busy = False
+
+    async def send(self, session, batch):
+        payload = {"embeds": [make_embed(result) for result in batch]}
+        if len(batch) > 1:
+            payload["content"] = f"Found {len(batch)} available usernames!"
+
+        for attempt in range(3):
+            try:
+                async with session.post(self.url, json=payload) as resp:
+                    if resp.status == 429:
+                        # Body has retry_after in seconds, the header is the fallback
+                        try:
+                            retry_after = float((await resp.json()).get("retry_after", 1))
+                        except Exception:
+                            retry_after = float(resp.headers.get("Retry-After", 1))
+                        if self.debug:
+                            self.log(f"[DEBUG] ⏳ Webhook rate limited, waiting {retry_after:.1f}s")
+                        await asyncio.sleep(retry_after)
+                        continue
+
+                    if resp.status in (200, 204):
+                        self.sent += len(batch)
+                        if self.debug:
+                            self.log(f"[DEBUG] ✅ Sent {len(batch)} names to Discord webhook")
+                        # Out of requests for this window - wait it out before the next message
+                        if resp.headers.get("X-RateLimit-Remaining") == "0":
+                            await asyncio.sleep(float(resp.headers.get("X-RateLimit-Reset-After", 1)))
+                    else:
+                        self.log(f"⚠️ Webhook failed: Status {resp.status}")
+                        self.dropped += len(batch)
+                    return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.log(f"⚠️ Webhook error: {str(e)[:80]}")
+                await asyncio.sleep(2)
+        self.dropped += len(batch)
+
+    async def close(self):
+        """Send whatever is still queued (within DRAIN_TIMEOUT), then stop"""
+        if not self.task:
+            return
+        deadline = time.monotonic() + self.DRAIN_TIMEOUT
+        while (self.queue or self.busy) and time.monotonic() < deadline and not self.task.done():
+            await asyncio.sleep(0.1)
+        self.task.cancel()
+        try:
+            await self.task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self.dropped += len(self.queue)
+        if self.dropped:
+            self.log(f"⚠️ Webhook: {self.dropped} notifications dropped ({self.sent} sent)")
+
+async def send_test(url, platform):
+    """One test message, returns the HTTP status"""
+    data = {
+        "embeds": [{
+            "title": "🧪 Test Message",
+            "description": "Your webhook is working correctly!",
+            "color": 5763719,
+            "footer": {"text": f"{NAMES.get(platform, platform)[2:]} Username Checker - Webhook Test"},
+        }]
+    }
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+        async with session.post(url, json=data) as resp:
+            return resp.status
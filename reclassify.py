@@ -0,0 +1,93 @@
+"""Run today's IG/TikTok classifier over an archived run and list the verdicts that changed.
+
+    python headless.py tiktok names.txt --archive pages/    # keep the pages while checking
+    python reclassify.py pages/
+    python reclassify.py pages/ --platform instagram --only UNCLEAR -o changed.jsonl
+
+No network requests, pages are spread over every core.
+"""
+import os, sys, json, time, argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from archive import PageArchive
+
+PLATFORMS = ("instagram", "tiktok")  # The ones that classify whole pages
+_classifiers = {}
+_archive = None
+
+def classifier(platform):
+    if platform not in _classifiers:
+        if platform == "instagram":
+            from ig_checker import classify_page
+        else:
+            from tiktok_checker import classify_page
+        _classifiers[platform] = classify_page
+    return _classifiers[platform]
+
+def init_worker(root):
+    global _archive
+    _archive = PageArchive(root)
+
+def reclassify(entries):
+    """(entry, new verdict, new reason) for a chunk of entries, runs in a worker process"""
+    out = []
+    for entry in entries:
+        try:
+            body = _archive.body(entry["body"])
+        except OSError:
+            out.append((entry, "MISSING", "NONE"))
+            continue
+        verdict, reason, _ = classifier(entry["platform"])(entry["name"], entry["status"], entry["url"], body)
+        out.append((entry, verdict.name, reason.name))
+    return out
+
+def chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run the page classifiers over an archive, no network")
+    parser.add_argument("archive", help="folder given to headless.py --archive")
+    parser.add_argument("--platform", choices=PLATFORMS, help="only this platform (default: both)")
+    parser.add_argument("--only", metavar="VERDICT", help="only pages that were VERDICT, e.g. UNCLEAR")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), metavar="N", help="worker processes (default: all cores)")
+    parser.add_argument("-o", "--output", help="write the changed verdicts here as JSONL")
+    args = parser.parse_args()
+
+    archive = PageArchive(args.archive)
+    try:
+        entries = [e for e in archive.entries(args.platform) if e["platform"] in PLATFORMS]
+    except FileNotFoundError:
+        sys.exit(f"No archive in {args.archive}")
+    if args.only:
+        entries = [e for e in entries if e["verdict"] == args.only.upper()]
+    if not entries:
+        sys.exit("Nothing to reclassify")
+
+    started = time.perf_counter()
+    size = max(1, min(256, len(entries) // (args.jobs * 4)))  # Big enough to beat the pickling, small enough to balance
+    changed = []
+    transitions = Counter()
+    with ProcessPoolExecutor(args.jobs, initializer=init_worker, initargs=(args.archive,)) as pool:
+        for results in pool.map(reclassify, chunks(entries, size)):
+            for entry, verdict, reason in results:
+                if verdict != entry["verdict"]:
+                    transitions[(entry["verdict"], verdict)] += 1
+                    changed.append({"platform": entry["platform"], "name": entry["name"], "was": entry["verdict"],
+                                    "now": verdict, "reason": reason, "checked": entry["ts"]})
+    elapsed = time.perf_counter() - started
+
+    for row in changed:
+        print(f"{row['platform']:<10} {row['name']:<20} {row['was']} -> {row['now']} ({row['reason']})")
+    print(f"\n{'='*60}")
+    print(f"Reclassified {len(entries)} pages in {elapsed:.1f}s ({len(entries) / elapsed:.0f}/s on {args.jobs} processes)")
+    print(f"{len(changed)} verdicts changed")
+    for (was, now), n in transitions.most_common():
+        print(f"  {was} -> {now:<18}{n}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for row in changed:
+                f.write(json.dumps(row) + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import time
+from enum import IntEnum
+
+# ------------------- Verdicts ------------------- #
+class Verdict(IntEnum):
+    AVAILABLE = 0
+    TAKEN = 1
+    TAKEN_INVALID = 2  # Discord legacy: taken or not allowed, the API doesn't say which
+    UNCLEAR = 3
+    RATE_LIMIT = 4
+    BLOCKED = 5
+    SESSION_EXPIRED = 6
+    AUTH_ERROR = 7
+    TIMEOUT = 8
+    CONNECTION_ERROR = 9
+    PROXY_ERROR = 10
+    ERROR = 11
+
+    @property
+    def label(self):
+        return VERDICT_LABELS[self]
+
+VERDICT_LABELS = {v: v.name.replace("_", " ") for v in Verdict}
+VERDICT_LABELS[Verdict.TAKEN_INVALID] = "TAKEN/INVALID"
+
+FINAL = (Verdict.AVAILABLE, Verdict.TAKEN, Verdict.TAKEN_INVALID, Verdict.UNCLEAR)
+
+# ------------------- Reasons ------------------- #
+class Reason(IntEnum):
+    NONE = 0
+    UNREADABLE = 1
+    HTTP_404 = 2
+    SLOW_DOWN = 3
+    HTTP_STATUS = 4
+    BLOCKED_SESSION = 5
+    BLOCKED_IP = 6
+    RELOGIN = 7
+    NOT_FOUND_SIGNAL = 8
+    USER_ID_CONFIRMED = 9
+    STRONG_SIGNALS = 10
+    ENGAGEMENT = 11
+    TITLE_SIGNALS = 12
+    NO_PROFILE_DATA = 13
+    PLACEHOLDER_ONLY = 14
+    MANUAL_CHECK = 15
+    REDIRECTED = 16
+    CONFIRMED_DATA = 17
+    PRIVATE = 18
+    SEO_SIGNALS = 19
+    NOT_FOUND_NO_DATA = 20
+    GENERIC_ERROR_PAGE = 21
+    NOT_FOUND_BUT_SIGNALS = 22
+    TITLE_CONFIRMS = 23
+    UNREACHABLE = 24
+    NETWORK_BLOCKED = 25
+    RETRY_AFTER = 26
+    INVALID_TOKEN = 27
+    LEGACY_FORMAT = 28
+    PROXY_FAILED = 29
+    USER_FOUND = 30
+    EXCEPTION = 31
+    API_ERRORS = 32
+    SERVER_ERROR = 33
+
+# "{}" is filled from Result.detail (a tuple fills several), or the HTTP status without one
+REASON_TEXT = {
+    Reason.NONE: "",
+    Reason.UNREADABLE: "Could not read response",
+    Reason.HTTP_404: "404 status",
+    Reason.SLOW_DOWN: "Slow down!",
+    Reason.HTTP_STATUS: "Status {}",
+    Reason.BLOCKED_SESSION: "Status {} - Check session/IP",
+    Reason.BLOCKED_IP: "Status {} - Try VPN or wait",
+    Reason.RELOGIN: "Re-enter sessionid",
+    Reason.NOT_FOUND_SIGNAL: "not found signal",
+    Reason.USER_ID_CONFIRMED: "username + user_id confirmed",
+    Reason.STRONG_SIGNALS: "{} strong signals",
+    Reason.ENGAGEMENT: "engagement data present",
+    Reason.TITLE_SIGNALS: "profile title + {} signals",
+    Reason.NO_PROFILE_DATA: "no real profile data",
+    Reason.PLACEHOLDER_ONLY: "only placeholder data",
+    Reason.MANUAL_CHECK: "{} signals - manual check recommended",
+    Reason.REDIRECTED: "redirected",
+    Reason.CONFIRMED_DATA: "{} with confirmed data",
+    Reason.PRIVATE: "private account - exists but hidden",
+    Reason.SEO_SIGNALS: "SEO data + profile signals",
+    Reason.NOT_FOUND_NO_DATA: "not found + no profile data",
+    Reason.GENERIC_ERROR_PAGE: "generic error message, no real data",
+    Reason.NOT_FOUND_BUT_SIGNALS: "shows 'not found' but has {} real signals",
+    Reason.TITLE_CONFIRMS: "title confirms + {} signals",
+    Reason.UNREACHABLE: "Cannot reach {}",
+    Reason.NETWORK_BLOCKED: "{} blocked or network issue",
+    Reason.RETRY_AFTER: "Waiting {}s...",
+    Reason.INVALID_TOKEN: "Invalid token",
+    Reason.LEGACY_FORMAT: "Legacy mode requires format username#1234",
+    Reason.PROXY_FAILED: "Could not connect via proxy",
+    Reason.USER_FOUND: "ID: {}, Display: {}",
+    Reason.EXCEPTION: "{}",
+    Reason.API_ERRORS: "{}",
+    Reason.SERVER_ERROR: "Server error {}",
+}
+
+# ------------------- Result Record ------------------- #
+class Result:
+    """One check result. Cheap to create, text is only built by text()/reason_text()"""
+    __slots__ = ("platform", "name", "verdict", "reason", "detail", "latency", "status", "timestamp", "stages")
+
+    def __init__(self, platform, name, verdict, reason=Reason.NONE, detail=None, latency=0.0, status=0, timestamp=None, stages=None):
+        self.platform = platform
+        self.name = name
+        self.verdict = verdict
+        self.reason = reason
+        self.detail = detail  # Value(s) for the reason template, e.g. a signal count
+        self.latency = latency  # Seconds
+        self.status = status  # HTTP status, 0 if no response
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.stages = stages  # (dns, connect, ttfb, body, classify) seconds if this check was traced
+
+    def reason_text(self):
+        template = REASON_TEXT[self.reason]
+        if isinstance(self.detail, tuple):
+            return template.format(*self.detail)
+        return template.format(self.status if self.detail is None else self.detail)
+
+    def text(self, icon=""):
+        """Old-style log line: "✅ [AVAILABLE] name (reason)" """
+        head = f"{icon} [{self.verdict.label}] {self.name}".lstrip()
+        reason = self.reason_text()
+        if not reason:
+            return head
+        if self.verdict in FINAL:
+            return f"{head} ({reason})"
+        return f"{head}: {reason}"
+
+    def __repr__(self):
+        return f"Result({self.platform!r}, {self.name!r}, {self.verdict.label}, {self.reason_text()!r})"
@@ -0,0 +1,324 @@
+import time
+from collections import Counter
+from operator import attrgetter
+from PyQt5.QtWidgets import *
+from PyQt5.QtCore import *
+from PyQt5.QtGui import QColor
+from records import Verdict
+from metrics import format_stages
+
+# ------------------- Results Model ------------------- #
+class ResultsModel(QAbstractTableModel):
+    """Table of check results that stays fast with a million rows.
+
+    Rows are records.Result objects and only get turned into text when the
+    view paints them. Filtering and
+    sorting work on the row list (`shown`), nothing is re-rendered. Rows that
+    arrive after a sort go to the bottom until the header is clicked again.
+    """
+    COLUMNS = ("Name", "Platform", "Verdict", "Reason", "HTTP", "Latency", "Time")
+    SORT_KEYS = [attrgetter(a) for a in ("name", "platform", "verdict", "reason", "status", "latency", "timestamp")]
+    ICONS = {
+        Verdict.AVAILABLE: "✅",
+        Verdict.TAKEN: "❌",
+        Verdict.TAKEN_INVALID: "❌",
+        Verdict.UNCLEAR: "❓",
+        Verdict.TIMEOUT: "⏱️",
+        Verdict.SESSION_EXPIRED: "❌",
+    }
+    COLORS = {
+        Verdict.AVAILABLE: QColor("#2e7d32"),
+        Verdict.TAKEN: QColor("#c62828"),
+        Verdict.TAKEN_INVALID: QColor("#c62828"),
+    }
+    OTHER_COLOR = QColor("#ef6c00")
+    TAKEN = (Verdict.TAKEN, Verdict.TAKEN_INVALID)
+
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self.shown = self.rows  # Same list until a filter/sort is applied
+        self.counts = Counter()
+        self.verdict_filter = None  # None = all, "OTHER" = everything not available/taken
+        self.text_filter = ""
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.shown)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        result = self.shown[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return result.name
+            if col == 1:
+                return result.platform
+            if col == 2:
+                return f"{self.ICONS.get(result.verdict, '⚠️')} {result.verdict.label}"
+            if col == 3:
+                return result.reason_text()
+            if col == 4:
+                return result.status or ""
+            if col == 5:
+                return f"{result.latency * 1000:.0f} ms"
+            return time.strftime("%H:%M:%S", time.localtime(result.timestamp))
+        if role == Qt.ForegroundRole and col == 2:
+            return self.COLORS.get(result.verdict, self.OTHER_COLOR)
+        if role == Qt.ToolTipRole and col == 5 and result.stages:
+            return format_stages(result.stages)
+        return None
+
+    def append_rows(self, rows):
+        """Add a batch of rows with a single insert notification"""
+        if not rows:
+            return
+        self.rows.extend(rows)
+        self.counts.update(result.verdict for result in rows)
+        if self.shown is self.rows:
+            first = len(self.rows) - len(rows)
+            self.beginInsertRows(QModelIndex(), first, len(self.rows) - 1)
+            self.endInsertRows()
+            return
+
+        matches = [row for row in rows if self._matches(row)]
+        if matches:
+            first = len(self.shown)
+            self.beginInsertRows(QModelIndex(), first, first + len(matches) - 1)
+            self.shown.extend(matches)
+            self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.rows = []
+        self.shown = self.rows
+        self.counts.clear()
+        self.endResetModel()
+
+    def _matches(self, result):
+        verdict = result.verdict
+        if self.verdict_filter == "OTHER":
+            if verdict == Verdict.AVAILABLE or verdict in self.TAKEN:
+                return False
+        elif self.verdict_filter == Verdict.TAKEN:
+            if verdict not in self.TAKEN:
+                return False
+        elif self.verdict_filter is not None and verdict != self.verdict_filter:
+            return False
+        return not self.text_filter or self.text_filter in result.name.lower()
+
+    def set_filter(self, verdict=None, text=""):
+        self.beginResetModel()
+        self.verdict_filter = verdict
+        self.text_filter = text.lower()
+        if verdict is None and not self.text_filter:
+            self.shown = self.rows
+        else:
+            self.shown = [row for row in self.rows if self._matches(row)]
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if column < 0:
+            # Sorting switched off - back to arrival order
+            self.set_filter(self.verdict_filter, self.text_filter)
+            return
+        self.layoutAboutToBeChanged.emit()
+        if self.shown is self.rows:
+            self.shown = list(self.rows)  # Keep arrival order in self.rows
+        self.shown.sort(key=self.SORT_KEYS[column], reverse=(order == Qt.DescendingOrder))
+        self.layoutChanged.emit()
+
+# ------------------- Results View ------------------- #
+class ResultsView(QWidget):
+    """Results table + counts + filters, with a capped log tab for everything else.
+
+    Checkers already batch their output (BaseChecker.batch), so add_rows() and
+    log_lines() expect a whole batch per call.
+    """
+    LOG_LINES = 5000  # Oldest log lines are dropped past this
+    FILTERS = (("All", None), ("✅ Available", Verdict.AVAILABLE), ("❌ Taken", Verdict.TAKEN), ("⚠️ Other", "OTHER"))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.model = ResultsModel()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        filter_row = QHBoxLayout()
+        self.filter_combo = QComboBox()
+        for label, _ in self.FILTERS:
+            self.filter_combo.addItem(label)
+        self.filter_combo.currentIndexChanged.connect(self.apply_filter)
+        filter_row.addWidget(self.filter_combo)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Filter names...")
+        self.search_input.textChanged.connect(self.apply_filter)
+        filter_row.addWidget(self.search_input)
+        layout.addLayout(filter_row)
+
+        self.tabs = QTabWidget()
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setAlternatingRowColors(True)
+        self.table.setWordWrap(False)
+        # Fixed row heights let the view skip measuring rows it doesn't paint
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        self.table.verticalHeader().hide()
+        header = self.table.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        header.sortIndicatorChanged.connect(self.model.sort)
+        header.setStretchLastSection(True)
+        self.table.setColumnWidth(0, 150)
+        self.table.setColumnWidth(3, 220)
+        self.table.setColumnWidth(4, 50)
+        self.tabs.addTab(self.table, "📊 Results")
+
+        self.log_view = QPlainTextEdit()
+        self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(self.LOG_LINES)
+        self.tabs.addTab(self.log_view, "📜 Log")
+        layout.addWidget(self.tabs)
+
+        self.counts_label = QLabel()
+        self.counts_label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(self.counts_label)
+        self.update_counts()
+
+        self.metrics = MetricsPanel()
+        layout.addWidget(self.metrics)
+
+    def add_rows(self, rows):
+        if not rows:
+            return
+        bar = self.table.verticalScrollBar()
+        follow = bar.value() >= bar.maximum()  # Only auto-scroll if already at the bottom
+        self.model.append_rows(rows)
+        if follow:
+            self.table.scrollToBottom()
+        self.update_counts()
+
+    def log(self, text):
+        self.log_view.appendPlainText(text)
+
+    def log_lines(self, lines):
+        if lines:
+            # One append for the whole batch, anything past the cap would be dropped anyway
+            self.log_view.appendPlainText("\n".join(lines[-self.LOG_LINES:]))
+
+    def clear(self):
+        self.model.clear()
+        self.log_view.clear()
+        self.reset_sort()
+        self.update_counts()
+
+    def apply_filter(self):
+        verdict = self.FILTERS[self.filter_combo.currentIndex()][1]
+        self.reset_sort()
+        self.model.set_filter(verdict, self.search_input.text().strip())
+
+    def reset_sort(self):
+        header = self.table.horizontalHeader()
+        header.blockSignals(True)
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        header.blockSignals(False)
+
+    def update_counts(self):
+        counts = self.model.counts
+        available = counts[Verdict.AVAILABLE]
+        taken = counts[Verdict.TAKEN] + counts[Verdict.TAKEN_INVALID]
+        total = len(self.model.rows)
+        self.counts_label.setText(f"✅ {available} available   ❌ {taken} taken   ⚠️ {total - available - taken} other   ({total} checked)")
+
+# ------------------- Live Stats ------------------- #
+def duration(seconds):
+    """HH:MM:SS, with days in front once it's a day or more ("2d 03:04:05")"""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    clock = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{days}d {clock}" if days else clock
+
+class MetricsPanel(QGroupBox):
+    """Rate, latency, HTTP/verdict counts, pacing and ETA for the running checker.
+
+    Refreshed every REFRESH_MS from the checker's RunStats, so a fast run
+    costs the GUI the same as a slow one.
+    """
+    REFRESH_MS = 1000
+    FIELDS = (("rate", "⚡ Rate"), ("latency", "⏱️ Latency"), ("eta", "🏁 ETA"),
+              ("pacing", "🚦 Pacing"), ("verdicts", "📋 Verdicts"), ("http", "🌐 HTTP"))
+
+    def __init__(self, parent=None):
+        super().__init__("📈 Live Stats", parent)
+        self.thread = None
+        self.values = {}
+        grid = QGridLayout(self)
+        grid.setContentsMargins(6, 4, 6, 4)
+        for i, (key, label) in enumerate(self.FIELDS):
+            value = QLabel("-")
+            value.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            grid.addWidget(QLabel(label), i // 3, (i % 3) * 2)
+            grid.addWidget(value, i // 3, (i % 3) * 2 + 1)
+            self.values[key] = value
+        grid.setColumnStretch(5, 1)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def watch(self, thread):
+        """Follow a checker until it finishes"""
+        if self.thread is not None:
+            try:
+                self.thread.finished.disconnect(self.finished)
+            except TypeError:
+                pass  # Already disconnected
+        self.thread = thread
+        thread.finished.connect(self.finished)
+        self.refresh()
+        self.timer.start(self.REFRESH_MS)
+
+    def finished(self):
+        if self.sender() is not self.thread:
+            return  # An earlier queued run, the panel follows a newer one now
+        self.timer.stop()
+        self.refresh()
+
+    def refresh(self):
+        thread = self.thread
+        if thread is None:
+            return
+        snap = thread.stats.snapshot()
+        rate = snap["rate"]
+        running = thread.isRunning()
+        self.values["rate"].setText(f"{rate:.2f} checks/s (last {thread.stats.WINDOW}s)")
+        self.values["latency"].setText(f"p50 {snap['p50'] * 1000:.0f} · p95 {snap['p95'] * 1000:.0f} · p99 {snap['p99'] * 1000:.0f} ms")
+
+        remaining = thread.queue.remaining()
+        if not running:
+            eta = "done"
+        elif remaining is None:
+            eta = "open-ended"
+        elif rate > 0:
+            eta = duration((remaining + thread.in_flight) / rate) + f" ({remaining} left)"
+        else:
+            eta = f"? ({remaining} left)"
+        self.values["eta"].setText(eta)
+
+        if thread.limiter:
+            pacing = thread.limiter
+        else:
+            pacing = f"{thread.in_flight}/{thread.concurrency} in flight, {thread.delay:g}s delay"
+        self.values["pacing"].setText(pacing)
+        self.values["verdicts"].setText(" · ".join(f"{verdict.label} {n}" for verdict, n in snap["verdicts"].most_common()) or "-")
+        self.values["http"].setText(" · ".join(f"{status or 'none'}: {n}" for status, n in sorted(snap["statuses"].items())) or "-")
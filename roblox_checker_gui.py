@@ -1,8 +1,16 @@
-import sys, requests, asyncio, random, string, traceback, json
+import sys, aiohttp, asyncio, random, string, traceback, json
 from datetime import datetime
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
+from name_generator import get_model, iter_variants, score_name, VALIDATORS
+from checker_engine import BaseChecker, CandidateQueue, engine_service
+from results_view import ResultsView
+from job_queue import JobQueue
+from records import Verdict, Reason
+from journal import Journal
+from sinks import SINKS, make_sink
+from notifier import WebhookNotifier, send_test
 
 try:
     from DrissionPage import Chromium, ChromiumOptions, errors
@@ -11,107 +19,93 @@ except ImportError:
     DRISSION_AVAILABLE = False
 
 # ------------------- Checker Thread ------------------- #
-class Checker(QThread):
-    update = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count = 0
+class Checker(BaseChecker):
+    platform = "roblox"
+    USERS_URL = "https://users.roblox.com/v1/usernames/users"
+    delay = 0  # Public API, no pause needed between names
 
-    def __init__(self, usernames, webhook_url=None, debug=False, auto_signup=False, signup_password=None):
-        super().__init__()
-        self.usernames = usernames
-        self.webhook_url = webhook_url
-        self.running = True
-        self.debug = debug
-        self.consecutive_errors = 0
-        self.max_errors_before_pause = 3
+    def __init__(self, usernames, debug=False, auto_signup=False, signup_password=None, max_hits=0):
+        super().__init__(usernames, debug, max_hits)
         self.auto_signup = auto_signup
         self.signup_password = signup_password or "RobloxGen2024!"
         self.created_accounts = []
 
-    def run(self):
-        for i, username in enumerate(self.usernames):
-            if not self.running:
-                break
-            self.check_user(username)
-            self.count += 1
-            self.pupdate.emit(self.count)
-
-    def stop(self):
-        self.running = False
+    def create_session(self):
+        timeout = aiohttp.ClientTimeout(total=10)
+        return aiohttp.ClientSession(timeout=timeout, trace_configs=[self.trace_config])
 
-    def check_user(self, username):
+    async def check_user(self, username, sem, session, lock, idx):
         if not self.running:
             return
 
-        try:
-            url = "https://users.roblox.com/v1/usernames/users"
-            data = {"usernames": [username]}
-            
-            if self.debug:
-                self.update.emit(f"\n{'='*60}")
-                self.update.emit(f"[DEBUG] Checking: {username}")
-                self.update.emit(f"[DEBUG] API URL: {url}")
-            
-            response = requests.post(url, json=data, timeout=10)
-            
-            if self.debug:
-                self.update.emit(f"[DEBUG] Status Code: {response.status_code}")
-                self.update.emit(f"[DEBUG] Response: {response.text[:200]}")
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                if result.get("data") and len(result["data"]) > 0:
-                    user_data = result["data"][0]
-                    if user_data.get("id") is not None:
-                        user_id = user_data.get("id")
-                        display_name = user_data.get("displayName", username)
-                        self.update.emit(f"❌ [TAKEN] {username} (ID: {user_id}, Display: {display_name})")
-                        self.consecutive_errors = 0
-                        return
+        async with sem:
+            try:
+                url = self.USERS_URL
+                data = {"usernames": [username]}
                 
-                # Username is available
-                self.update.emit(f"✅ [AVAILABLE] {username}")
-                self.consecutive_errors = 0
+                if self.debug:
+                    self.log(f"\n{'='*60}")
+                    self.log(f"[DEBUG] Checking: {username}")
+                    self.log(f"[DEBUG] API URL: {url}")
                 
-                # Send to Discord webhook if provided
-                if self.webhook_url:
-                    self.send_to_discord(username)
+                async with session.post(url, json=data) as response:
+                    status = response.status
+                    text = await response.text()
                 
-                # Auto sign-up if enabled
-                if self.auto_signup and DRISSION_AVAILABLE:
-                    self.update.emit(f"🔄 [AUTO-SIGNUP] Attempting to create account: {username}")
-                    success = self.create_account(username)
-                    if success:
-                        self.update.emit(f"🎉 [SUCCESS] Account created: {username}")
-                    else:
-                        self.update.emit(f"⚠️ [FAILED] Could not create account: {username}")
+                if self.debug:
+                    self.log(f"[DEBUG] Status Code: {status}")
+                    self.log(f"[DEBUG] Response: {text[:200]}")
                 
-            elif response.status_code == 429:
-                self.update.emit(f"⚠️ [RATE LIMIT] {username}: Slow down!")
-                self.consecutive_errors += 1
+                if status == 200:
+                    result = json.loads(text)
+                    
+                    if result.get("data") and len(result["data"]) > 0:
+                        user_data = result["data"][0]
+                        if user_data.get("id") is not None:
+                            user_id = user_data.get("id")
+                            display_name = user_data.get("displayName", username)
+                            self.report(username, Verdict.TAKEN, Reason.USER_FOUND, (user_id, display_name), status=status)
+                            return
+                    
+                    # Username is available
+                    self.report(username, Verdict.AVAILABLE, status=status)
+                    
+                    loop = asyncio.get_running_loop()
+                    
+                    # Auto sign-up if enabled (the browser automation blocks, so keep it off the loop)
+                    if self.auto_signup and DRISSION_AVAILABLE:
+                        self.log(f"🔄 [AUTO-SIGNUP] Attempting to create account: {username}")
+                        success = await loop.run_in_executor(None, self.create_account, username)
+                        if success:
+                            self.log(f"🎉 [SUCCESS] Account created: {username}")
+                        else:
+                            self.log(f"⚠️ [FAILED] Could not create account: {username}")
+                    
+                elif status == 429:
+                    self.report(username, Verdict.RATE_LIMIT, Reason.SLOW_DOWN, status=status)
+                    self.back_off(2)
+                    
+                elif status >= 500:
+                    self.report(username, Verdict.CONNECTION_ERROR, Reason.SERVER_ERROR, status=status)
+                    
+                else:
+                    self.report(username, Verdict.ERROR, Reason.HTTP_STATUS, status=status)
+                    
+            except aiohttp.ClientConnectionError:
+                self.report(username, Verdict.CONNECTION_ERROR, Reason.UNREACHABLE, "Roblox")  # Retried by the engine
                 
-            else:
-                self.update.emit(f"⚠️ [ERROR] {username}: Status {response.status_code}")
-                self.consecutive_errors += 1
+            except asyncio.TimeoutError:
+                self.report(username, Verdict.TIMEOUT)
                 
-        except requests.exceptions.Timeout:
-            self.consecutive_errors += 1
-            self.update.emit(f"⏱️ [TIMEOUT] {username}")
-            
-        except Exception as e:
-            self.consecutive_errors += 1
-            if self.debug:
-                error_msg = traceback.format_exc()
-                self.update.emit(f"⚠️ [ERROR] {username}:\n{error_msg}")
-            else:
-                error_msg = str(e)
-                self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
+            except Exception as e:
+                if self.debug:
+                    self.log(f"[DEBUG] {traceback.format_exc()}")
+                self.report(username, Verdict.ERROR, Reason.EXCEPTION, str(e))
 
     def create_account(self, username):
         """Create a Roblox account using DrissionPage"""
         if not DRISSION_AVAILABLE:
-            self.update.emit(f"[DEBUG] DrissionPage not available")
+            self.log(f"[DEBUG] DrissionPage not available")
             return False
         
         chrome = None
@@ -122,13 +116,13 @@ class Checker(QThread):
             # Browser must be visible to properly detect redirects
             
             if self.debug:
-                self.update.emit(f"[DEBUG] Initializing browser for {username}")
+                self.log(f"[DEBUG] Initializing browser for {username}")
             
             chrome = Chromium(addr_or_opts=co)
             page = chrome.latest_tab
             
             if self.debug:
-                self.update.emit(f"[DEBUG] Navigating to signup page")
+                self.log(f"[DEBUG] Navigating to signup page")
             
             # Navigate to signup page
             page.get("https://www.roblox.com/CreateAccount")
@@ -137,10 +131,10 @@ class Checker(QThread):
             try:
                 page.ele('@class=btn-cta-lg cookie-btn btn-primary-md btn-min-width', timeout=3).click()
                 if self.debug:
-                    self.update.emit(f"[DEBUG] Accepted cookies")
+                    self.log(f"[DEBUG] Accepted cookies")
             except:
                 if self.debug:
-                    self.update.emit(f"[DEBUG] No cookie banner found")
+                    self.log(f"[DEBUG] No cookie banner found")
             
             # Set birthday (random adult age)
             from datetime import datetime
@@ -148,7 +142,7 @@ class Checker(QThread):
             import time
             
             if self.debug:
-                self.update.emit(f"[DEBUG] Setting birthday")
+                self.log(f"[DEBUG] Setting birthday")
             
             bdaymonthelement = page.ele("#MonthDropdown", timeout=10)
             oldLocale = locale.getlocale(locale.LC_TIME)
@@ -174,7 +168,7 @@ class Checker(QThread):
             page.ele("#YearDropdown", timeout=10).select.by_value(str(currentYear))
             
             if self.debug:
-                self.update.emit(f"[DEBUG] Entering credentials")
+                self.log(f"[DEBUG] Entering credentials")
             
             # Enter username and password
             page.ele("#signup-username", timeout=10).input(username)
@@ -189,23 +183,23 @@ class Checker(QThread):
                 checkbox = page.ele('@@id=signup-checkbox@@class=checkbox', timeout=3)
                 checkbox.click()
                 if self.debug:
-                    self.update.emit(f"[DEBUG] Accepted terms checkbox")
+                    self.log(f"[DEBUG] Accepted terms checkbox")
             except:
                 # Try alternative checkbox selector
                 try:
                     checkbox = page.ele('#signup-checkbox', timeout=2)
                     checkbox.click()
                     if self.debug:
-                        self.update.emit(f"[DEBUG] Accepted terms checkbox (alt method)")
+                        self.log(f"[DEBUG] Accepted terms checkbox (alt method)")
                 except:
                     if self.debug:
-                        self.update.emit(f"[DEBUG] Terms checkbox not required or already checked")
+                        self.log(f"[DEBUG] Terms checkbox not required or already checked")
                     pass
             
             time.sleep(1)
             
             if self.debug:
-                self.update.emit(f"[DEBUG] Submitting signup form")
+                self.log(f"[DEBUG] Submitting signup form")
             
             # Submit signup
             page.ele("@@id=signup-button@@name=signupSubmit", timeout=10).click()
@@ -218,7 +212,7 @@ class Checker(QThread):
                 error_element = page.ele(".text-error", timeout=2)
                 if error_element:
                     error_text = error_element.text
-                    self.update.emit(f"⚠️ [SIGNUP ERROR] {username}: {error_text}")
+                    self.log(f"⚠️ [SIGNUP ERROR] {username}: {error_text}")
                     if chrome:
                         chrome.quit()
                     return False
@@ -228,12 +222,12 @@ class Checker(QThread):
             # Check current URL
             current_url = page.url
             if self.debug:
-                self.update.emit(f"[DEBUG] Current URL: {current_url}")
+                self.log(f"[DEBUG] Current URL: {current_url}")
             
             # Check if we're redirected to home (success)
             if "home" in current_url.lower() or "/home" in current_url:
                 if self.debug:
-                    self.update.emit(f"[DEBUG] Successfully created account, getting cookies")
+                    self.log(f"[DEBUG] Successfully created account, getting cookies")
                 
                 # Get cookies
                 cookies = []
@@ -263,12 +257,12 @@ class Checker(QThread):
                 try:
                     captcha = page.get_frame('xpath://*[@id="arkose-iframe"]')
                     if captcha:
-                        self.update.emit(f"⚠️ [CAPTCHA] {username}: Captcha detected, cannot auto-complete")
+                        self.log(f"⚠️ [CAPTCHA] {username}: Captcha detected, cannot auto-complete")
                 except:
                     pass
                 
                 if self.debug:
-                    self.update.emit(f"[DEBUG] Signup did not redirect to home page")
+                    self.log(f"[DEBUG] Signup did not redirect to home page")
                 
                 if chrome:
                     chrome.quit()
@@ -278,7 +272,7 @@ class Checker(QThread):
             error_msg = str(e)
             if self.debug:
                 error_msg = traceback.format_exc()
-            self.update.emit(f"⚠️ [SIGNUP ERROR] {username}: {error_msg}")
+            self.log(f"⚠️ [SIGNUP ERROR] {username}: {error_msg}")
             try:
                 if chrome:
                     chrome.quit()
@@ -307,41 +301,7 @@ class Checker(QThread):
                 
         except Exception as e:
             if self.debug:
-                self.update.emit(f"[DEBUG] Error saving account: {str(e)}")
-
-    def send_to_discord(self, username):
-        """Send available username to Discord webhook"""
-        try:
-            webhook_data = {
-                "embeds": [{
-                    "title": "🎮 Available Roblox Username Found!",
-                    "description": f"**Username:** `{username}`",
-                    "color": 3447003,
-                    "fields": [
-                        {
-                            "name": "🔗 Direct Link",
-                            "value": f"https://www.roblox.com/search/users?keyword={username}",
-                            "inline": False
-                        }
-                    ],
-                    "footer": {
-                        "text": "Roblox Username Checker"
-                    }
-                }]
-            }
-            
-            response = requests.post(self.webhook_url, json=webhook_data, timeout=5)
-            
-            if response.status_code == 204:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] ✅ Sent {username} to Discord webhook")
-            else:
-                if self.debug:
-                    self.update.emit(f"[DEBUG] ⚠️ Webhook failed: Status {response.status_code}")
-                    
-        except Exception as e:
-            if self.debug:
-                self.update.emit(f"[DEBUG] ⚠️ Webhook error: {str(e)}")
+                self.log(f"[DEBUG] Error saving account: {str(e)}")
 
 # ------------------- GUI App ------------------- #
 class App(QMainWindow):
@@ -349,7 +309,8 @@ class App(QMainWindow):
         super().__init__()
         self.setWindowTitle("Roblox Username Checker with Auto Sign-Up")
         self.setGeometry(150, 150, 1100, 850)
-        self.thread = None
+        self.thread = None  # Checker the progress bar follows, the newest running one
+        self.jobs_idle = True
         self.initUI()
 
     def initUI(self):
@@ -481,7 +442,8 @@ class App(QMainWindow):
             "Letters + Numbers (a1b2)",
             "Numbers + Letters (12ab)",
             "Letters_Letters (abc_def)",
-            "CamelCase (AbcDef)"
+            "CamelCase (AbcDef)",
+            "Pronounceable (brelo)"
         ])
         self.pattern_combo.setMaximumWidth(200)
         row2.addWidget(self.pattern_combo)
@@ -498,6 +460,28 @@ class App(QMainWindow):
         row2.addStretch()
         gen_layout.addLayout(row2)
         
+        # Third row - closest available variants of a taken name
+        row3 = QHBoxLayout()
+        row3.addWidget(QLabel("Variants of:"))
+        self.variant_input = QLineEdit()
+        self.variant_input.setPlaceholderText("e.g., Shadow")
+        self.variant_input.setMaximumWidth(150)
+        row3.addWidget(self.variant_input)
+        
+        row3.addWidget(QLabel("Find:"))
+        self.variant_count_input = QLineEdit("3")
+        self.variant_count_input.setMaximumWidth(60)
+        row3.addWidget(self.variant_count_input)
+        
+        self.variant_button = QPushButton("🔎 Find Closest Available")
+        self.variant_button.setToolTip("Check variants of the name, closest first, until this many are available")
+        self.variant_button.clicked.connect(self.variants_clicked)
+        self.variant_button.setStyleSheet("background-color: #3498db; color: white; padding: 8px; font-weight: bold;")
+        row3.addWidget(self.variant_button)
+        
+        row3.addStretch()
+        gen_layout.addLayout(row3)
+        
         gen_group.setLayout(gen_layout)
         main_layout.addWidget(gen_group)
 
@@ -518,39 +502,77 @@ class App(QMainWindow):
         output_box = QVBoxLayout()
         output_label = QLabel("📊 Results:")
         output_label.setStyleSheet("font-weight: bold;")
-        output_box.addWidget(output_label)
-        
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
-        self.output_text.setStyleSheet("background-color: #1a1a1a; color: #00ff00; font-family: Consolas, Monaco, monospace; padding: 10px;")
-        output_box.addWidget(self.output_text)
+        output_header = QHBoxLayout()
+        output_header.addWidget(output_label)
+        output_header.addStretch()
+        output_header.addWidget(QLabel("💾 Save to file:"))
+        self.export_combo = QComboBox()
+        self.export_combo.addItems(["Off"] + list(SINKS))
+        self.export_combo.setToolTip("Write every result to results/ as it comes in")
+        output_header.addWidget(self.export_combo)
+        output_box.addLayout(output_header)
+        
+        self.results = ResultsView()
+        self.results.log_view.setStyleSheet("background-color: #1a1a1a; color: #00ff00; font-family: Consolas, Monaco, monospace; padding: 10px;")
+        output_box.addWidget(self.results)
         
         io_layout.addLayout(input_box)
-        io_layout.addLayout(output_box)
+        io_layout.addLayout(output_box, 2)
         io_group.setLayout(io_layout)
         main_layout.addWidget(io_group)
 
         # Control Buttons
         btn_layout = QHBoxLayout()
         
+        btn_layout.addWidget(QLabel("Stop after:"))
+        self.stop_after_input = QLineEdit("0")
+        self.stop_after_input.setMaximumWidth(50)
+        self.stop_after_input.setToolTip("Stop the run once this many AVAILABLE names are found (0 = check everything)")
+        btn_layout.addWidget(self.stop_after_input)
+        btn_layout.addWidget(QLabel("available"))
+        
+        self.best_first_checkbox = QCheckBox("⭐ Best names first")
+        self.best_first_checkbox.setChecked(True)
+        self.best_first_checkbox.setToolTip("Check short, pronounceable, real-word names without digits before the rest")
+        btn_layout.addWidget(self.best_first_checkbox)
+        
         self.start_button = QPushButton("▶️ START CHECKING")
         self.start_button.clicked.connect(self.start_clicked)
         self.start_button.setStyleSheet("background-color: #27ae60; color: white; font-weight: bold; padding: 15px; font-size: 14px;")
         btn_layout.addWidget(self.start_button)
         
+        self.resume_button = QPushButton("♻️ Resume")
+        self.resume_button.clicked.connect(self.resume_clicked)
+        self.resume_button.setToolTip("Continue the last run that was stopped or crashed, skipping names already checked")
+        self.resume_button.setStyleSheet("padding: 15px;")
+        btn_layout.addWidget(self.resume_button)
+        
         self.stop_button = QPushButton("⏹️ STOP")
         self.stop_button.clicked.connect(self.stop_clicked)
         self.stop_button.setEnabled(False)
         self.stop_button.setStyleSheet("background-color: #e74c3c; color: white; font-weight: bold; padding: 15px; font-size: 14px;")
         btn_layout.addWidget(self.stop_button)
         
+        self.queue_button = QPushButton("➕ Queue More")
+        self.queue_button.clicked.connect(self.queue_more_clicked)
+        self.queue_button.setEnabled(False)
+        self.queue_button.setToolTip("Add the names in the input box to the running check")
+        self.queue_button.setStyleSheet("padding: 15px;")
+        btn_layout.addWidget(self.queue_button)
+        
         self.clear_button = QPushButton("🗑️ Clear Results")
-        self.clear_button.clicked.connect(lambda: self.output_text.clear())
+        self.clear_button.clicked.connect(self.results.clear)
         self.clear_button.setStyleSheet("padding: 15px;")
         btn_layout.addWidget(self.clear_button)
         
         main_layout.addLayout(btn_layout)
 
+        # Job Queue - START adds to it, runs start as soon as there's a free slot
+        self.jobs = JobQueue()
+        self.jobs.job_started.connect(self.job_started)
+        self.jobs.idle.connect(self.checking_finished)
+        main_layout.addWidget(self.jobs)
+
         # Progress Bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setStyleSheet("QProgressBar { text-align: center; height: 25px; } QProgressBar::chunk { background-color: #3498db; }")
@@ -578,6 +600,10 @@ class App(QMainWindow):
 
         generated = []
         
+        if pattern == "Pronounceable (brelo)":
+            # Sample the whole batch from the Markov model up front
+            pronounceable = iter(get_model().sample(count, length, prefix))
+        
         for _ in range(count):
             username = ""
             
@@ -612,6 +638,9 @@ class App(QMainWindow):
                     remaining -= part_len
                 username = "".join(parts)
             
+            elif pattern == "Pronounceable (brelo)":
+                username = next(pronounceable)
+            
             username = prefix + username + suffix
             username = ''.join(c for c in username if c.isalnum() or c == '_')
             
@@ -633,23 +662,12 @@ class App(QMainWindow):
             return
         
         try:
-            test_data = {
-                "embeds": [{
-                    "title": "🧪 Test Message",
-                    "description": "Your webhook is working correctly!",
-                    "color": 5763719,
-                    "footer": {
-                        "text": "Roblox Username Checker - Webhook Test"
-                    }
-                }]
-            }
-            
-            response = requests.post(webhook_url, json=test_data, timeout=5)
-            
-            if response.status_code == 204:
+            status = asyncio.run(send_test(webhook_url, "roblox"))
+            
+            if status == 204:
                 QMessageBox.information(self, "Success", "✅ Webhook test successful!\nCheck your Discord channel.")
             else:
-                QMessageBox.warning(self, "Failed", f"❌ Webhook test failed!\nStatus code: {response.status_code}")
+                QMessageBox.warning(self, "Failed", f"❌ Webhook test failed!\nStatus code: {status}")
                 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"❌ Failed to send test message:\n{str(e)}")
@@ -660,6 +678,52 @@ class App(QMainWindow):
             QMessageBox.warning(self, "No Usernames", "Please enter or generate usernames to check!")
             return
         
+        max_hits = self.get_stop_after()
+        score = score_name if self.best_first_checkbox.isChecked() else None
+        queue = CandidateQueue(usernames, score)
+        journal = Journal.create("roblox", names=usernames, max_hits=max_hits)
+        self.start_checking(queue, len(usernames), max_hits, journal)
+
+    def variants_clicked(self):
+        seed = self.variant_input.text().strip()
+        if not seed:
+            QMessageBox.warning(self, "No Name", "Enter the taken name to search variants of!")
+            return
+        
+        try:
+            wanted = max(1, int(self.variant_count_input.text()))
+        except:
+            wanted = 3
+        
+        # Variants are generated lazily, closest first, until enough are available
+        journal = Journal.create("roblox", seed=seed, wanted=wanted)
+        if self.start_checking(iter_variants(seed, VALIDATORS["roblox"]), 0, max_hits=wanted, journal=journal):
+            self.status_label.setText(f"🔎 Searching variants of '{seed}' until {wanted} are available...")
+
+    def resume_clicked(self):
+        journal, state = Journal.resume("roblox")
+        if not journal:
+            QMessageBox.information(self, "Nothing to Resume", "No unfinished run found!")
+            return
+        
+        if state.mode == "variants":
+            # Same variant order as before, minus what's already checked
+            variants = (v for v in iter_variants(state.seed, VALIDATORS["roblox"]) if v not in state.done)
+            wanted = state.wanted - state.hits
+            if wanted <= 0:
+                QMessageBox.information(self, "Nothing to Resume", "That search already found enough names!")
+                return
+            if self.start_checking(variants, 0, wanted, journal):
+                self.status_label.setText(f"♻️ Resuming variants of '{state.seed}' ({state.hits} found, {len(state.done)} done)...")
+            return
+        
+        remaining = state.remaining()
+        max_hits = max(0, state.max_hits - state.hits) if state.max_hits else 0
+        score = score_name if self.best_first_checkbox.isChecked() else None
+        if self.start_checking(CandidateQueue(remaining, score), len(remaining), max_hits, journal):
+            self.status_label.setText(f"♻️ Resuming: {len(state.done)} already done, {len(remaining)} to go...")
+
+    def start_checking(self, usernames, total, max_hits=0, journal=None):
         debug = self.debug_checkbox.isChecked()
         webhook_url = self.webhook_input.text().strip() or None
         auto_signup = self.auto_signup_checkbox.isChecked()
@@ -667,15 +731,10 @@ class App(QMainWindow):
         
         if auto_signup and not DRISSION_AVAILABLE:
             QMessageBox.warning(self, "Library Missing", "DrissionPage is not installed!\nInstall it with: pip install DrissionPage")
-            return
+            return False
         
-        self.progress_bar.setMaximum(len(usernames))
-        self.progress_bar.setValue(0)
-        self.output_text.clear()
-        self.start_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
         
-        status_text = f"🔄 Checking {len(usernames)} usernames"
+        status_text = f"🔄 Checking {total or 'variant'} usernames"
         if auto_signup:
             status_text += " (auto sign-up enabled)"
         if webhook_url:
@@ -685,22 +744,40 @@ class App(QMainWindow):
         self.status_label.setText(status_text)
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
 
-        self.thread = Checker(usernames, webhook_url, debug, auto_signup, signup_password)
-        self.thread.update.connect(self.update_text)
-        self.thread.pupdate.connect(self.update_progress)
-        self.thread.finished.connect(self.checking_finished)
-        self.thread.start()
+        checker = Checker(usernames, debug, auto_signup, signup_password, max_hits)
+        checker.journal = journal
+        checker.service = engine_service()  # Same loop and connections as the other runs
+        if webhook_url:
+            checker.notifier = WebhookNotifier(webhook_url, debug)
+        sink = make_sink(self.export_combo.currentText(), "roblox")
+        if sink:
+            checker.sinks.append(sink)
+        self.jobs.add(checker, total)
+        return True
 
     def stop_clicked(self):
-        if self.thread:
-            self.thread.stop()
-            self.thread.quit()
-            self.thread.wait(2000)
+        self.jobs.stop_all()
         self.checking_finished()
 
+    def job_started(self, job):
+        """A queued run is starting, the progress bar and live stats follow the newest one"""
+        if self.jobs_idle:
+            self.results.clear()
+            self.jobs_idle = False
+        self.thread = job.checker
+        self.thread.batch.connect(self.update_batch)
+        self.progress_bar.setMaximum(job.total)
+        self.progress_bar.setValue(0)
+        self.results.metrics.watch(self.thread)
+        self.stop_button.setEnabled(True)
+        self.queue_button.setEnabled(True)
+        self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
+
     def checking_finished(self):
-        self.start_button.setEnabled(True)
+        self.jobs_idle = True
+        self.resume_button.setEnabled(True)
         self.stop_button.setEnabled(False)
+        self.queue_button.setEnabled(False)
         
         if self.thread and len(self.thread.created_accounts) > 0:
             self.status_label.setText(f"✅ Complete! Created {len(self.thread.created_accounts)} accounts")
@@ -715,17 +792,41 @@ class App(QMainWindow):
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
 
     def update_text(self, text):
-        self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
+        self.results.log(text)
+
+    def update_batch(self, rows, lines, progress):
+        self.results.add_rows(rows)
+        self.results.log_lines(lines)
+        if progress >= 0 and self.sender() is self.thread:
+            self.update_progress(progress)
 
     def update_progress(self, value):
         self.progress_bar.setValue(value)
         total = self.progress_bar.maximum()
+        if total == 0:
+            # Open-ended run (variant search) - no known total
+            self.status_label.setText(f"🔄 Checked: {value}")
+            return
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"🔄 Progress: {value}/{total} ({percent}%)")
 
+    def queue_more_clicked(self):
+        names = self.get_usernames()
+        if not names or not self.thread or not self.thread.isRunning():
+            return
+        
+        self.thread.add_candidates(names)
+        if self.progress_bar.maximum() > 0:
+            self.progress_bar.setMaximum(self.progress_bar.maximum() + len(names))
+        self.input_text.clear()
+        self.update_text(f"➕ Queued {len(names)} more usernames")
+
+    def get_stop_after(self):
+        try:
+            return max(0, int(self.stop_after_input.text()))
+        except:
+            return 0
+
     def get_usernames(self):
         txt = self.input_text.toPlainText().strip()
         usernames = []
@@ -0,0 +1,118 @@
+import os, csv, json, time, itertools
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(HERE, "results")
+
+FIELDS = ("platform", "name", "verdict", "reason", "reason_text", "status", "latency_ms", "timestamp")
+
+def result_fields(result):
+    """Flat export row for a Result, in FIELDS order"""
+    return (result.platform, result.name, result.verdict.label, result.reason.name, result.reason_text(),
+            result.status, round(result.latency * 1000, 1), round(result.timestamp, 3))
+
+# ------------------- Result Sinks ------------------- #
+class Sink:
+    """Writes results to a file as they come in, nothing is kept in memory.
+
+    open()/close() are called by the checker thread at the start and end of a
+    run, write() for every result.
+    """
+    extension = ""
+
+    def __init__(self, path):
+        self.path = path
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def write(self, result):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class JsonlSink(Sink):
+    extension = "jsonl"
+    BUFFER = 1 << 20  # Bytes buffered before hitting the disk
+
+    def open(self):
+        super().open()
+        self.file = open(self.path, "a", encoding="utf-8", buffering=self.BUFFER)
+
+    def write(self, result):
+        self.file.write(json.dumps(dict(zip(FIELDS, result_fields(result))), ensure_ascii=False) + "\n")
+
+    def close(self):
+        self.file.close()
+
+class CsvSink(Sink):
+    extension = "csv"
+    BUFFER = 1 << 20
+
+    def open(self):
+        super().open()
+        new = not os.path.exists(self.path)
+        self.file = open(self.path, "a", encoding="utf-8", newline="", buffering=self.BUFFER)
+        self.writer = csv.writer(self.file)
+        if new:
+            self.writer.writerow(FIELDS)
+
+    def write(self, result):
+        self.writer.writerow(result_fields(result))
+
+    def close(self):
+        self.file.close()
+
+class ParquetSink(Sink):
+    """Columnar output for analytics, needs pyarrow (pip install pyarrow)"""
+    extension = "parquet"
+    ROW_GROUP = 50000  # Rows held before a row group is written out
+
+    def open(self):
+        super().open()
+        self.schema = pa.schema([
+            ("platform", pa.string()), ("name", pa.string()), ("verdict", pa.string()),
+            ("reason", pa.string()), ("reason_text", pa.string()), ("status", pa.int16()),
+            ("latency_ms", pa.float32()), ("timestamp", pa.float64()),
+        ])
+        self.writer = pq.ParquetWriter(self.path, self.schema)
+        self.rows = []
+
+    def write(self, result):
+        self.rows.append(result_fields(result))
+        if len(self.rows) >= self.ROW_GROUP:
+            self.write_group()
+
+    def write_group(self):
+        if not self.rows:
+            return
+        columns = [list(column) for column in zip(*self.rows)]
+        self.writer.write_table(pa.Table.from_arrays(columns, schema=self.schema))
+        self.rows = []
+
+    def close(self):
+        self.write_group()
+        self.writer.close()
+
+SINKS = {"JSONL": JsonlSink, "CSV": CsvSink}
+if PARQUET_AVAILABLE:
+    SINKS["Parquet"] = ParquetSink
+
+_sink_ids = itertools.count(1)
+
+def make_sink(kind, platform):
+    """Sink writing to results/<platform>_<date>.<ext>, or None for "Off" """
+    sink_class = SINKS.get(kind)
+    if not sink_class:
+        return None
+    now = time.time()
+    # Queued runs are often made in the same second, the ms and a per-process number keep them apart
+    stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now)) + f"_{int(now * 1000) % 1000:03d}_{next(_sink_ids)}"
+    return sink_class(os.path.join(RESULTS_DIR, f"{platform}_{stamp}.{sink_class.extension}"))
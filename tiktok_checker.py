@@ -2,389 +2,372 @@ import sys, aiohttp, asyncio, random, string, re, json
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import QFont
+from name_generator import get_model, iter_variants, score_name, VALIDATORS
+from checker_engine import BaseChecker, CandidateQueue, engine_service
+from results_view import ResultsView
+from job_queue import JobQueue
+from records import Verdict, Reason
+from classify_cache import ClassifierCache
+from journal import Journal
+from sinks import SINKS, make_sink
+from notifier import WebhookNotifier, send_test
 
-# ------------------- Checker Thread ------------------- #
-class Checker(QThread):
-    update = pyqtSignal(str)
-    pupdate = pyqtSignal(int)
-    count = 0
+# ------------------- Page Classifier ------------------- #
+def classify_page(username, status, final_url, body, log=None):
+    """(verdict, reason, detail) for a fetched profile page. No network, no state,
+    so it can be benchmarked and re-run on saved pages. `log` gets the [DEBUG] lines.
+
+    Scans past an anchor are capped ({0,500} instead of *) so an oversized or
+    hostile page costs time in proportion to its size, bench/regex_stress.py checks it.
+    """
+    body_lower = body.lower()
+    name = re.escape(username)
+
+    # ===== CLEAR SIGNALS =====
+
+    # 1. Rate limited, or the site itself is having trouble (both get retried)
+    if status == 429:
+        return Verdict.RATE_LIMIT, Reason.SLOW_DOWN, None
+    if status >= 500:
+        return Verdict.CONNECTION_ERROR, Reason.SERVER_ERROR, None
+
+    # 2. Blocked or forbidden
+    if status in [403]:
+        return Verdict.BLOCKED, Reason.BLOCKED_IP, None
+
+    # 3. Check if redirected (TikTok redirects invalid usernames)
+    final_url = final_url.lower()
+    if username.lower() not in final_url:
+        if log:
+            log(f"[DEBUG] Redirected away from username - likely available")
+        return Verdict.AVAILABLE, Reason.REDIRECTED, None
+
+    # ===== ANALYZE BODY CONTENT =====
+
+    # Check for explicit "not found" signals - but DON'T trust them yet
+    not_found_signals = [
+        "couldn't find this account",
+        "user not found",
+        "page not found",
+        "this account cannot be found",
+        '"statusCode":10202',  # TikTok error code for user not found
+        '"statusCode":10221',  # Another not found code
+    ]
+
+    found_not_found = False
+    for signal in not_found_signals:
+        if signal.lower() in body_lower:
+            if log:
+                log(f"[DEBUG] Found NOT FOUND signal: {signal}")
+            found_not_found = True
+            break
+
+    # DON'T return yet - check for other signals first
+    # TikTok shows "couldn't find" for private/banned accounts too!
+
+    # Check for profile existence signals
+    profile_signals = {
+        'has_user_id': False,
+        'has_follower_count': False,
+        'has_following_count': False,
+        'has_video_count': False,
+        'has_verified_badge': False,
+        'has_signature': False,
+        'has_avatar': False,
+        'has_username_in_data': False,
+        'has_seo_data': False,
+        'has_private_account': False
+    }
+
+    # Look for user ID in TikTok's data structure
+    user_id_patterns = [
+        r'"id"[:\s]*"(\d{10,})"',
+        r'"userId"[:\s]*"(\d{10,})"',
+        r'"uid"[:\s]*"(\d{10,})"',
+        r'"uniqueId"[:\s]*"' + name + r'"[^}]{0,500}"id"[:\s]*"(\d{10,})"'
+    ]
+
+    for pattern in user_id_patterns:
+        user_id_match = re.search(pattern, body, re.IGNORECASE)
+        if user_id_match:
+            profile_signals['has_user_id'] = True
+            if log:
+                try:
+                    user_id = user_id_match.group(1)
+                    log(f"[DEBUG] ✓ Found user ID: {user_id}")
+                except:
+                    log(f"[DEBUG] ✓ Found user ID pattern")
+            break
+
+    # Check for username in data (strong signal)
+    if re.search(rf'"uniqueId"[:\s]*"{name}"', body, re.IGNORECASE):
+        profile_signals['has_username_in_data'] = True
+        if log:
+            log(f"[DEBUG] ✓ Username '{username}' found in user data")
+
+    # Follower count
+    follower_patterns = [
+        r'"followerCount"[:\s]*(\d+)',
+        r'"fans"[:\s]*(\d+)',
+        r'data-e2e="followers-count"[^>]{0,300}>([0-9.KMB]{1,20})</strong>'
+    ]
+    for pattern in follower_patterns:
+        if re.search(pattern, body):
+            profile_signals['has_follower_count'] = True
+            if log:
+                match = re.search(pattern, body)
+                log(f"[DEBUG] ✓ Found follower count: {match.group(1)}")
+            break
+
+    # Following count
+    following_patterns = [
+        r'"followingCount"[:\s]*(\d+)',
+        r'"following"[:\s]*(\d+)',
+    ]
+    for pattern in following_patterns:
+        if re.search(pattern, body):
+            profile_signals['has_following_count'] = True
+            if log:
+                log(f"[DEBUG] ✓ Found following count")
+            break
+
+    # Video count
+    video_patterns = [
+        r'"videoCount"[:\s]*(\d+)',
+        r'"video"[:\s]*(\d+)',
+    ]
+    for pattern in video_patterns:
+        if re.search(pattern, body):
+            profile_signals['has_video_count'] = True
+            if log:
+                log(f"[DEBUG] ✓ Found video count")
+            break
+
+    # Verified badge
+    if re.search(r'"verified"[:\s]*true', body, re.IGNORECASE):
+        profile_signals['has_verified_badge'] = True
+        if log:
+            log(f"[DEBUG] ✓ Account is verified")
+
+    # Signature/bio
+    if re.search(r'"signature"[:\s]*"[^"]{1,1000}"', body):
+        profile_signals['has_signature'] = True
+        if log:
+            log(f"[DEBUG] ✓ Found signature/bio")
+
+    # Avatar URL
+    avatar_patterns = [
+        r'"avatarLarger"[:\s]*"https://[^"]{1,2000}"',
+        r'"avatarThumb"[:\s]*"https://[^"]{1,2000}"',
+    ]
+    for pattern in avatar_patterns:
+        if re.search(pattern, body):
+            profile_signals['has_avatar'] = True
+            if log:
+                log(f"[DEBUG] ✓ Found avatar URL")
+            break
+
+    # Check for SEO/meta data (TikTok includes this even for private accounts)
+    # (one tag at a time, nested unbounded [^>]* scans went polynomial on broken markup)
+    handle = f"@{username.lower()}"
+    for tag in re.findall(r'<meta[^>]{0,1000}>', body, re.IGNORECASE):
+        tag = tag.lower()
+        if 'property="og:url"' in tag:
+            content = re.search(r'content="([^"]*)"', tag)
+            if content and handle in content.group(1):
+                profile_signals['has_seo_data'] = True
+                if log:
+                    log(f"[DEBUG] ✓ Found OpenGraph data with username")
+                break
+
+    # Check page title for username (strong signal account exists)
+    title_match = re.search(r'<title>([^<]+)</title>', body, re.IGNORECASE)
+    if title_match:
+        title = title_match.group(1)
+        # If title contains the actual username (not just "TikTok"), account exists
+        if username.lower() in title.lower() and title.lower() != 'tiktok':
+            profile_signals['has_seo_data'] = True
+            if log:
+                log(f"[DEBUG] ✓ Username in title: {title}")
+
+    # Check for private account indicator - BUT BE CAREFUL
+    # TikTok shows "This account is private" for both:
+    # 1. Actually private accounts (with user data)
+    # 2. Non-existent usernames (no user data)
+    # So we need OTHER signals to confirm it's real
+    if 'private account' in body_lower or '"privateAccount":true' in body_lower or re.search(r'this account is private', body, re.IGNORECASE):
+        # Only mark as private if we have OTHER evidence the account exists
+        if profile_signals['has_user_id'] or profile_signals['has_username_in_data'] or profile_signals['has_follower_count']:
+            profile_signals['has_private_account'] = True
+            if log:
+                log(f"[DEBUG] ✓ Account is PRIVATE (exists but hidden)")
+        elif log:
+            log(f"[DEBUG] ✗ Shows 'private' text but NO user data (generic error message)")
+
+    # Count signals
+    signal_count = sum(profile_signals.values())
+
+    if log:
+        log(f"[DEBUG] Profile signals found: {signal_count}/10")
+        log(f"[DEBUG] Signals: {profile_signals}")
+        log(f"[DEBUG] 'Not found' message present: {found_not_found}")
+
+    # ===== DECISION LOGIC =====
+
+    # PRIORITY 1: Check for REAL user data (strongest signals)
+    # If we have user_id + username match + follower count = definitely TAKEN
+    if profile_signals['has_user_id'] and profile_signals['has_username_in_data'] and profile_signals['has_follower_count']:
+        kind = "private account" if profile_signals['has_private_account'] else "public account"
+        return Verdict.TAKEN, Reason.CONFIRMED_DATA, kind
+
+    # If account is explicitly private WITH user data, it's TAKEN
+    if profile_signals['has_private_account'] and (profile_signals['has_user_id'] or profile_signals['has_follower_count']):
+        return Verdict.TAKEN, Reason.PRIVATE, None
+
+    # If we have SEO data (title/meta tags) + other signals, account EXISTS
+    if profile_signals['has_seo_data'] and signal_count >= 2:
+        return Verdict.TAKEN, Reason.SEO_SIGNALS, None
 
+    # Strong evidence of real profile
+    if profile_signals['has_username_in_data'] and profile_signals['has_user_id']:
+        return Verdict.TAKEN, Reason.USER_ID_CONFIRMED, None
+
+    # Multiple strong signals (4+)
+    if signal_count >= 4:
+        return Verdict.TAKEN, Reason.STRONG_SIGNALS, signal_count
+
+    # Has engagement metrics (followers/following/videos)
+    engagement_signals = (
+        profile_signals['has_follower_count'] + 
+        profile_signals['has_following_count'] + 
+        profile_signals['has_video_count']
+    )
+    if engagement_signals >= 2:
+        return Verdict.TAKEN, Reason.ENGAGEMENT, None
+
+    # PRIORITY 2: Check "not found" signal
+    # Only trust it if we have NO real user data
+    if found_not_found and signal_count == 0:
+        return Verdict.AVAILABLE, Reason.NOT_FOUND_NO_DATA, None
+
+    # "Not found" but only has "private" flag without real data = AVAILABLE
+    if found_not_found and signal_count == 1 and profile_signals['has_private_account']:
+        return Verdict.AVAILABLE, Reason.GENERIC_ERROR_PAGE, None
+
+    # Found "not found" BUT has real signals = likely private/restricted
+    if found_not_found and signal_count > 1:
+        return Verdict.TAKEN, Reason.NOT_FOUND_BUT_SIGNALS, signal_count
+
+    # Check page title
+    title_match = re.search(r'<title>([^<]+)</title>', body, re.IGNORECASE)
+    if title_match:
+        title = title_match.group(1)
+        # Real profiles have username in title with @ or TikTok
+        if (f'@{username}' in title.lower() or username in title.lower()) and 'tiktok' in title.lower():
+            if signal_count >= 1:  # Even 1 signal + title = taken
+                if log:
+                    log(f"[DEBUG] ✓ Username confirmed in title: {title}")
+                return Verdict.TAKEN, Reason.TITLE_CONFIRMS, signal_count
+
+    # Low signal count = likely available
+    if signal_count <= 1:
+        return Verdict.AVAILABLE, Reason.NO_PROFILE_DATA, None
+
+    # 2-3 signals but no strong confirmation
+    if signal_count <= 3 and not profile_signals['has_username_in_data']:
+        return Verdict.AVAILABLE, Reason.PLACEHOLDER_ONLY, None
+
+    # Unclear - needs manual check
+    return Verdict.UNCLEAR, Reason.MANUAL_CHECK, signal_count
+
+def classify_rehydration(username, body):
+    """(verdict, reason, detail) from the page's __UNIVERSAL_DATA_FOR_REHYDRATION__ JSON, used for rechecks.
+    Parses the whole state blob instead of pattern matching, None if it isn't there or doesn't say.
+    """
+    start = body.find('id="__UNIVERSAL_DATA_FOR_REHYDRATION__"')
+    if start < 0:
+        return None
+    start = body.find(">", start) + 1
+    end = body.find("</script>", start)
+    if not start or end < 0:
+        return None
+    try:
+        data = json.loads(body[start:end])
+    except ValueError:
+        return None
+    detail = (data.get("__DEFAULT_SCOPE__") or {}).get("webapp.user-detail") if isinstance(data, dict) else None
+    if not isinstance(detail, dict):
+        return None
+    code = detail.get("statusCode")
+    user = (detail.get("userInfo") or {}).get("user") or {}
+    if code == 0 and str(user.get("uniqueId", "")).lower() == username.lower():
+        return Verdict.TAKEN, Reason.USER_FOUND, (user.get("id", ""), user.get("nickname", ""))
+    if code in (10202, 10221):  # User not found / banned
+        return Verdict.AVAILABLE, Reason.NOT_FOUND_SIGNAL, None
+    return None
+
+# ------------------- Checker Thread ------------------- #
+class Checker(BaseChecker):
+    platform = "tiktok"
     BASE_URL = "https://tiktok.com/@{}"
+    concurrency = 2  # Max 2 concurrent requests
+    delay = 2.5  # Delay to avoid rate limits
 
-    def __init__(self, usernames, user_agent, debug=False):
-        super().__init__()
-        self.usernames = usernames
+    def __init__(self, usernames, user_agent, debug=False, max_hits=0):
+        super().__init__(usernames, debug, max_hits)
         self.user_agent = user_agent
-        self.running = True
-        self.debug = debug
-        self.consecutive_errors = 0  # Track errors in a row
-        self.max_errors_before_pause = 3  # Pause after 3 errors in a row
-
-    def run(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(self.main())
-        finally:
-            loop.close()
-
-    def stop(self):
-        self.running = False
+        self.classify = ClassifierCache(classify_page, counters=self.counters)  # Template pages skip the analysis
 
     async def check_user(self, username, sem, session, lock, idx):
         if not self.running:
             return
 
         async with sem:
-            retries = 2  # Try up to 2 times
-            for attempt in range(retries):
-                try:
-                    url = self.BASE_URL.format(username)
-                    
-                    async with session.get(url, allow_redirects=True, timeout=20) as resp:
+            try:
+                url = self.BASE_URL.format(username)
+                
+                async with session.get(url, allow_redirects=True, timeout=20) as resp:
                     status = resp.status
-                    
+                
                     # Read the response
                     try:
                         body = await resp.text(errors='ignore')
-                        body_lower = body.lower()
                     except Exception as e:
-                        self.update.emit(f"⚠️ [ERROR] {username}: Could not read response")
+                        self.report(username, Verdict.ERROR, Reason.UNREADABLE, status=status)
                         return
-                    
+                
                     # Debug mode - show raw indicators
                     if self.debug:
-                        self.update.emit(f"\n{'='*60}")
-                        self.update.emit(f"[DEBUG] Checking: {username}")
-                        self.update.emit(f"[DEBUG] Status Code: {status}")
-                        self.update.emit(f"[DEBUG] Final URL: {resp.url}")
-                        self.update.emit(f"[DEBUG] Body Length: {len(body)} chars")
-                    
-                    # ===== CLEAR SIGNALS =====
-                    
-                    # 1. Rate limited
-                    if status == 429:
-                        self.update.emit(f"⚠️ [RATE LIMIT] {username}: Slow down!")
-                        await asyncio.sleep(10)
-                        return
-                    
-                    # 2. Blocked or forbidden
-                    if status in [403]:
-                        self.update.emit(f"⚠️ [BLOCKED] {username}: Status {status} - Try VPN or wait")
-                        return
-                    
-                    # 3. Check if redirected (TikTok redirects invalid usernames)
-                    final_url = str(resp.url).lower()
-                    if username.lower() not in final_url:
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] Redirected away from username - likely available")
-                        self.update.emit(f"✅ [AVAILABLE] {username} (redirected)")
-                        return
-                    
-                    # ===== ANALYZE BODY CONTENT =====
-                    
-                    # Check for explicit "not found" signals - but DON'T trust them yet
-                    not_found_signals = [
-                        "couldn't find this account",
-                        "user not found",
-                        "page not found",
-                        "this account cannot be found",
-                        '"statusCode":10202',  # TikTok error code for user not found
-                        '"statusCode":10221',  # Another not found code
-                    ]
-                    
-                    found_not_found = False
-                    for signal in not_found_signals:
-                        if signal.lower() in body_lower:
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] Found NOT FOUND signal: {signal}")
-                            found_not_found = True
-                            break
-                    
-                    # DON'T return yet - check for other signals first
-                    # TikTok shows "couldn't find" for private/banned accounts too!
-                    
-                    # Check for profile existence signals
-                    profile_signals = {
-                        'has_user_id': False,
-                        'has_follower_count': False,
-                        'has_following_count': False,
-                        'has_video_count': False,
-                        'has_verified_badge': False,
-                        'has_signature': False,
-                        'has_avatar': False,
-                        'has_username_in_data': False,
-                        'has_seo_data': False,
-                        'has_private_account': False
-                    }
-                    
-                    # Look for user ID in TikTok's data structure
-                    user_id_patterns = [
-                        r'"id"[:\s]*"(\d{10,})"',
-                        r'"userId"[:\s]*"(\d{10,})"',
-                        r'"uid"[:\s]*"(\d{10,})"',
-                        r'"uniqueId"[:\s]*"' + re.escape(username) + r'"[^}]*"id"[:\s]*"(\d{10,})"'
-                    ]
-                    
-                    for pattern in user_id_patterns:
-                        user_id_match = re.search(pattern, body, re.IGNORECASE)
-                        if user_id_match:
-                            profile_signals['has_user_id'] = True
-                            if self.debug:
-                                try:
-                                    user_id = user_id_match.group(1)
-                                    self.update.emit(f"[DEBUG] ✓ Found user ID: {user_id}")
-                                except:
-                                    self.update.emit(f"[DEBUG] ✓ Found user ID pattern")
-                            break
-                    
-                    # Check for username in data (strong signal)
-                    if re.search(rf'"uniqueId"[:\s]*"{username}"', body, re.IGNORECASE):
-                        profile_signals['has_username_in_data'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Username '{username}' found in user data")
-                    
-                    # Follower count
-                    follower_patterns = [
-                        r'"followerCount"[:\s]*(\d+)',
-                        r'"fans"[:\s]*(\d+)',
-                        r'<strong[^>]*data-e2e="followers-count"[^>]*>([0-9.KMB]+)</strong>'
-                    ]
-                    for pattern in follower_patterns:
-                        if re.search(pattern, body):
-                            profile_signals['has_follower_count'] = True
-                            if self.debug:
-                                match = re.search(pattern, body)
-                                self.update.emit(f"[DEBUG] ✓ Found follower count: {match.group(1)}")
-                            break
-                    
-                    # Following count
-                    following_patterns = [
-                        r'"followingCount"[:\s]*(\d+)',
-                        r'"following"[:\s]*(\d+)',
-                    ]
-                    for pattern in following_patterns:
-                        if re.search(pattern, body):
-                            profile_signals['has_following_count'] = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Found following count")
-                            break
-                    
-                    # Video count
-                    video_patterns = [
-                        r'"videoCount"[:\s]*(\d+)',
-                        r'"video"[:\s]*(\d+)',
-                    ]
-                    for pattern in video_patterns:
-                        if re.search(pattern, body):
-                            profile_signals['has_video_count'] = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Found video count")
-                            break
-                    
-                    # Verified badge
-                    if re.search(r'"verified"[:\s]*true', body, re.IGNORECASE):
-                        profile_signals['has_verified_badge'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Account is verified")
-                    
-                    # Signature/bio
-                    if re.search(r'"signature"[:\s]*"[^"]+"', body):
-                        profile_signals['has_signature'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Found signature/bio")
-                    
-                    # Avatar URL
-                    avatar_patterns = [
-                        r'"avatarLarger"[:\s]*"https://[^"]+"',
-                        r'"avatarThumb"[:\s]*"https://[^"]+"',
-                    ]
-                    for pattern in avatar_patterns:
-                        if re.search(pattern, body):
-                            profile_signals['has_avatar'] = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Found avatar URL")
-                            break
-                    
-                    # Check for SEO/meta data (TikTok includes this even for private accounts)
-                    if re.search(rf'<meta[^>]*property="og:url"[^>]*content="[^"]*@{username}[^"]*"', body, re.IGNORECASE):
-                        profile_signals['has_seo_data'] = True
-                        if self.debug:
-                            self.update.emit(f"[DEBUG] ✓ Found OpenGraph data with username")
-                    
-                    # Check page title for username (strong signal account exists)
-                    title_match = re.search(r'<title>([^<]+)</title>', body, re.IGNORECASE)
-                    if title_match:
-                        title = title_match.group(1)
-                        # If title contains the actual username (not just "TikTok"), account exists
-                        if username.lower() in title.lower() and title.lower() != 'tiktok':
-                            profile_signals['has_seo_data'] = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Username in title: {title}")
-                    
-                    # Check for private account indicator - BUT BE CAREFUL
-                    # TikTok shows "This account is private" for both:
-                    # 1. Actually private accounts (with user data)
-                    # 2. Non-existent usernames (no user data)
-                    # So we need OTHER signals to confirm it's real
-                    if 'private account' in body_lower or '"privateAccount":true' in body_lower or re.search(r'this account is private', body, re.IGNORECASE):
-                        # Only mark as private if we have OTHER evidence the account exists
-                        if profile_signals['has_user_id'] or profile_signals['has_username_in_data'] or profile_signals['has_follower_count']:
-                            profile_signals['has_private_account'] = True
-                            if self.debug:
-                                self.update.emit(f"[DEBUG] ✓ Account is PRIVATE (exists but hidden)")
-                        elif self.debug:
-                            self.update.emit(f"[DEBUG] ✗ Shows 'private' text but NO user data (generic error message)")
-                    
-                    # Count signals
-                    signal_count = sum(profile_signals.values())
-                    
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] Profile signals found: {signal_count}/10")
-                        self.update.emit(f"[DEBUG] Signals: {profile_signals}")
-                        self.update.emit(f"[DEBUG] 'Not found' message present: {found_not_found}")
-                    
-                    # ===== DECISION LOGIC =====
-                    
-                    # PRIORITY 1: Check for REAL user data (strongest signals)
-                    # If we have user_id + username match + follower count = definitely TAKEN
-                    if profile_signals['has_user_id'] and profile_signals['has_username_in_data'] and profile_signals['has_follower_count']:
-                        status = "private account" if profile_signals['has_private_account'] else "public account"
-                        self.update.emit(f"❌ [TAKEN] {username} ({status} with confirmed data)")
-                        return
-                    
-                    # If account is explicitly private WITH user data, it's TAKEN
-                    if profile_signals['has_private_account'] and (profile_signals['has_user_id'] or profile_signals['has_follower_count']):
-                        self.update.emit(f"❌ [TAKEN] {username} (private account - exists but hidden)")
-                        return
-                    
-                    # If we have SEO data (title/meta tags) + other signals, account EXISTS
-                    if profile_signals['has_seo_data'] and signal_count >= 2:
-                        self.update.emit(f"❌ [TAKEN] {username} (SEO data + profile signals)")
-                        return
-                    
-                    # Strong evidence of real profile
-                    if profile_signals['has_username_in_data'] and profile_signals['has_user_id']:
-                        self.update.emit(f"❌ [TAKEN] {username} (username + user_id confirmed)")
-                        return
-                    
-                    # Multiple strong signals (4+)
-                    if signal_count >= 4:
-                        self.update.emit(f"❌ [TAKEN] {username} ({signal_count} strong signals)")
-                        return
-                    
-                    # Has engagement metrics (followers/following/videos)
-                    engagement_signals = (
-                        profile_signals['has_follower_count'] + 
-                        profile_signals['has_following_count'] + 
-                        profile_signals['has_video_count']
-                    )
-                    if engagement_signals >= 2:
-                        self.update.emit(f"❌ [TAKEN] {username} (engagement data present)")
-                        return
-                    
-                    # PRIORITY 2: Check "not found" signal
-                    # Only trust it if we have NO real user data
-                    if found_not_found and signal_count == 0:
-                        self.update.emit(f"✅ [AVAILABLE] {username} (not found + no profile data)")
-                        return
-                    
-                    # "Not found" but only has "private" flag without real data = AVAILABLE
-                    if found_not_found and signal_count == 1 and profile_signals['has_private_account']:
-                        self.update.emit(f"✅ [AVAILABLE] {username} (generic error message, no real data)")
-                        return
-                    
-                    # Found "not found" BUT has real signals = likely private/restricted
-                    if found_not_found and signal_count > 1:
-                        self.update.emit(f"❌ [TAKEN] {username} (shows 'not found' but has {signal_count} real signals)")
-                        return
-                    
-                    # Check page title
-                    title_match = re.search(r'<title>([^<]+)</title>', body, re.IGNORECASE)
-                    if title_match:
-                        title = title_match.group(1)
-                        # Real profiles have username in title with @ or TikTok
-                        if (f'@{username}' in title.lower() or username in title.lower()) and 'tiktok' in title.lower():
-                            if signal_count >= 1:  # Even 1 signal + title = taken
-                                if self.debug:
-                                    self.update.emit(f"[DEBUG] ✓ Username confirmed in title: {title}")
-                                self.update.emit(f"❌ [TAKEN] {username} (title confirms + {signal_count} signals)")
-                                return
-                    
-                    # Low signal count = likely available
-                    if signal_count <= 1:
-                        self.update.emit(f"✅ [AVAILABLE] {username} (no real profile data)")
-                        return
-                    
-                    # 2-3 signals but no strong confirmation
-                    if signal_count <= 3 and not profile_signals['has_username_in_data']:
-                        self.update.emit(f"✅ [AVAILABLE] {username} (only placeholder data)")
-                        return
-                    
-                    # Unclear - needs manual check
-                    self.update.emit(f"❓ [UNCLEAR] {username} ({signal_count} signals - manual check recommended)")
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] URL for manual check: {url}")
-                    
-                    # Success - reset error counter
-                    self.consecutive_errors = 0
-                    break
-                    
+                        self.log(f"\n{'='*60}")
+                        self.log(f"[DEBUG] Checking: {username}")
+                        self.log(f"[DEBUG] Status Code: {status}")
+                        self.log(f"[DEBUG] Final URL: {resp.url}")
+                        self.log(f"[DEBUG] Body Length: {len(body)} chars")
+                
+                    answer = classify_rehydration(username, body) if self.thorough else None
+                    if answer is None:
+                        answer = self.classify(username, status, str(resp.url), body, self.log if self.debug else None)
+                    verdict, reason, detail = answer
+                    self.report(username, verdict, reason, detail, status=status)
+                    self.keep_page(username, status, str(resp.url), body, verdict, reason)
+                    if verdict == Verdict.RATE_LIMIT:
+                        self.back_off(10)
+                    if verdict == Verdict.UNCLEAR and self.debug:
+                        self.log(f"[DEBUG] URL for manual check: {url}")
+                
             except aiohttp.ClientConnectorError as e:
-                self.consecutive_errors += 1
-                if attempt < retries - 1:
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] Connection failed, retrying {username}...")
-                    await asyncio.sleep(3)
-                    continue
-                else:
-                    self.update.emit(f"⚠️ [CONNECTION ERROR] {username}: Cannot reach TikTok")
-                    await self.check_for_cooldown()
+                self.report(username, Verdict.CONNECTION_ERROR, Reason.UNREACHABLE, "TikTok")  # Retried by the engine
             except asyncio.TimeoutError:
-                self.consecutive_errors += 1
-                if attempt < retries - 1:
-                    if self.debug:
-                        self.update.emit(f"[DEBUG] Timeout, retrying {username}...")
-                    await asyncio.sleep(2)
-                    continue
-                else:
-                    self.update.emit(f"⏱️ [TIMEOUT] {username}")
-                    await self.check_for_cooldown()
+                self.report(username, Verdict.TIMEOUT)
             except Exception as e:
-                self.consecutive_errors += 1
                 error_msg = str(e)[:80]
                 # Check if it's a DNS/connection issue
                 if 'nodename nor servname' in error_msg or 'ssl' in error_msg.lower() or 'connect' in error_msg.lower():
-                    self.update.emit(f"⚠️ [CONNECTION ERROR] {username}: TikTok blocked or network issue")
-                    await self.check_for_cooldown()
+                    self.report(username, Verdict.CONNECTION_ERROR, Reason.NETWORK_BLOCKED, "TikTok")
                 else:
-                    self.update.emit(f"⚠️ [ERROR] {username}: {error_msg}")
-                break
-            finally:
-                async with lock:
-                    self.count += 1
-                self.pupdate.emit(self.count)
-
-    async def check_for_cooldown(self):
-        """Check if we need to pause due to consecutive errors"""
-        if self.consecutive_errors >= self.max_errors_before_pause:
-            cooldown_time = 15  # 15 seconds
-            self.update.emit(f"\n🛑 COOLDOWN: {self.consecutive_errors} errors in a row detected!")
-            self.update.emit(f"⏸️  Pausing for {cooldown_time} seconds to avoid being blocked...")
-            
-            for remaining in range(cooldown_time, 0, -1):
-                if not self.running:  # Allow user to stop during cooldown
-                    break
-                self.update.emit(f"⏳ Resuming in {remaining} seconds...")
-                await asyncio.sleep(1)
-            
-            self.update.emit(f"✅ Cooldown complete! Continuing...\n")
-            self.consecutive_errors = 0  # Reset counter after cooldown
-
-    async def main(self):
-        sem = asyncio.Semaphore(2)  # Max 2 concurrent requests
-        lock = asyncio.Lock()
+                    self.report(username, Verdict.ERROR, Reason.EXCEPTION, error_msg)
 
+    def create_session(self):
         headers = {
             "User-Agent": self.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -400,19 +383,16 @@ class Checker(QThread):
 
         # Use custom DNS resolver to avoid DNS issues
         connector = aiohttp.TCPConnector(
-            limit=2, 
+            limit=self.concurrency, 
             ssl=False,  # Disable SSL verification if needed
             family=0,  # Allow both IPv4 and IPv6
             ttl_dns_cache=300
         )
         timeout = aiohttp.ClientTimeout(total=30, connect=15)
-        
-        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
-            for i, username in enumerate(self.usernames):
-                if not self.running:
-                    break
-                await self.check_user(username, sem, session, lock, i)
-                await asyncio.sleep(2.5)  # Delay to avoid rate limits
+        return aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout, trace_configs=[self.trace_config])
+
+    def session_key(self):
+        return (self.user_agent, self.concurrency)
 
 # ------------------- GUI App ------------------- #
 class App(QMainWindow):
@@ -420,7 +400,8 @@ class App(QMainWindow):
         super().__init__()
         self.setWindowTitle("TikTok Username Checker")
         self.setGeometry(150, 150, 1100, 800)
-        self.thread = None
+        self.thread = None  # Checker the progress bar follows, the newest running one
+        self.jobs_idle = True
         self.initUI()
 
     def initUI(self):
@@ -493,7 +474,8 @@ class App(QMainWindow):
             "Numbers + Letters (12ab)",
             "Letters_Letters (abc_def)",
             "Prefix_Letters (og_abc)",
-            "Letters_Suffix (abc_og)"
+            "Letters_Suffix (abc_og)",
+            "Pronounceable (brelo)"
         ])
         self.pattern_combo.setMaximumWidth(200)
         row2.addWidget(self.pattern_combo)
@@ -510,9 +492,48 @@ class App(QMainWindow):
         row2.addStretch()
         gen_layout.addLayout(row2)
         
+        # Third row - closest available variants of a taken name
+        row3 = QHBoxLayout()
+        row3.addWidget(QLabel("Variants of:"))
+        self.variant_input = QLineEdit()
+        self.variant_input.setPlaceholderText("e.g., shadow")
+        self.variant_input.setMaximumWidth(150)
+        row3.addWidget(self.variant_input)
+        
+        row3.addWidget(QLabel("Find:"))
+        self.variant_count_input = QLineEdit("3")
+        self.variant_count_input.setMaximumWidth(60)
+        row3.addWidget(self.variant_count_input)
+        
+        self.variant_button = QPushButton("🔎 Find Closest Available")
+        self.variant_button.setToolTip("Check variants of the name, closest first, until this many are available")
+        self.variant_button.clicked.connect(self.variants_clicked)
+        self.variant_button.setStyleSheet("background-color: #00f2ea; color: black; padding: 8px; font-weight: bold;")
+        row3.addWidget(self.variant_button)
+        
+        row3.addStretch()
+        gen_layout.addLayout(row3)
+        
         gen_group.setLayout(gen_layout)
         main_layout.addWidget(gen_group)
 
+        # Webhook Section
+        webhook_group = QGroupBox("🔔 Discord Webhook (Optional)")
+        webhook_group.setStyleSheet("QGroupBox { font-weight: bold; }")
+        webhook_layout = QHBoxLayout()
+        
+        self.webhook_input = QLineEdit()
+        self.webhook_input.setPlaceholderText("https://discord.com/api/webhooks/... (get pinged when available names are found)")
+        webhook_layout.addWidget(self.webhook_input)
+        
+        test_webhook_btn = QPushButton("🧪 Test")
+        test_webhook_btn.setMaximumWidth(80)
+        test_webhook_btn.clicked.connect(self.test_webhook)
+        webhook_layout.addWidget(test_webhook_btn)
+        
+        webhook_group.setLayout(webhook_layout)
+        main_layout.addWidget(webhook_group)
+
         # Input/Output Section
         io_group = QGroupBox("Step 2: Check Usernames")
         io_group.setStyleSheet("QGroupBox { font-weight: bold; }")
@@ -532,39 +553,77 @@ class App(QMainWindow):
         output_box = QVBoxLayout()
         output_label = QLabel("📊 Results:")
         output_label.setStyleSheet("font-weight: bold;")
-        output_box.addWidget(output_label)
+        output_header = QHBoxLayout()
+        output_header.addWidget(output_label)
+        output_header.addStretch()
+        output_header.addWidget(QLabel("💾 Save to file:"))
+        self.export_combo = QComboBox()
+        self.export_combo.addItems(["Off"] + list(SINKS))
+        self.export_combo.setToolTip("Write every result to results/ as it comes in")
+        output_header.addWidget(self.export_combo)
+        output_box.addLayout(output_header)
         
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
-        self.output_text.setStyleSheet("background-color: #1a1a1a; color: #00f2ea; font-family: Consolas, Monaco, monospace; padding: 10px;")
-        output_box.addWidget(self.output_text)
+        self.results = ResultsView()
+        self.results.log_view.setStyleSheet("background-color: #1a1a1a; color: #00f2ea; font-family: Consolas, Monaco, monospace; padding: 10px;")
+        output_box.addWidget(self.results)
         
         io_layout.addLayout(input_box)
-        io_layout.addLayout(output_box)
+        io_layout.addLayout(output_box, 2)
         io_group.setLayout(io_layout)
         main_layout.addWidget(io_group)
 
         # Control Buttons
         btn_layout = QHBoxLayout()
         
+        btn_layout.addWidget(QLabel("Stop after:"))
+        self.stop_after_input = QLineEdit("0")
+        self.stop_after_input.setMaximumWidth(50)
+        self.stop_after_input.setToolTip("Stop the run once this many AVAILABLE names are found (0 = check everything)")
+        btn_layout.addWidget(self.stop_after_input)
+        btn_layout.addWidget(QLabel("available"))
+        
+        self.best_first_checkbox = QCheckBox("⭐ Best names first")
+        self.best_first_checkbox.setChecked(True)
+        self.best_first_checkbox.setToolTip("Check short, pronounceable, real-word names without digits before the rest")
+        btn_layout.addWidget(self.best_first_checkbox)
+        
         self.start_button = QPushButton("▶️ START CHECKING")
         self.start_button.clicked.connect(self.start_clicked)
         self.start_button.setStyleSheet("background-color: #00f2ea; color: black; font-weight: bold; padding: 15px; font-size: 14px;")
         btn_layout.addWidget(self.start_button)
         
+        self.resume_button = QPushButton("♻️ Resume")
+        self.resume_button.clicked.connect(self.resume_clicked)
+        self.resume_button.setToolTip("Continue the last run that was stopped or crashed, skipping names already checked")
+        self.resume_button.setStyleSheet("padding: 15px;")
+        btn_layout.addWidget(self.resume_button)
+        
         self.stop_button = QPushButton("⏹️ STOP")
         self.stop_button.clicked.connect(self.stop_clicked)
         self.stop_button.setEnabled(False)
         self.stop_button.setStyleSheet("background-color: #ff0050; color: white; font-weight: bold; padding: 15px; font-size: 14px;")
         btn_layout.addWidget(self.stop_button)
         
+        self.queue_button = QPushButton("➕ Queue More")
+        self.queue_button.clicked.connect(self.queue_more_clicked)
+        self.queue_button.setEnabled(False)
+        self.queue_button.setToolTip("Add the names in the input box to the running check")
+        self.queue_button.setStyleSheet("padding: 15px;")
+        btn_layout.addWidget(self.queue_button)
+        
         self.clear_button = QPushButton("🗑️ Clear Results")
-        self.clear_button.clicked.connect(lambda: self.output_text.clear())
+        self.clear_button.clicked.connect(self.results.clear)
         self.clear_button.setStyleSheet("padding: 15px;")
         btn_layout.addWidget(self.clear_button)
         
         main_layout.addLayout(btn_layout)
 
+        # Job Queue - START adds to it, runs start as soon as there's a free slot
+        self.jobs = JobQueue()
+        self.jobs.job_started.connect(self.job_started)
+        self.jobs.idle.connect(self.checking_finished)
+        main_layout.addWidget(self.jobs)
+
         # Progress Bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setStyleSheet("QProgressBar { text-align: center; height: 25px; } QProgressBar::chunk { background-color: #00f2ea; }")
@@ -592,6 +651,10 @@ class App(QMainWindow):
 
         generated = []
         
+        if pattern == "Pronounceable (brelo)":
+            # Sample the whole batch from the Markov model up front
+            pronounceable = iter(get_model().sample(count, length, prefix))
+        
         for _ in range(count):
             username = ""
             
@@ -637,8 +700,12 @@ class App(QMainWindow):
                     # Fallback if no suffix
                     username = "".join(random.choice(string.ascii_lowercase) for _ in range(length))
             
+            elif pattern == "Pronounceable (brelo)":
+                # Markov-sampled letters that read like a real word
+                username = next(pronounceable)
+            
             # Add prefix and suffix if provided (for non-pattern modes)
-            if pattern in ["Letters only (abc)", "Letters + Numbers (a1b2)", "Numbers + Letters (12ab)"]:
+            if pattern in ["Letters only (abc)", "Letters + Numbers (a1b2)", "Numbers + Letters (12ab)", "Pronounceable (brelo)"]:
                 username = prefix + username + suffix
             
             # Make sure it's valid (TikTok allows underscores and dots)
@@ -652,54 +719,156 @@ class App(QMainWindow):
         self.status_label.setText(f"✅ Generated {len(generated)} usernames")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
 
+    def test_webhook(self):
+        webhook_url = self.webhook_input.text().strip()
+        
+        if not webhook_url:
+            QMessageBox.warning(self, "No Webhook", "Please enter a webhook URL first!")
+            return
+        
+        try:
+            status = asyncio.run(send_test(webhook_url, "tiktok"))
+            
+            if status == 204:
+                QMessageBox.information(self, "Success", "✅ Webhook test successful!\nCheck your Discord channel.")
+            else:
+                QMessageBox.warning(self, "Failed", f"❌ Webhook test failed!\nStatus code: {status}")
+                
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"❌ Failed to send test message:\n{str(e)}")
+
     def start_clicked(self):
         usernames = self.get_usernames()
         if not usernames:
             QMessageBox.warning(self, "No Usernames", "Please enter or generate usernames to check!")
             return
         
+        max_hits = self.get_stop_after()
+        score = score_name if self.best_first_checkbox.isChecked() else None
+        queue = CandidateQueue(usernames, score)
+        journal = Journal.create("tiktok", names=usernames, max_hits=max_hits)
+        self.start_checking(queue, len(usernames), max_hits, journal)
+        self.status_label.setText(f"🔄 Checking {len(usernames)} usernames...")
+
+    def variants_clicked(self):
+        seed = self.variant_input.text().strip().lower().lstrip('@')
+        if not seed:
+            QMessageBox.warning(self, "No Name", "Enter the taken name to search variants of!")
+            return
+        
+        try:
+            wanted = max(1, int(self.variant_count_input.text()))
+        except:
+            wanted = 3
+        
+        # Variants are generated lazily, closest first, until enough are available
+        journal = Journal.create("tiktok", seed=seed, wanted=wanted)
+        self.start_checking(iter_variants(seed, VALIDATORS["tiktok"]), 0, max_hits=wanted, journal=journal)
+        self.status_label.setText(f"🔎 Searching variants of '{seed}' until {wanted} are available...")
+
+    def resume_clicked(self):
+        journal, state = Journal.resume("tiktok")
+        if not journal:
+            QMessageBox.information(self, "Nothing to Resume", "No unfinished run found!")
+            return
+        
+        if state.mode == "variants":
+            # Same variant order as before, minus what's already checked
+            variants = (v for v in iter_variants(state.seed, VALIDATORS["tiktok"]) if v not in state.done)
+            wanted = state.wanted - state.hits
+            if wanted <= 0:
+                QMessageBox.information(self, "Nothing to Resume", "That search already found enough names!")
+                return
+            if self.start_checking(variants, 0, wanted, journal):
+                self.status_label.setText(f"♻️ Resuming variants of '{state.seed}' ({state.hits} found, {len(state.done)} done)...")
+            return
+        
+        remaining = state.remaining()
+        max_hits = max(0, state.max_hits - state.hits) if state.max_hits else 0
+        score = score_name if self.best_first_checkbox.isChecked() else None
+        if self.start_checking(CandidateQueue(remaining, score), len(remaining), max_hits, journal):
+            self.status_label.setText(f"♻️ Resuming: {len(state.done)} already done, {len(remaining)} to go...")
+
+    def start_checking(self, usernames, total, max_hits=0, journal=None):
         ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         debug = self.debug_checkbox.isChecked()
         
-        self.progress_bar.setMaximum(len(usernames))
-        self.progress_bar.setValue(0)
-        self.output_text.clear()
-        self.start_button.setEnabled(False)
-        self.stop_button.setEnabled(True)
-        self.status_label.setText(f"🔄 Checking {len(usernames)} usernames...")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
 
-        self.thread = Checker(usernames, ua, debug)
-        self.thread.update.connect(self.update_text)
-        self.thread.pupdate.connect(self.update_progress)
-        self.thread.finished.connect(self.checking_finished)
-        self.thread.start()
+        checker = Checker(usernames, ua, debug, max_hits)
+        checker.journal = journal
+        checker.service = engine_service()  # Same loop and connections as the other runs
+        webhook_url = self.webhook_input.text().strip()
+        if webhook_url:
+            checker.notifier = WebhookNotifier(webhook_url, debug)
+        sink = make_sink(self.export_combo.currentText(), "tiktok")
+        if sink:
+            checker.sinks.append(sink)
+        self.jobs.add(checker, total)
+        return True
 
     def stop_clicked(self):
-        if self.thread:
-            self.thread.stop()
-            self.thread.quit()
-            self.thread.wait(2000)
+        self.jobs.stop_all()
         self.checking_finished()
 
+    def job_started(self, job):
+        """A queued run is starting, the progress bar and live stats follow the newest one"""
+        if self.jobs_idle:
+            self.results.clear()
+            self.jobs_idle = False
+        self.thread = job.checker
+        self.thread.batch.connect(self.update_batch)
+        self.progress_bar.setMaximum(job.total)
+        self.progress_bar.setValue(0)
+        self.results.metrics.watch(self.thread)
+        self.stop_button.setEnabled(True)
+        self.queue_button.setEnabled(True)
+        self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #fff9c4; border-radius: 3px;")
+
     def checking_finished(self):
-        self.start_button.setEnabled(True)
+        self.jobs_idle = True
+        self.resume_button.setEnabled(True)
         self.stop_button.setEnabled(False)
+        self.queue_button.setEnabled(False)
         self.status_label.setText("✅ Checking complete!")
         self.status_label.setStyleSheet("padding: 8px; font-weight: bold; background-color: #c8e6c9; border-radius: 3px;")
 
     def update_text(self, text):
-        self.output_text.append(text)
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.output_text.setTextCursor(cursor)
+        self.results.log(text)
+
+    def update_batch(self, rows, lines, progress):
+        self.results.add_rows(rows)
+        self.results.log_lines(lines)
+        if progress >= 0 and self.sender() is self.thread:
+            self.update_progress(progress)
 
     def update_progress(self, value):
         self.progress_bar.setValue(value)
         total = self.progress_bar.maximum()
+        if total == 0:
+            # Open-ended run (variant search) - no known total
+            self.status_label.setText(f"🔄 Checked: {value}")
+            return
         percent = int((value / total) * 100) if total > 0 else 0
         self.status_label.setText(f"🔄 Progress: {value}/{total} ({percent}%)")
 
+    def queue_more_clicked(self):
+        names = self.get_usernames()
+        if not names or not self.thread or not self.thread.isRunning():
+            return
+        
+        self.thread.add_candidates(names)
+        if self.progress_bar.maximum() > 0:
+            self.progress_bar.setMaximum(self.progress_bar.maximum() + len(names))
+        self.input_text.clear()
+        self.update_text(f"➕ Queued {len(names)} more usernames")
+
+    def get_stop_after(self):
+        try:
+            return max(0, int(self.stop_after_input.text()))
+        except:
+            return 0
+
     def get_usernames(self):
         txt = self.input_text.toPlainText().strip()
         usernames = []